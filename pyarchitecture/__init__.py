@@ -1,26 +1,165 @@
+import importlib
 import json
+import logging
 import sys
 import time
-from typing import Any, Dict, NoReturn
-
-from pyarchitecture import cpu, disks, gpu, memory
+from types import ModuleType
+from typing import Any, Callable, Dict, List, NoReturn, Set
 
 version = "0.3.1"
 
+LOGGER = logging.getLogger(__name__)
+
+# Pool classes are looked up in concurrent.futures on use, since the process pool imports multiprocessing
+EXECUTORS = dict(thread="ThreadPoolExecutor", process="ProcessPoolExecutor")
+
+# Submodules that are imported on first access, instead of when pyarchitecture is imported
+SUBMODULES = (
+    "aio",
+    "bench",
+    "cache",
+    "cgroup",
+    "config",
+    "cpu",
+    "daemon",
+    "disks",
+    "exporter",
+    "fleet",
+    "gpu",
+    "hotplug",
+    "memory",
+    "numa",
+    "processes",
+    "recorder",
+    "registry",
+    "runner",
+    "snapshot",
+    "squire",
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Imports the submodules on first access, so only the components in use are loaded.
+
+    Args:
+        name: Name of the attribute.
+
+    Returns:
+        ModuleType:
+        Returns the submodule.
+    """
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """Lists the module's attributes along with the lazily imported submodules."""
+    return sorted(set(globals()).union(SUBMODULES))
+
+
+# Submodule and function of each component's collector, in the order they are reported
+COLLECTORS = dict(
+    Disks=("disks", "get_all_disks"),
+    CPU=("cpu", "get_cpu_info"),
+    GPU=("gpu", "get_gpu_info"),
+    Memory=("memory", "get_memory_info"),
+)
+
+
+def _collectors(names: List[str] = None) -> Dict[str, Callable[[], Any]]:
+    """Get the collector function for each component in the order they are reported.
+
+    Args:
+        names: Components to get the collectors of, all of them when not set.
+
+    Returns:
+        Dict[str, Callable[[], Any]]:
+        Returns the collector function for each component, importing only the chosen components' submodules.
+    """
+    return {
+        name: getattr(importlib.import_module(f"{__name__}.{module}"), function)
+        for name, (module, function) in COLLECTORS.items()
+        if names is None or name in names
+    }
+
+
+def _collect_concurrently(executor: str, timeout: float | None) -> Dict[str, Any]:
+    """Fans out all the collectors over a pool and gathers whatever completes within the deadline.
 
-def all_components() -> Dict[str, Any]:
+    Args:
+        executor: Type of pool to use, either ``thread`` or ``process``.
+        timeout: Overall deadline in seconds, ``None`` to wait for all the collectors.
+
+    Returns:
+        Dict[str, Any]:
+        Returns a dictionary of all the components' information, with ``None`` for failed or timed out components.
+    """
+    import concurrent.futures
+
+    try:
+        pool_class = getattr(concurrent.futures, EXECUTORS[executor])
+    except KeyError:
+        raise ValueError(
+            f"executor must be one of {list(EXECUTORS)}, received {executor!r}"
+        )
+    collectors = _collectors()
+    pool = pool_class(max_workers=len(collectors))
+    futures = {name: pool.submit(func) for name, func in collectors.items()}
+    done, _ = concurrent.futures.wait(futures.values(), timeout=timeout)
+    # Don't wait for the stragglers, since the deadline is what the caller asked for
+    pool.shutdown(wait=False, cancel_futures=True)
+    return _gather_components(futures, done, timeout)
+
+
+def _gather_components(
+    futures: Dict[str, Any], done: Set[Any], timeout: float | None
+) -> Dict[str, Any]:
+    """Gathers the result of each component's future, reporting failed or timed out components as ``None``.
+
+    Args:
+        futures: Dictionary of component names and their futures.
+        done: Set of futures that completed within the deadline.
+        timeout: Overall deadline in seconds.
+
+    Returns:
+        Dict[str, Any]:
+        Returns a dictionary of all the components' information.
+    """
+    components = {}
+    for name, future in futures.items():
+        if future not in done:
+            LOGGER.error(f"{name} information was not collected within {timeout}s")
+            components[name] = None
+        elif error := future.exception():
+            LOGGER.error(f"Failed to collect {name} information: {error!r}")
+            components[name] = None
+        else:
+            components[name] = future.result()
+    return components
+
+
+def all_components(
+    concurrent: bool = False, executor: str = "thread", timeout: float = None
+) -> Dict[str, Any]:
     """Get all the architectural components of the system.
 
+    Args:
+        concurrent: Flag to collect all the components concurrently instead of one after another.
+        executor: Pool to use for concurrent collection, either ``thread`` or ``process``.
+        timeout: Overall deadline in seconds for concurrent collection, returns partial results when exceeded.
+
+    See Also:
+        - Concurrent collection captures the exception raised by each component and reports it as ``None``.
+        - Components that are still running when the ``timeout`` is reached are also reported as ``None``.
+
     Returns:
         Dict[str, Any]:
         Returns a dictionary of all the components' information.
     """
-    return {
-        "Disks": disks.get_all_disks(),
-        "CPU": cpu.get_cpu_info(),
-        "GPU": gpu.get_gpu_info(),
-        "Memory": memory.get_memory_info(),
-    }
+    if concurrent:
+        return _collect_concurrently(executor, timeout)
+    return {name: func() for name, func in _collectors().items()}
 
 
 def pprint(data: Any) -> NoReturn:
@@ -29,6 +168,119 @@ def pprint(data: Any) -> NoReturn:
     sys.exit(0)
 
 
+def _option(flag: str, default: Any, cast: Callable[[str], Any] = str) -> Any:
+    """Get the value of a commandline option, exiting with an error when it is missing or invalid.
+
+    Args:
+        flag: Name of the option.
+        default: Default value when the option is not passed.
+        cast: Function to convert the value.
+
+    Returns:
+        Any:
+        Returns the value of the option.
+    """
+    if flag not in sys.argv:
+        return default
+    try:
+        return cast(sys.argv[sys.argv.index(flag) + 1])
+    except IndexError:
+        print(f"ERROR:\n\t{flag} argument requires a value")
+        sys.exit(1)
+    except ValueError:
+        print(f"ERROR:\n\t{flag} argument must be of type {cast.__name__}")
+        sys.exit(1)
+
+
+def benchmark(components: List[str], filename: str | None) -> NoReturn:
+    """Benchmarks the collectors, stores or prints the report, and exits with return code 1 on regressions.
+
+    Args:
+        components: Components to benchmark, defaults to all when empty.
+        filename: Filename to store the report.
+    """
+    from pyarchitecture import bench
+
+    report = bench.run(
+        components,
+        iterations=_option("--iterations", 20, int),
+        warmup=_option("--warmup", 3, int),
+    )
+    if filename:
+        with open(filename, "w") as json_file:
+            json.dump(report, json_file, indent=2)
+        print(f"Benchmark report has been stored in {filename!r}")
+    else:
+        print(json.dumps(report, indent=2))
+    if baseline := _option("--baseline", None):
+        regressions = bench.compare(
+            report, bench.load(baseline), _option("--threshold", 0.1, float)
+        )
+        if regressions:
+            print(f"ERROR:\n\tRegressions against {baseline!r}")
+            print(json.dumps(regressions, indent=2))
+            sys.exit(1)
+    sys.exit(0)
+
+
+def serve() -> NoReturn:
+    """Runs the daemon until interrupted, serving the components over a Unix domain socket and optionally HTTP."""
+    from pyarchitecture import daemon
+
+    try:
+        daemon.Daemon(interval=_option("--interval", 5.0, float)).serve(
+            socket_path=_option("--socket", daemon.SOCKET_PATH),
+            port=_option("--port", None, int),
+        )
+    except (RuntimeError, OSError) as error:
+        print(f"ERROR:\n\t{error}")
+        sys.exit(1)
+    sys.exit(0)
+
+
+def fleet_report(directory: str, filename: str | None) -> NoReturn:
+    """Aggregates a directory of saved snapshots, and prints or stores the summary tables.
+
+    Args:
+        directory: Directory with the snapshots stored by the ``save`` command.
+        filename: Filename to store the summary.
+    """
+    from pyarchitecture import fleet
+
+    summary = fleet.summarize(
+        fleet.aggregate(directory, processes=_option("--processes", None, int))
+    )
+    if filename:
+        with open(filename, "w") as json_file:
+            json.dump(summary, json_file, indent=2)
+        print(f"Fleet summary has been stored in {filename!r}")
+        sys.exit(0)
+    print(f"Hosts: {summary['hosts']}, unreadable files: {summary['errors']}")
+    for title, key in (
+        ("GPU models", "gpu_models"),
+        ("Disk sizes", "disk_sizes"),
+        ("Memory by CPU model", "memory_by_cpu"),
+    ):
+        print(f"\n{title}\n{fleet.format_table(summary[key])}")
+    sys.exit(0)
+
+
+def record() -> NoReturn:
+    """Records the memory information and disk stats into a segmented log, until interrupted."""
+    from pyarchitecture import recorder
+
+    with recorder.Recorder(
+        _option("--directory", "recording"),
+        max_bytes=_option("--max-bytes", recorder.MAX_BYTES, int),
+        max_age=_option("--max-age", recorder.MAX_AGE, float),
+    ) as instance:
+        instance.run(
+            interval=_option("--interval", 5.0, float),
+            count=_option("--count", None, int),
+        )
+    sys.exit(0)
+
+
 def commandline() -> None:
     """Starter function to invoke PyArchitecture via CLI commands.
 
@@ -40,6 +292,24 @@ def commandline() -> None:
         - ``gpu``: Prints the GPU information in the terminal.
         - ``save``: Saves the chosen information into a JSON file.
         - ``--filename``: Filename to store the information.
+        - ``--cached``: Serves CPU, GPU and disks from a boot and hardware scoped snapshot, only on Linux.
+        - ``serve``: Runs a daemon that serves a continuously refreshed snapshot over a Unix domain socket.
+        - ``--socket``: Path of the daemon's Unix domain socket.
+        - ``--interval``: Interval in seconds between the daemon's refreshes or samples, defaults to 5
+        - ``--port``: Port to also serve the snapshot over HTTP on localhost.
+        - ``fleet``: Aggregates a directory of saved snapshots into GPU, disk and memory summary tables.
+        - ``--processes``: Number of worker processes to aggregate the snapshots with.
+        - ``record``: Records the memory information and disk stats into a segmented log of compact samples.
+        - ``--directory``: Directory to store the recording's segments, defaults to ``recording``
+        - ``--count``: Number of samples to record, records until interrupted when not set.
+        - ``--max-bytes``: Size in bytes at which the recording's segment is rotated.
+        - ``--max-age``: Age in seconds at which the recording's segment is rotated.
+        - ``metrics``: Prints the metrics in the Prometheus text exposition format.
+        - ``bench``: Benchmarks the chosen collectors (all by default) and prints the latency report.
+        - ``--iterations``: Number of measured iterations for each collector in the benchmark.
+        - ``--warmup``: Number of warmup iterations for each collector in the benchmark.
+        - ``--baseline``: Benchmark report to compare against, exits with return code 1 on regressions.
+        - ``--threshold``: Allowed slowdown against the baseline as a fraction, defaults to 0.1
     """
     assert (
         sys.argv[0].lower().endswith("pyarchitecture")
@@ -53,6 +323,12 @@ def commandline() -> None:
     mem_info = "memory" in sys.argv
     all_info = "all" in sys.argv
     save_info = "save" in sys.argv
+    bench_info = "bench" in sys.argv
+    serve_info = "serve" in sys.argv
+    metrics_info = "metrics" in sys.argv
+    fleet_info = "fleet" in sys.argv
+    record_info = "record" in sys.argv
+    cached = "--cached" in sys.argv
 
     filename = None
     custom_filename = "--filename" in sys.argv
@@ -78,6 +354,24 @@ def commandline() -> None:
         "memory": "Prints the RAM/memory information in the terminal.",
         "save": "Saves the chosen information into a JSON file.",
         "--filename": "Filename to store the information.",
+        "--cached": "Serves CPU, GPU and disks from a boot-scoped snapshot (Linux only).",
+        "serve": "Runs a daemon that serves the snapshot over a Unix domain socket.",
+        "--socket": "Path of the daemon's Unix domain socket.",
+        "--interval": "Interval in seconds between the daemon's refreshes or samples.",
+        "--port": "Port to also serve the snapshot over HTTP on localhost.",
+        "fleet": "Aggregates a directory of saved snapshots into summary tables.",
+        "--processes": "Number of worker processes to aggregate the snapshots with.",
+        "record": "Records the memory information and disk stats into a segmented log.",
+        "--directory": "Directory to store the recording's segments.",
+        "--count": "Number of samples to record.",
+        "--max-bytes": "Size in bytes at which the recording's segment is rotated.",
+        "--max-age": "Age in seconds at which the recording's segment is rotated.",
+        "metrics": "Prints the metrics in the Prometheus text exposition format.",
+        "bench": "Benchmarks the chosen collectors and prints the latency report.",
+        "--iterations": "Number of measured iterations for each collector.",
+        "--warmup": "Number of warmup iterations for each collector.",
+        "--baseline": "Benchmark report to compare against.",
+        "--threshold": "Allowed slowdown against the baseline as a fraction.",
     }
     # weird way to increase spacing to keep all values monotonic
     _longest_key = len(max(options.keys()))
@@ -91,16 +385,59 @@ def commandline() -> None:
         print(f"PyArchitecture {version}")
         sys.exit(0)
 
+    if serve_info:
+        serve()
+
+    if record_info:
+        record()
+
+    if fleet_info:
+        fleet_report(_option("fleet", None), filename)
+
+    if metrics_info:
+        from pyarchitecture import exporter
+
+        # CPU usage is left out, since there is no previous sample to compare against in a single run
+        print(exporter.Exporter(cpu_usage=False).render(), end="")
+        sys.exit(0)
+
+    if bench_info:
+        benchmark(
+            [
+                component
+                for component, chosen in (
+                    ("disks", disk_info),
+                    ("cpu", cpu_info),
+                    ("gpu", gpu_info),
+                    ("memory", mem_info),
+                )
+                if chosen
+            ],
+            filename,
+        )
+
+    chosen = [
+        name
+        for name, flag in zip(COLLECTORS, (disk_info, cpu_info, gpu_info, mem_info))
+        if flag or all_info
+    ]
+    # Only the chosen components are imported, so printing the CPU doesn't load the disks, GPU and memory packages
+    collectors = _collectors(chosen)
+    if cached:
+        from pyarchitecture import snapshot
+
+        collectors = snapshot.collectors(collectors)
+
     if disk_info and not save_info:
-        pprint(disks.get_all_disks())
+        pprint(collectors["Disks"]())
     if cpu_info and not save_info:
-        pprint(cpu.get_cpu_info())
+        pprint(collectors["CPU"]())
     if gpu_info and not save_info:
-        pprint(gpu.get_gpu_info())
+        pprint(collectors["GPU"]())
     if mem_info and not save_info:
-        pprint(memory.get_memory_info())
+        pprint(collectors["Memory"]())
     if all_info and not save_info:
-        pprint(all_components())
+        pprint({name: func() for name, func in collectors.items()})
 
     if not any([disk_info, cpu_info, gpu_info, all_info]):
         save_info = False
@@ -108,17 +445,17 @@ def commandline() -> None:
     if save_info:
         filename = filename or f"PyArchitecture_{int(time.time())}.json"
         if all_info:
-            data = all_components()
+            data = {name: func() for name, func in collectors.items()}
         else:
             data = {}
             if cpu_info:
-                data["CPU"] = cpu.get_cpu_info()
+                data["CPU"] = collectors["CPU"]()
             if gpu_info:
-                data["GPU"] = gpu.get_gpu_info()
+                data["GPU"] = collectors["GPU"]()
             if disk_info:
-                data["Disks"] = disks.get_all_disks()
+                data["Disks"] = collectors["Disks"]()
             if mem_info:
-                data["Memory"] = memory.get_memory_info()
+                data["Memory"] = collectors["Memory"]()
 
         with open(filename, "w") as json_file:
             json.dump(data, json_file, indent=2)
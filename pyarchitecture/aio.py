@@ -0,0 +1,311 @@
+import asyncio
+import logging
+import os
+import subprocess
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+import pyarchitecture
+from pyarchitecture import cache, config, cpu, disks, gpu, memory, runner, squire
+from pyarchitecture.cpu import main as cpu_main
+from pyarchitecture.gpu import main as gpu_main
+
+LOGGER = logging.getLogger(__name__)
+
+
+async def _run(command: List[str], capture_stderr: bool = True) -> Tuple[str, str]:
+    """Run a command as an asyncio subprocess through the shared runner, without blocking the event loop.
+
+    Args:
+        command: Command to run as a list of arguments.
+        capture_stderr: Flag to return the standard error.
+
+    See Also:
+        - The runner applies the tool's timeout, the limit on concurrent child processes, single-flight calls,
+          the stats and the record and replay of outputs, like the synchronous getters.
+
+    Raises:
+        subprocess.TimeoutExpired:
+        When the command doesn't finish within the tool's timeout.
+
+    Returns:
+        Tuple[str, str]:
+        Returns the standard output and standard error of the command.
+    """
+    result = await runner.arun(command)
+    return result.stdout, result.stderr if capture_stderr else ""
+
+
+def _read_text(path: str | os.PathLike) -> str:
+    """Read the contents of a file."""
+    with open(path) as file:
+        return file.read()
+
+
+async def _read(path: str | os.PathLike) -> str:
+    """Read the contents of a file in a worker thread, without blocking the event loop."""
+    return await asyncio.to_thread(_read_text, path)
+
+
+async def _cached(
+    component: str,
+    library_path: str | os.PathLike,
+    collector: Callable[[str | os.PathLike], Awaitable[Any]],
+    loader: Callable[[str | os.PathLike], Any],
+) -> Any:
+    """Get the cached value for a component, or collect and cache it when missing or expired.
+
+    Args:
+        component: Name of the component.
+        library_path: Resolved library path for the component.
+        collector: Coroutine function to collect the component's information.
+        loader: Synchronous counterpart of the collector, used to refresh the cache.
+
+    Returns:
+        Any:
+        Returns the component's information.
+    """
+    if (value := cache.CACHE.get(component, library_path)) is not None:
+        return value
+    value = await collector(library_path)
+    cache.CACHE.put(component, library_path, value, loader)
+    return value
+
+
+async def _cpu_name(cpu_lib: str | os.PathLike) -> str:
+    """Get processor information for the host operating system."""
+    if config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+        return cpu_main.parse_linux((await _read(cpu_lib)).splitlines())
+    if config.OPERATING_SYSTEM == config.OperatingSystem.darwin:
+        stdout, _ = await _run(cpu_main.darwin_command(cpu_lib))
+        return cpu_main.parse_darwin(stdout)
+    stdout, _ = await _run(cpu_main.windows_command(cpu_lib))
+    return cpu_main.parse_windows(stdout)
+
+
+async def _get_cpu_info(library_path: str | os.PathLike) -> str:
+    """Get the CPU name using the resolved library path."""
+    if os.path.isfile(library_path):
+        try:
+            return await _cpu_name(library_path)
+        except Exception as error:
+            LOGGER.error(error)
+            return
+    LOGGER.error(f"CPU library {library_path!r} doesn't exist")
+
+
+async def get_cpu_info(cpu_lib: str | os.PathLike = None) -> str:
+    """Asynchronous counterpart of :func:`pyarchitecture.cpu.get_cpu_info`.
+
+    Args:
+        cpu_lib: Custom CPU library path.
+
+    Returns:
+        str:
+        Returns CPU name.
+    """
+    return await _cached(
+        "cpu", cpu._get_cpu_lib(cpu_lib), _get_cpu_info, cpu._get_cpu_info
+    )
+
+
+async def _gpu_names(gpu_lib: str | os.PathLike) -> List[Dict[str, str]]:
+    """Get list of GPU model and vendor information based on the operating system."""
+    if config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+        stdout, stderr = await _run(gpu_main.linux_command(gpu_lib))
+        parser = gpu_main.parse_linux
+    elif config.OPERATING_SYSTEM == config.OperatingSystem.darwin:
+        stdout, stderr = await _run(gpu_main.darwin_command(gpu_lib))
+        parser = gpu_main.parse_darwin
+    else:
+        stdout, stderr = await _run(
+            gpu_main.windows_command(gpu_lib), capture_stderr=False
+        )
+        parser = gpu_main.parse_windows
+    if stderr:
+        LOGGER.debug(stderr)
+        return
+    return parser(stdout)
+
+
+async def _get_gpu_info(library_path: str | os.PathLike) -> List[Dict[str, str]]:
+    """Get the GPU model and vendor information using the resolved library path."""
+    if config.OPERATING_SYSTEM == config.OperatingSystem.linux and os.path.isdir(
+        library_path
+    ):
+        from pyarchitecture.gpu import pci
+
+        return await asyncio.to_thread(pci.get_names, library_path)
+    if os.path.isfile(library_path):
+        try:
+            return await _gpu_names(library_path)
+        except (subprocess.SubprocessError, FileNotFoundError) as error:
+            LOGGER.debug(error)
+            return
+    LOGGER.error(f"GPU library {library_path!r} doesn't exist")
+
+
+async def get_gpu_info(gpu_lib: str | os.PathLike = None) -> List[Dict[str, str]]:
+    """Asynchronous counterpart of :func:`pyarchitecture.gpu.get_gpu_info`.
+
+    Args:
+        gpu_lib: Custom GPU library path.
+
+    Returns:
+        List[Dict[str, str]]:
+        Returns the GPU model and vendor information as a list of key-value pairs.
+    """
+    return await _cached(
+        "gpu", gpu._get_gpu_lib(gpu_lib), _get_gpu_info, gpu._get_gpu_info
+    )
+
+
+async def _drive_info(disk_lib: str | os.PathLike) -> List[Dict[str, str]]:
+    """Get disks attached to the host based on the operating system."""
+    backend = squire.import_backend(disks.__name__)
+    if config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+        stdout, _ = await _run(backend.drive_info_command(disk_lib))
+        return backend.parse_drive_info(stdout)
+    if config.OPERATING_SYSTEM == config.OperatingSystem.darwin:
+        (info_stdout, _), (list_stdout, _) = await asyncio.gather(
+            _run(backend.info_command(disk_lib)),
+            _run(backend.list_command(disk_lib)),
+        )
+        return backend.parse_drive_info(info_stdout, list_stdout)
+    (drives_stdout, _), (partitions_stdout, partitions_stderr) = await asyncio.gather(
+        _run(backend.drives_command(disk_lib)),
+        _run(backend.partitions_command(disk_lib)),
+    )
+    if partitions_stderr:
+        LOGGER.error(partitions_stderr)
+        partitions = []
+    else:
+        partitions = backend.parse_physical_disks_and_partitions(partitions_stdout)
+    return backend.merge_drive_info(
+        backend.parse_drives(drives_stdout),
+        backend.map_disk_usage(partitions),
+    )
+
+
+async def _get_all_disks(library_path: str | os.PathLike) -> List[Dict[str, str]]:
+    """Get all disks using the resolved library path."""
+    if config.OPERATING_SYSTEM == config.OperatingSystem.linux and os.path.isdir(
+        library_path
+    ):
+        return await asyncio.to_thread(
+            squire.import_backend(disks.__name__).sysfs_drive_info, library_path
+        )
+    if os.path.isfile(library_path):
+        try:
+            return await _drive_info(library_path)
+        except subprocess.TimeoutExpired as error:
+            LOGGER.error(error)
+            return
+    LOGGER.error(f"Disk library {library_path!r} doesn't exist")
+
+
+async def get_all_disks(
+    disk_lib: str | os.PathLike = None, usage: bool = False
+) -> List[Dict[str, str]]:
+    """Asynchronous counterpart of :func:`pyarchitecture.disks.get_all_disks`.
+
+    Args:
+        disk_lib: Custom disk library path.
+        usage: Flag to include the space and inode usage of each mountpoint.
+
+    Returns:
+        List[Dict[str, str]]:
+        Returns a list of disk information.
+    """
+    all_disks = await _cached(
+        "disks", disks._get_disk_lib(disk_lib), _get_all_disks, disks._get_all_disks
+    )
+    if not usage or all_disks is None:
+        return all_disks
+    return await asyncio.to_thread(disks._with_usage, all_disks)
+
+
+async def _sysctl_value(mem_lib: str | os.PathLike, key: str):
+    """Get the value of the key from sysctl."""
+    backend = squire.import_backend(memory.__name__)
+    stdout, _ = await _run(backend.sysctl_command(mem_lib, key))
+    return backend.parse_sysctl_value(stdout, key)
+
+
+async def _memory_info(mem_lib: str | os.PathLike) -> Dict[str, int]:
+    """Get memory information based on the operating system."""
+    backend = squire.import_backend(memory.__name__)
+    if config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+        return backend.parse_memory_info((await _read(mem_lib)).splitlines())
+    if config.OPERATING_SYSTEM == config.OperatingSystem.darwin:
+        values = await asyncio.gather(
+            *(_sysctl_value(mem_lib, key) for key in backend.SYSCTL_KEYS)
+        )
+        return backend.parse_memory_info(dict(zip(backend.SYSCTL_KEYS, values)))
+    return await asyncio.to_thread(backend.get_memory_info, mem_lib)
+
+
+async def get_memory_info(
+    mem_lib: str | os.PathLike = None,
+    humanize: bool = True,
+    full: bool = False,
+    effective: bool = False,
+) -> Dict[str, int | str]:
+    """Asynchronous counterpart of :func:`pyarchitecture.memory.get_memory_info`.
+
+    Args:
+        mem_lib: Custom memory library path.
+        humanize: Flag to return humanized memory info.
+        full: Flag to return every field reported by meminfo, only on Linux.
+        effective: Flag to bound the memory info by the limits of the process' cgroup, only on Linux.
+
+    Returns:
+        Dict[str, int]:
+        Returns the memory information as key-value pairs.
+    """
+    library_path = memory._get_mem_lib(mem_lib)
+    if not os.path.isfile(library_path):
+        LOGGER.error(f"Memory library {library_path!r} doesn't exist")
+        return
+    if full and config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+        record = squire.import_backend(memory.__name__).parse_full_memory_info(
+            (await _read(library_path)).splitlines()
+        )
+        return record.to_dict(humanize)
+    try:
+        raw_info = await _memory_info(library_path)
+    except subprocess.TimeoutExpired as error:
+        LOGGER.error(error)
+        return
+    if effective and config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+        from pyarchitecture import cgroup
+
+        if cgroup_info := await asyncio.to_thread(cgroup.get_cgroup):
+            raw_info = cgroup.effective_memory(raw_info, cgroup_info)
+    if humanize:
+        return {k: squire.size_converter(v) for k, v in raw_info.items()}
+    return raw_info
+
+
+async def all_components(timeout: float = None) -> Dict[str, Any]:
+    """Asynchronous counterpart of :func:`pyarchitecture.all_components`, collecting the components concurrently.
+
+    Args:
+        timeout: Overall deadline in seconds, returns partial results when exceeded.
+
+    See Also:
+        - Failed components, and the ones still running when the ``timeout`` is reached, are reported as ``None``.
+
+    Returns:
+        Dict[str, Any]:
+        Returns a dictionary of all the components' information.
+    """
+    tasks = {
+        "Disks": asyncio.create_task(get_all_disks()),
+        "CPU": asyncio.create_task(get_cpu_info()),
+        "GPU": asyncio.create_task(get_gpu_info()),
+        "Memory": asyncio.create_task(get_memory_info()),
+    }
+    done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    return pyarchitecture._gather_components(tasks, done, timeout)
@@ -0,0 +1,180 @@
+import json
+import logging
+import math
+import os
+import platform
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List
+
+from pyarchitecture import config, cpu, disks, gpu, memory, runner
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _collectors() -> Dict[str, Callable[[], Any]]:
+    """Get the uncached collector for each component, with the library path resolved upfront."""
+    disk_lib = disks._get_disk_lib(None)
+    cpu_lib = cpu._get_cpu_lib(None)
+    gpu_lib = gpu._get_gpu_lib(None)
+    return dict(
+        disks=lambda: disks._get_all_disks(disk_lib),
+        cpu=lambda: cpu._get_cpu_info(cpu_lib),
+        gpu=lambda: gpu._get_gpu_info(gpu_lib),
+        memory=lambda: memory.get_memory_info(humanize=False),
+    )
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    """Get the percentile from sorted samples, using the nearest-rank method.
+
+    Args:
+        samples: Sorted list of samples.
+        percent: Percentile to get, between 0 and 100.
+
+    Returns:
+        float:
+        Returns the sample at the given percentile.
+    """
+    if not samples:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(samples)))
+    return samples[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarizes the samples in milliseconds.
+
+    Args:
+        samples: List of durations in seconds.
+
+    Returns:
+        Dict[str, float]:
+        Returns the min, median, p95, p99 and max in milliseconds.
+    """
+    samples = sorted(samples)
+    return {
+        key: round(value * 1_000, 4)
+        for key, value in dict(
+            min=samples[0] if samples else 0.0,
+            median=percentile(samples, 50),
+            p95=percentile(samples, 95),
+            p99=percentile(samples, 99),
+            max=samples[-1] if samples else 0.0,
+        ).items()
+    }
+
+
+def measure(
+    collector: Callable[[], Any], iterations: int, warmup: int
+) -> Dict[str, Any]:
+    """Measures the wall time, spawn time, parse time and allocations of a collector.
+
+    Args:
+        collector: Function to benchmark.
+        iterations: Number of measured iterations.
+        warmup: Number of iterations to run before measuring.
+
+    Returns:
+        Dict[str, Any]:
+        Returns the summary of wall, spawn and parse times, along with the allocations.
+    """
+    for _ in range(warmup):
+        collector()
+    wall, spawn, parse = [], [], []
+    for _ in range(iterations):
+        durations = []
+        # Child processes are timed by the runner itself, so the split holds however it spawns them
+        with runner.timed(lambda tool, duration: durations.append(duration)):
+            start = time.perf_counter()
+            collector()
+            elapsed = time.perf_counter() - start
+        wall.append(elapsed)
+        spawn.append(sum(durations))
+        parse.append(max(0.0, elapsed - sum(durations)))
+    # Allocations are traced in a separate run, since tracing skews the timings
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        collector()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return dict(
+        wall=summarize(wall),
+        spawn=summarize(spawn),
+        parse=summarize(parse),
+        allocations=dict(peak_bytes=peak, retained_bytes=current),
+    )
+
+
+def run(
+    components: Iterable[str] = None, iterations: int = 20, warmup: int = 3
+) -> Dict[str, Any]:
+    """Benchmarks the collectors on the host system.
+
+    Args:
+        components: Components to benchmark - ``disks``, ``cpu``, ``gpu`` and ``memory``, defaults to all.
+        iterations: Number of measured iterations for each collector.
+        warmup: Number of iterations to run before measuring each collector.
+
+    Returns:
+        Dict[str, Any]:
+        Returns a machine-readable report with the host's details and the measurements for each component.
+    """
+    collectors = _collectors()
+    results = {}
+    for component in components or collectors:
+        LOGGER.info(f"Benchmarking {component} for {iterations} iterations")
+        results[component] = measure(collectors[component], iterations, warmup)
+    return dict(
+        host=dict(
+            system=config.OPERATING_SYSTEM,
+            machine=platform.machine(),
+            python=platform.python_version(),
+            cpus=os.cpu_count(),
+        ),
+        iterations=iterations,
+        warmup=warmup,
+        timestamp=int(time.time()),
+        results=results,
+    )
+
+
+def compare(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = 0.1,
+    metric: str = "median",
+) -> Dict[str, Dict[str, float]]:
+    """Compares a report against a stored baseline, to find the collectors that regressed.
+
+    Args:
+        report: Current benchmark report.
+        baseline: Baseline benchmark report.
+        threshold: Allowed slowdown as a fraction of the baseline, eg: ``0.1`` for 10%.
+        metric: Wall time metric to compare - ``min``, ``median``, ``p95``, ``p99`` or ``max``.
+
+    Returns:
+        Dict[str, Dict[str, float]]:
+        Returns the baseline, current value and change for each regressed component.
+    """
+    regressions = {}
+    for component, result in report["results"].items():
+        if component not in baseline.get("results", {}):
+            continue
+        previous = baseline["results"][component]["wall"][metric]
+        current = result["wall"][metric]
+        if previous and current > previous * (1 + threshold):
+            regressions[component] = dict(
+                baseline=previous,
+                current=current,
+                change=round((current - previous) / previous, 4),
+            )
+    return regressions
+
+
+def load(filename: str | os.PathLike) -> Dict[str, Any]:
+    """Loads a benchmark report from a JSON file."""
+    with open(filename) as file:
+        return json.load(file)
@@ -0,0 +1,195 @@
+import copy
+import logging
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+# Default time-to-live (in seconds) for each of the static components
+# Disks are refreshed more often than the rest, since mountpoints can change at runtime
+TTL = dict(cpu=math.inf, gpu=3_600.0, disks=60.0)
+
+
+class Cache:
+    """Time-bound cache for the hardware facts that rarely change during a process's lifetime.
+
+    >>> Cache
+
+    Entries are keyed on the component name and the resolved library path.
+    Values are copied in and out, so a caller mutating its result never corrupts the one served to the others.
+    """
+
+    def __init__(self, ttl: Dict[str, float] = None):
+        self.ttl = {**TTL, **(ttl or {})}
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self._entries: Dict[Tuple[str, str], Tuple[float, Any, Callable]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, component: str, library_path: str | os.PathLike) -> Any:
+        """Get the cached value for a component, counting the lookup as a hit or a miss.
+
+        Args:
+            component: Name of the component.
+            library_path: Resolved library path for the component.
+
+        Returns:
+            Any:
+            Returns a copy of the cached information, or ``None`` when missing or expired.
+        """
+        key = (component, os.fspath(library_path))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.hits[component] += 1
+                value = entry[1]
+            else:
+                self.misses[component] += 1
+                return
+        return copy.deepcopy(value)
+
+    def put(
+        self,
+        component: str,
+        library_path: str | os.PathLike,
+        value: Any,
+        loader: Callable[[str | os.PathLike], Any],
+    ) -> None:
+        """Store the value for a component, along with the loader to refresh it.
+
+        Args:
+            component: Name of the component.
+            library_path: Resolved library path for the component.
+            value: Component's information.
+            loader: Function to collect the component's information from the library path.
+        """
+        ttl = self.ttl.get(component, 0)
+        # Failed lookups are returned as None, which should be retried in the next call
+        if value is not None and ttl > 0:
+            key = (component, os.fspath(library_path))
+            value = copy.deepcopy(value)
+            with self._lock:
+                self._entries[key] = (time.monotonic() + ttl, value, loader)
+
+    def fetch(
+        self,
+        component: str,
+        library_path: str | os.PathLike,
+        loader: Callable[[str | os.PathLike], Any],
+    ) -> Any:
+        """Get the cached value for a component, or load and cache it when missing or expired.
+
+        Args:
+            component: Name of the component.
+            library_path: Resolved library path for the component.
+            loader: Function to collect the component's information from the library path.
+
+        Returns:
+            Any:
+            Returns the component's information.
+        """
+        if (value := self.get(component, library_path)) is not None:
+            return value
+        value = loader(library_path)
+        self.put(component, library_path, value, loader)
+        return value
+
+    def invalidate(self, component: str = None) -> None:
+        """Drop the cached entries for a component, or for all components when none is specified.
+
+        Args:
+            component: Name of the component.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if component is None or key[0] == component:
+                    del self._entries[key]
+
+    def refresh(self, component: str = None) -> None:
+        """Re-collect the cached entries for a component, or for all components when none is specified.
+
+        Args:
+            component: Name of the component.
+        """
+        with self._lock:
+            entries = [
+                (key, entry[2])
+                for key, entry in self._entries.items()
+                if component is None or key[0] == component
+            ]
+        for (component_, library_path), loader in entries:
+            LOGGER.debug(f"Refreshing {component_} information from {library_path!r}")
+            self.put(component_, library_path, loader(library_path), loader)
+
+    def set_ttl(self, component: str, ttl: float) -> None:
+        """Set the time-to-live for a component, ``0`` disables caching for it.
+
+        Args:
+            component: Name of the component.
+            ttl: Time-to-live in seconds.
+        """
+        self.ttl[component] = ttl
+        self.invalidate(component)
+
+    def stats(self) -> Dict[str, Dict[str, int | float]]:
+        """Get the cache statistics for each component.
+
+        Returns:
+            Dict[str, Dict[str, int | float]]:
+            Returns the hits, misses, number of entries and TTL for each component.
+        """
+        with self._lock:
+            return {
+                component: dict(
+                    hits=self.hits[component],
+                    misses=self.misses[component],
+                    entries=sum(key[0] == component for key in self._entries),
+                    ttl=ttl,
+                )
+                for component, ttl in self.ttl.items()
+            }
+
+
+CACHE = Cache()
+
+
+def invalidate(component: str = None) -> None:
+    """Drop the cached entries for a component, or for all components when none is specified.
+
+    Args:
+        component: Name of the component - ``cpu``, ``gpu`` or ``disks``.
+    """
+    CACHE.invalidate(component)
+
+
+def refresh(component: str = None) -> None:
+    """Re-collect the cached entries for a component, or for all components when none is specified.
+
+    Args:
+        component: Name of the component - ``cpu``, ``gpu`` or ``disks``.
+    """
+    CACHE.refresh(component)
+
+
+def set_ttl(component: str, ttl: float) -> None:
+    """Set the time-to-live for a component, ``0`` disables caching for it.
+
+    Args:
+        component: Name of the component - ``cpu``, ``gpu`` or ``disks``.
+        ttl: Time-to-live in seconds.
+    """
+    CACHE.set_ttl(component, ttl)
+
+
+def stats() -> Dict[str, Dict[str, int | float]]:
+    """Get the cache statistics for each component.
+
+    Returns:
+        Dict[str, Dict[str, int | float]]:
+        Returns the hits, misses, number of entries and TTL for each component.
+    """
+    return CACHE.stats()
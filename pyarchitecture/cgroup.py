@@ -0,0 +1,202 @@
+import logging
+import os
+from typing import Any, Dict, Set
+
+LOGGER = logging.getLogger(__name__)
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+PROC_CGROUP = "/proc/self/cgroup"
+# Fields of cpu.stat that account for the time spent throttled by the CPU quota
+THROTTLING = ("nr_periods", "nr_throttled", "throttled_usec")
+# Controllers whose limits are reported, and bound the effective memory and CPU count
+CONTROLLERS = ("memory", "cpu")
+# Cgroups already warned about, so the warning isn't repeated on every call
+_WARNED: Set[str] = set()
+
+
+def _read(path: str) -> str | None:
+    """Reads a cgroup interface file, ``None`` when the controller is not enabled for the cgroup."""
+    try:
+        with open(path) as file:
+            return file.read().strip()
+    except OSError:
+        return
+
+
+def _limit(text: str | None) -> int | None:
+    """Parses a limit in bytes, ``None`` when unlimited."""
+    if text is None or text == "max":
+        return
+    return int(text)
+
+
+def _keyed(text: str | None) -> Dict[str, int]:
+    """Parses a flat keyed file like ``memory.stat`` or ``cpu.stat``."""
+    values = {}
+    for line in (text or "").splitlines():
+        key, _, number = line.partition(" ")
+        values[key] = int(number)
+    return values
+
+
+def _cpu_limit(text: str | None) -> float | None:
+    """Parses ``cpu.max`` into the number of CPUs the quota allows, ``None`` when unlimited."""
+    if not text:
+        return
+    quota, _, period = text.partition(" ")
+    if quota == "max":
+        return
+    return int(quota) / int(period or 100_000)
+
+
+def _lowest(
+    current: int | float | None, value: int | float | None
+) -> int | float | None:
+    """Get the lower of two limits, where ``None`` is unlimited."""
+    if current is None or value is None:
+        return value if current is None else current
+    return min(current, value)
+
+
+def unified_root(root: str | os.PathLike = CGROUP_ROOT) -> str | None:
+    """Get the mountpoint of the cgroup v2 hierarchy, ``None`` when it is not mounted.
+
+    Args:
+        root: Mountpoint of the cgroup filesystem.
+    """
+    for path in (os.fspath(root), os.path.join(root, "unified")):
+        # Hybrid hierarchies mount cgroup v2 under unified, alongside the v1 controllers
+        if os.path.isfile(os.path.join(path, "cgroup.controllers")):
+            return path
+
+
+def resolve(
+    root: str | os.PathLike = CGROUP_ROOT, proc_cgroup: str | os.PathLike = PROC_CGROUP
+) -> str | None:
+    """Resolves the directory of the calling process' cgroup v2.
+
+    Args:
+        root: Mountpoint of the cgroup filesystem.
+        proc_cgroup: Path of the process' cgroup file.
+
+    Returns:
+        str:
+        Returns the path of the cgroup directory, ``None`` when cgroup v2 is not mounted.
+    """
+    if (root := unified_root(root)) is None:
+        return
+    relative = "/"
+    for line in (_read(proc_cgroup) or "").splitlines():
+        # The unified hierarchy is the one with ID 0 and no controllers listed
+        if line.startswith("0::"):
+            relative = line[3:]
+    path = os.path.normpath(os.path.join(root, relative.lstrip("/")))
+    # Containers without a cgroup namespace see the host's path, while their own cgroup is mounted as the root
+    return path if os.path.isdir(path) else root
+
+
+def get_cgroup(
+    root: str | os.PathLike = CGROUP_ROOT, proc_cgroup: str | os.PathLike = PROC_CGROUP
+) -> Dict[str, Any] | None:
+    """Get the memory and CPU limits of the calling process' cgroup v2, along with its usage and throttling.
+
+    Args:
+        root: Mountpoint of the cgroup filesystem.
+        proc_cgroup: Path of the process' cgroup file.
+
+    See Also:
+        - Limits are the lowest ones set on the cgroup or any of its ancestors, ``None`` when unlimited.
+        - A warning is logged when the memory or cpu controller is not enabled on cgroup v2 (eg: on hybrid hosts),
+          since its limits then read as unlimited.
+
+    Returns:
+        Dict[str, Any]:
+        Returns the cgroup's path and controllers along with its memory and cpu information,
+        ``None`` when cgroup v2 is not mounted.
+    """
+    if (path := resolve(root, proc_cgroup)) is None:
+        return
+    unified = unified_root(root)
+    # Controllers available to the cgroup, falling back on the root's when its own file can't be read
+    controllers = (
+        _read(os.path.join(path, "cgroup.controllers"))
+        or _read(os.path.join(unified, "cgroup.controllers"))
+        or ""
+    ).split()
+    missing = [
+        controller for controller in CONTROLLERS if controller not in controllers
+    ]
+    if missing and path not in _WARNED:
+        _WARNED.add(path)
+        # Hybrid hosts keep these controllers on cgroup v1, where the limits are not read from
+        LOGGER.warning(
+            f"cgroup v2 {path!r} has no {' or '.join(missing)} controller, "
+            "so its limits are unknown and the effective values fall back to the host's totals"
+        )
+    memory_max = swap_max = cpus = None
+    directory = path
+    # Limits of the ancestors apply to all their descendants, so the lowest one is effective
+    while True:
+        memory_max = _lowest(
+            memory_max, _limit(_read(os.path.join(directory, "memory.max")))
+        )
+        swap_max = _lowest(
+            swap_max, _limit(_read(os.path.join(directory, "memory.swap.max")))
+        )
+        cpus = _lowest(cpus, _cpu_limit(_read(os.path.join(directory, "cpu.max"))))
+        if len(directory) <= len(unified):
+            break
+        directory = os.path.dirname(directory)
+    cpu_stat = _keyed(_read(os.path.join(path, "cpu.stat")))
+    return dict(
+        path=path,
+        controllers=controllers,
+        memory=dict(
+            max=memory_max,
+            current=_limit(_read(os.path.join(path, "memory.current"))),
+            swap_max=swap_max,
+            swap_current=_limit(_read(os.path.join(path, "memory.swap.current"))),
+            stat=_keyed(_read(os.path.join(path, "memory.stat"))),
+        ),
+        cpu=dict(
+            limit=cpus,
+            usage_usec=cpu_stat.get("usage_usec"),
+            **{key: cpu_stat.get(key) for key in THROTTLING},
+        ),
+    )
+
+
+def effective_memory(
+    memory_info: Dict[str, int], cgroup: Dict[str, Any]
+) -> Dict[str, int]:
+    """Get the memory information as seen from within the cgroup, when it has a memory limit.
+
+    Args:
+        memory_info: Host's memory information in bytes.
+        cgroup: Cgroup information.
+
+    Returns:
+        Dict[str, int]:
+        Returns the memory information with the same keys, bounded by the cgroup's limits.
+    """
+    memory = cgroup["memory"]
+    if memory["max"] is None or memory["current"] is None:
+        return memory_info
+    total = min(memory_info["total"], memory["max"])
+    # Inactive page cache is reclaimed before the OOM killer steps in, like the working set in Kubernetes
+    used = max(memory["current"] - memory["stat"].get("inactive_file", 0), 0)
+    effective = dict(
+        memory_info,
+        total=total,
+        free=max(total - memory["current"], 0),
+        available=max(total - used, 0),
+        used=used,
+    )
+    if memory["swap_max"] is not None and memory["swap_current"] is not None:
+        swap_total = min(memory_info.get("swap_total", 0), memory["swap_max"])
+        effective.update(
+            swap_total=swap_total,
+            swap_used=memory["swap_current"],
+            swap_free=max(swap_total - memory["swap_current"], 0),
+        )
+    return effective
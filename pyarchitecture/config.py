@@ -1,5 +1,8 @@
-import platform
-import shutil
+import ntpath
+import os
+import posixpath
+import sys
+from typing import Dict
 
 try:
     from enum import StrEnum
@@ -10,7 +13,8 @@ except ImportError:
         """Custom StrEnum object for python3.10."""
 
 
-OPERATING_SYSTEM = platform.system().lower()
+# sys.platform is resolved at build time, unlike platform.system() which queries the host on import
+OPERATING_SYSTEM = dict(win32="windows").get(sys.platform, sys.platform)
 
 
 class OperatingSystem(StrEnum):
@@ -36,37 +40,90 @@ if OPERATING_SYSTEM not in (
     )
 
 
-def default_mem_lib():
+# Module name of each component's backend, for the supported operating systems
+BACKENDS = dict(linux="linux", darwin="macOS", windows="windows")
+
+
+# Candidates for each component's library in order of preference, as the backend and an executable's name or path
+# Executables' names are looked up in PATH, and the first available candidate is resolved by the registry
+LIBRARIES = dict(
+    linux=dict(
+        cpu=[("procfs", "/proc/cpuinfo")],
+        # sysfs is used as a fallback for minimal containers where lsblk is unavailable
+        disks=[
+            ("lsblk", "lsblk"),
+            ("lsblk", "/usr/bin/lsblk"),
+            ("sysfs", "/sys/block"),
+        ],
+        # sysfs is preferred over lspci, since it doesn't have to spawn a process to enumerate the PCI devices
+        gpu=[
+            ("sysfs", "/sys/bus/pci/devices"),
+            ("lspci", "lspci"),
+            ("lspci", "/usr/bin/lspci"),
+        ],
+        memory=[("procfs", "/proc/meminfo")],
+    ),
+    darwin=dict(
+        cpu=[("sysctl", "sysctl"), ("sysctl", "/usr/sbin/sysctl")],
+        disks=[("diskutil", "diskutil"), ("diskutil", "/usr/sbin/diskutil")],
+        gpu=[
+            ("system_profiler", "system_profiler"),
+            ("system_profiler", "/usr/sbin/system_profiler"),
+        ],
+        memory=[("sysctl", "sysctl"), ("sysctl", "/usr/sbin/sysctl")],
+    ),
+    windows=dict(
+        cpu=[("wmic", "wmic"), ("wmic", "C:\\Windows\\System32\\wbem\\wmic.exe")],
+        disks=[
+            ("pwsh", "pwsh"),
+            ("pwsh", "C:\\Program Files\\PowerShell\\7\\pwsh.exe"),
+        ],
+        gpu=[("wmic", "wmic"), ("wmic", "C:\\Windows\\System32\\wbem\\wmic.exe")],
+        # memory is read with ctypes, so there is no library to resolve
+        memory=[],
+    ),
+)
+
+
+def _default_libs(component: str) -> Dict[str, str]:
+    """Get the library of a component for each supported operating system, resolved by the registry for the host."""
+    from pyarchitecture import registry
+
+    libraries = {}
+    for name, candidates in LIBRARIES.items():
+        if name == OPERATING_SYSTEM:
+            libraries[name] = registry.library(component)
+            continue
+        # Paths of the other operating systems are absolute by their own conventions, not the host's
+        isabs = ntpath.isabs if name == OperatingSystem.windows else posixpath.isabs
+        libraries[name] = next(
+            (library for _, library in candidates[component] if isabs(library)), ""
+        )
+    return libraries
+
+
+def default_mem_lib() -> Dict[str, str]:
     """Returns the default memory library dedicated to linux and macOS."""
-    return dict(
-        linux="/proc/meminfo",
-        darwin=shutil.which("sysctl") or "/usr/sbin/sysctl",
-        windows="",  # placeholder
-    )
+    return _default_libs("memory")
 
 
-def default_disk_lib():
+def default_disk_lib() -> Dict[str, str]:
     """Returns the default disks' library dedicated to each supported operating system."""
-    return dict(
-        linux=shutil.which("lsblk") or "/usr/bin/lsblk",
-        darwin=shutil.which("diskutil") or "/usr/sbin/diskutil",
-        windows=shutil.which("pwsh") or "C:\\Program Files\\PowerShell\\7\\pwsh.exe",
-    )
+    return _default_libs("disks")
 
 
-def default_cpu_lib():
+def default_cpu_lib() -> Dict[str, str]:
     """Returns the default processor library dedicated to each supported operating system."""
-    return dict(
-        linux="/proc/cpuinfo",
-        darwin=shutil.which("sysctl") or "/usr/sbin/sysctl",
-        windows=shutil.which("wmic") or "C:\\Windows\\System32\\wbem\\wmic.exe",
-    )
+    return _default_libs("cpu")
 
 
-def default_gpu_lib():
+def default_gpu_lib() -> Dict[str, str]:
     """Returns the default GPU library dedicated to each supported operating system."""
-    return dict(
-        linux=shutil.which("lspci") or "/usr/bin/lspci",
-        darwin=shutil.which("system_profiler") or "/usr/sbin/system_profiler",
-        windows=shutil.which("wmic") or "C:\\Windows\\System32\\wbem\\wmic.exe",
-    )
+    return _default_libs("gpu")
+
+
+# Directory for the files persisted across runs, like the registry's discovery
+CACHE_DIR = os.environ.get("PYARCHITECTURE_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "pyarchitecture",
+)
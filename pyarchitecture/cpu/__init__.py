@@ -1,8 +1,10 @@
 import logging
+import math
 import os
+from typing import Any, Dict
 
-from pyarchitecture import config
-from pyarchitecture.cpu import main
+from pyarchitecture import cache, config, registry
+from pyarchitecture.cpu import main, topology, usage
 
 LOGGER = logging.getLogger(__name__)
 
@@ -17,21 +19,105 @@ def _get_cpu_lib(user_input: str | os.PathLike) -> str:
         user_input
         or os.environ.get("cpu_lib")
         or os.environ.get("CPU_LIB")
-        or config.default_cpu_lib()[config.OPERATING_SYSTEM]
+        or registry.library("cpu")
     )
 
 
-def get_cpu_info(cpu_lib: str | os.PathLike = None) -> str:
-    """OS-agnostic function to get all CPUs connected to the host system.
+def _get_cpu_info(library_path: str | os.PathLike) -> str:
+    """Get the CPU name using the resolved library path.
 
     Args:
-        cpu_lib: Custom CPU library path.
+        library_path: CPU library path.
 
     Returns:
         str:
         Returns CPU name.
     """
-    library_path = _get_cpu_lib(cpu_lib)
     if os.path.isfile(library_path):
         return main.get_name(library_path)
     LOGGER.error(f"CPU library {library_path!r} doesn't exist")
+
+
+def get_cpu_info(cpu_lib: str | os.PathLike = None) -> str:
+    """OS-agnostic function to get all CPUs connected to the host system.
+
+    Args:
+        cpu_lib: Custom CPU library path.
+
+    See Also:
+        - The result is cached per library path, use ``pyarchitecture.cache.invalidate("cpu")`` to drop it.
+
+    Returns:
+        str:
+        Returns CPU name.
+    """
+    return cache.CACHE.fetch("cpu", _get_cpu_lib(cpu_lib), _get_cpu_info)
+
+
+def get_topology(cpu_lib: str | os.PathLike = None) -> Dict[str, Any]:
+    """Get the CPU topology of the host system, only on Linux.
+
+    Args:
+        cpu_lib: Custom CPU library path.
+
+    See Also:
+        - The topology is built in a single pass over cpuinfo and sysfs, and memoized for the process's lifetime.
+        - Each core's ``flags`` is a frozenset shared by all the cores with identical flags.
+
+    Returns:
+        Dict[str, Any]:
+        Returns the sockets, physical cores, SMT siblings, flags and cache hierarchy.
+    """
+    return topology.get_topology(_get_cpu_lib(cpu_lib))
+
+
+def effective_cpu_count() -> int:
+    """Get the number of CPUs the process can use, bounded by its CPU affinity and its cgroup's CPU quota.
+
+    Returns:
+        int:
+        Returns the number of CPUs, with a fractional quota rounded up.
+    """
+    count = len(topology.affinity())
+    if config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+        from pyarchitecture import cgroup
+
+        if (cgroup_info := cgroup.get_cgroup()) and cgroup_info["cpu"]["limit"]:
+            count = min(count, math.ceil(cgroup_info["cpu"]["limit"]))
+    return max(count, 1)
+
+
+def recommended_workers(
+    io_bound: bool = False, cpu_lib: str | os.PathLike = None
+) -> int:
+    """Recommends a worker count for process or thread pools, respecting the process's CPU affinity and CPU quota.
+
+    Args:
+        io_bound: Flag to size for I/O bound workers, which benefit from SMT siblings.
+        cpu_lib: Custom CPU library path.
+
+    Returns:
+        int:
+        Returns the recommended number of workers.
+    """
+    workers = topology.recommended_workers(get_topology(cpu_lib), io_bound)
+    # Workers beyond the quota would only be throttled
+    return min(workers, effective_cpu_count())
+
+
+def get_usage_sampler(stat_lib: str | os.PathLike = usage.STAT) -> usage.Sampler | None:
+    """Get a sampler for per-CPU utilization, only on Linux.
+
+    Args:
+        stat_lib: Custom path for the kernel's stat file.
+
+    See Also:
+        - Each call to ``sample()`` returns the utilization since the previous call.
+
+    Returns:
+        usage.Sampler:
+        Returns a sampler object that reads the stat file in place.
+    """
+    if os.path.isfile(stat_lib):
+        return usage.Sampler(stat_lib)
+    LOGGER.error(f"CPU stat library {stat_lib!r} doesn't exist")
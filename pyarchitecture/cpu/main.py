@@ -1,31 +1,53 @@
 import logging
 import os
-import subprocess
+from typing import Iterable, List
 
-from pyarchitecture.cpu import config
+from pyarchitecture import config, runner
 
 LOGGER = logging.getLogger(__name__)
 
 
+def darwin_command(cpu_lib: str | os.PathLike) -> List[str]:
+    """Command to get processor information for macOS."""
+    return [cpu_lib, "-n", "machdep.cpu.brand_string"]
+
+
+def parse_darwin(output: str) -> str:
+    """Parse processor information from the sysctl output on macOS."""
+    return output.strip()
+
+
+def parse_linux(lines: Iterable[str]) -> str:
+    """Parse processor information from the cpuinfo lines on Linux."""
+    for line in lines:
+        if "model name" in line:
+            return line.split(":")[1].strip()
+
+
+def windows_command(cpu_lib: str | os.PathLike) -> List[str]:
+    """Command to get processor information for Windows."""
+    return [cpu_lib, "cpu", "get", "name"]
+
+
+def parse_windows(output: str) -> str:
+    """Parse processor information from the wmic output on Windows."""
+    return output.strip().split("\n")[1]
+
+
 def _darwin(cpu_lib: str | os.PathLike) -> str:
     """Get processor information for macOS."""
-    command = [cpu_lib, "-n", "machdep.cpu.brand_string"]
-    return subprocess.check_output(command).decode().strip()
+    return parse_darwin(runner.run(darwin_command(cpu_lib), check=True).stdout)
 
 
 def _linux(cpu_lib: str | os.PathLike) -> str:
     """Get processor information for Linux."""
     with open(cpu_lib) as file:
-        for line in file:
-            if "model name" in line:
-                return line.split(":")[1].strip()
+        return parse_linux(file)
 
 
 def _windows(cpu_lib: str | os.PathLike) -> str:
     """Get processor information for Windows."""
-    command = f"{cpu_lib} cpu get name"
-    output = subprocess.check_output(command, shell=True).decode()
-    return output.strip().split("\n")[1]
+    return parse_windows(runner.run(windows_command(cpu_lib), check=True).stdout)
 
 
 def get_name(cpu_lib: str | os.PathLike) -> str | None:
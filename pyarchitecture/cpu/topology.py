@@ -0,0 +1,196 @@
+import functools
+import logging
+import os
+import sys
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+from pyarchitecture import config, squire
+
+LOGGER = logging.getLogger(__name__)
+
+SYS_CPU = "/sys/devices/system/cpu"
+# Suffix for the cache names based on the cache type (eg: L1d, L1i, L2, L3)
+CACHE_TYPES = dict(Data="d", Instruction="i", Unified="")
+
+
+def _parse_cpuinfo(cpu_lib: str | os.PathLike) -> List[Dict[str, Any]]:
+    """Parses each processor's block in cpuinfo in a single streaming pass.
+
+    Args:
+        cpu_lib: CPU library path.
+
+    Returns:
+        List[Dict[str, Any]]:
+        Returns a list of processor number, socket, core, model and flags for each logical CPU.
+    """
+    # Identical flags are shared as a single frozenset, instead of a set per logical CPU
+    flag_sets: Dict[str, FrozenSet[str]] = {}
+    processors, current = [], {}
+    with open(cpu_lib) as file:
+        for line in file:
+            key, separator, value = line.partition(":")
+            if not separator:
+                # Blank lines separate each processor's block
+                if current:
+                    processors.append(current)
+                    current = {}
+                continue
+            key, value = key.strip(), value.strip()
+            if key == "processor":
+                current["cpu"] = int(value)
+            elif key == "physical id":
+                current["socket"] = int(value)
+            elif key == "core id":
+                current["core"] = int(value)
+            elif key == "model name":
+                current["model"] = sys.intern(value)
+            elif key in ("flags", "Features"):
+                if (flags := flag_sets.get(value)) is None:
+                    flags = flag_sets[value] = frozenset(value.split())
+                current["flags"] = flags
+    if current:
+        processors.append(current)
+    return processors
+
+
+def _cache_hierarchy(
+    sys_cpu: str | os.PathLike, cpus: List[int]
+) -> Dict[str, Dict[str, int]]:
+    """Get the cache hierarchy from sysfs, reading each shared cache only once.
+
+    Args:
+        sys_cpu: Path to the CPU devices' directory in sysfs.
+        cpus: List of logical CPU numbers.
+
+    Returns:
+        Dict[str, Dict[str, int]]:
+        Returns the size, number of instances and CPUs sharing each instance, for each cache level.
+    """
+    caches: Dict[str, Dict[str, int]] = {}
+    seen: Dict[str, set] = {}
+    for cpu in cpus:
+        cache_dir = os.path.join(sys_cpu, f"cpu{cpu}", "cache")
+        try:
+            indexes = sorted(
+                entry for entry in os.listdir(cache_dir) if entry.startswith("index")
+            )
+        except OSError:
+            continue
+        for index in indexes:
+            # CPUs that share an instance already seen for this index are skipped
+            if cpu in seen.setdefault(index, set()):
+                continue
+            path = os.path.join(cache_dir, index)
+            shared = squire.parse_cpu_list(
+                squire.read_attribute(os.path.join(path, "shared_cpu_list")) or str(cpu)
+            )
+            seen[index].update(shared)
+            level = squire.read_attribute(os.path.join(path, "level"))
+            cache_type = squire.read_attribute(os.path.join(path, "type")) or "Unified"
+            name = f"L{level}{CACHE_TYPES.get(cache_type, '')}"
+            size = squire.read_attribute(os.path.join(path, "size"))
+            cache = caches.setdefault(
+                name,
+                dict(
+                    size=squire.convert_to_bytes(size) if size else 0,
+                    instances=0,
+                    shared_cpus=len(shared),
+                ),
+            )
+            cache["instances"] += 1
+    return dict(sorted(caches.items()))
+
+
+@functools.lru_cache(maxsize=4)
+def get_topology(
+    cpu_lib: str | os.PathLike, sys_cpu: str | os.PathLike = SYS_CPU
+) -> Dict[str, Any]:
+    """Get the CPU topology from cpuinfo and sysfs, memoized for the lifetime of the process.
+
+    Args:
+        cpu_lib: CPU library path.
+        sys_cpu: Path to the CPU devices' directory in sysfs.
+
+    Returns:
+        Dict[str, Any]:
+        Returns the sockets, physical cores, SMT siblings, flags and cache hierarchy.
+    """
+    if config.OPERATING_SYSTEM != config.OperatingSystem.linux:
+        LOGGER.warning("CPU topology is only available on Linux")
+        logical_cpus = os.cpu_count() or 1
+        return dict(logical_cpus=logical_cpus, cores=[], caches={})
+    processors = _parse_cpuinfo(cpu_lib)
+    cores: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    for processor in processors:
+        cpu = processor["cpu"]
+        topology = os.path.join(sys_cpu, f"cpu{cpu}", "topology")
+        # Architectures like ARM don't report the socket and core in cpuinfo
+        if "socket" not in processor:
+            processor["socket"] = int(
+                squire.read_attribute(os.path.join(topology, "physical_package_id"))
+                or 0
+            )
+        if "core" not in processor:
+            processor["core"] = int(
+                squire.read_attribute(os.path.join(topology, "core_id")) or cpu
+            )
+        core = cores.setdefault(
+            (processor["socket"], processor["core"]),
+            dict(
+                socket=processor["socket"],
+                core=processor["core"],
+                cpus=[],
+                flags=processor.get("flags", frozenset()),
+            ),
+        )
+        core["cpus"].append(cpu)
+    flag_sets = {id(core["flags"]): core["flags"] for core in cores.values()}
+    # Flags supported by every core, which is the same shared set on homogeneous hosts
+    if len(flag_sets) > 1:
+        flags = frozenset.intersection(*flag_sets.values())
+    else:
+        flags = next(iter(flag_sets.values()), frozenset())
+    return dict(
+        model=next((p["model"] for p in processors if "model" in p), None),
+        sockets=len({core["socket"] for core in cores.values()}),
+        physical_cores=len(cores),
+        logical_cpus=len(processors),
+        threads_per_core=max((len(core["cpus"]) for core in cores.values()), default=1),
+        cores=list(cores.values()),
+        flags=flags,
+        caches=_cache_hierarchy(sys_cpu, [p["cpu"] for p in processors]),
+    )
+
+
+def affinity() -> List[int]:
+    """Get the logical CPUs the current process is allowed to run on.
+
+    Returns:
+        List[int]:
+        Returns a sorted list of logical CPU numbers.
+    """
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is not available on macOS and Windows
+        return list(range(os.cpu_count() or 1))
+
+
+def recommended_workers(topology: Dict[str, Any], io_bound: bool = False) -> int:
+    """Recommends a worker count based on the CPU topology and the process's CPU affinity.
+
+    Args:
+        topology: CPU topology.
+        io_bound: Flag to size for I/O bound workers, which benefit from SMT siblings.
+
+    Returns:
+        int:
+        Returns the recommended number of workers.
+    """
+    allowed = set(affinity())
+    if io_bound or not topology["cores"]:
+        return max(1, len(allowed))
+    # CPU bound workers are sized to one per physical core, since SMT siblings share the execution units
+    return max(
+        1, sum(bool(allowed.intersection(core["cpus"])) for core in topology["cores"])
+    )
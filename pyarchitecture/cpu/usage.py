@@ -0,0 +1,97 @@
+import os
+from array import array
+from typing import Dict, List
+
+STAT = "/proc/stat"
+# Columns of each cpu line in /proc/stat, guest time is already accounted in user and nice
+COLUMNS = ("user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal")
+WIDTH = len(COLUMNS)
+# stat is a few KB even on large hosts, the buffer grows when it doesn't fit
+READ_SIZE = 65536
+
+
+class Sampler:
+    """Per-CPU utilization sampler based on the deltas between two readings of ``/proc/stat``.
+
+    >>> Sampler
+
+    Counters are held in preallocated unsigned 64-bit arrays, which are swapped between samples.
+    """
+
+    def __init__(self, stat_lib: str | os.PathLike = STAT):
+        self._fd = os.open(stat_lib, os.O_RDONLY)
+        self._size = READ_SIZE
+        self.cpus: List[str] = []
+        self._previous = array("Q")
+        self._current = array("Q")
+        self._read()
+        self._previous, self._current = self._current, self._previous
+
+    def _read(self) -> None:
+        """Reads the cpu lines from stat into the current array, resizing the arrays when CPUs go on or offline."""
+        while len(data := os.pread(self._fd, self._size, 0)) == self._size:
+            self._size *= 2
+        names, rows = [], []
+        for line in data.split(b"\n"):
+            if not line.startswith(b"cpu"):
+                # cpu lines are always listed first, followed by the interrupts and context switches
+                break
+            parts = line.split()
+            names.append(parts[0].decode())
+            rows.append(parts[1 : WIDTH + 1])  # noqa: E203
+        if names != self.cpus:
+            self.cpus = names
+            self._previous = array("Q", bytes(8 * WIDTH * len(names)))
+            self._current = array("Q", bytes(8 * WIDTH * len(names)))
+        current = self._current
+        for index, row in enumerate(rows):
+            offset = index * WIDTH
+            for column, value in enumerate(row):
+                current[offset + column] = int(value)
+
+    def sample(self) -> Dict[str, Dict[str, float]]:
+        """Get the CPU utilization since the previous sample.
+
+        Returns:
+            Dict[str, Dict[str, float]]:
+            Returns the user, system, iowait, steal and idle percentages for the aggregate (``cpu``) and each CPU.
+        """
+        self._read()
+        previous, current = self._previous, self._current
+        usage = {}
+        for index, name in enumerate(self.cpus):
+            offset = index * WIDTH
+            # Counters like iowait are not guaranteed to be monotonic, so negative deltas are ignored
+            user, nice, system, idle, iowait, irq, softirq, steal = (
+                max(0, current[offset + column] - previous[offset + column])
+                for column in range(WIDTH)
+            )
+            total = user + nice + system + idle + iowait + irq + softirq + steal
+            if not total:
+                usage[name] = dict(
+                    user=0.0, system=0.0, iowait=0.0, steal=0.0, idle=100.0
+                )
+                continue
+            usage[name] = dict(
+                user=round(100 * (user + nice) / total, 2),
+                system=round(100 * (system + irq + softirq) / total, 2),
+                iowait=round(100 * iowait / total, 2),
+                steal=round(100 * steal / total, 2),
+                idle=round(100 * idle / total, 2),
+            )
+        self._previous, self._current = current, previous
+        return usage
+
+    def close(self) -> None:
+        """Closes the stat file."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "Sampler":
+        """Opens the sampler as a context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Closes the sampler when exiting the context manager."""
+        self.close()
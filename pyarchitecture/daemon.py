@@ -0,0 +1,273 @@
+import contextlib
+import http.server
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import threading
+from typing import Any, Callable, Dict
+
+import pyarchitecture
+from pyarchitecture import config
+
+LOGGER = logging.getLogger(__name__)
+
+SOCKET_PATH = os.environ.get("PYARCHITECTURE_SOCKET") or os.path.join(
+    config.CACHE_DIR, "daemon.sock"
+)
+# Names that clients use to request each component, along with ``all`` for every component
+COMPONENTS = dict(disks="Disks", cpu="CPU", gpu="GPU", memory="Memory")
+
+
+class Daemon:
+    """Collector that keeps a continuously refreshed snapshot of all the components in memory.
+
+    >>> Daemon
+
+    Responses are encoded once per refresh, so serving a request is a single lookup and write.
+    """
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self._components: Dict[str, Any] = {}
+        self._payloads: Dict[str, bytes] = {}
+        self._collectors: Dict[str, Callable[[], Any]] = pyarchitecture._collectors()
+        self._stop = threading.Event()
+        self._exporter = None
+        self._exporter_lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """Collects all the components, keeping the previous value of the ones that fail."""
+        components = dict(self._components)
+        for name, func in self._collectors.items():
+            try:
+                components[name] = func()
+            except Exception as error:
+                LOGGER.error(f"Failed to collect {name} information: {error!r}")
+                components.setdefault(name, None)
+        payloads = {
+            key: json.dumps(components[name]).encode()
+            for key, name in COMPONENTS.items()
+        }
+        payloads["all"] = json.dumps(components).encode()
+        # Swapped as a whole, so concurrent readers never see a partially refreshed snapshot
+        self._components, self._payloads = components, payloads
+
+    def payload(self, component: str) -> bytes | None:
+        """Get the encoded snapshot of a component.
+
+        Args:
+            component: Name of the component - ``all``, ``disks``, ``cpu``, ``gpu`` or ``memory``.
+
+        Returns:
+            bytes:
+            Returns the JSON encoded information, or ``None`` for unknown components.
+        """
+        return self._payloads.get(component.strip().lower() or "all")
+
+    def metrics(self) -> bytes:
+        """Renders the metrics in the Prometheus text exposition format, one scrape at a time.
+
+        Returns:
+            bytes:
+            Returns the encoded metrics.
+        """
+        from pyarchitecture import exporter
+
+        with self._exporter_lock:
+            if self._exporter is None:
+                self._exporter = exporter.Exporter()
+            return self._exporter.render().encode()
+
+    def _refresh_loop(self) -> None:
+        """Refreshes the snapshot at the configured interval, until the daemon is stopped."""
+        while not self._stop.wait(self.interval):
+            self.refresh()
+
+    def serve(
+        self, socket_path: str | os.PathLike = SOCKET_PATH, port: int = None
+    ) -> None:
+        """Serves the snapshot over a Unix domain socket, and optionally over HTTP on localhost, until interrupted.
+
+        Args:
+            socket_path: Path of the Unix domain socket.
+            port: Port for the HTTP endpoint on localhost, disabled when not set.
+        """
+        self.refresh()
+        servers = [_unix_server(self, socket_path)]
+        if port:
+            servers.append(_http_server(self, port))
+        threads = [threading.Thread(target=self._refresh_loop, daemon=True)]
+        threads.extend(
+            threading.Thread(target=server.serve_forever, daemon=True)
+            for server in servers
+        )
+        for thread in threads:
+            thread.start()
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: self.stop())
+        LOGGER.info(f"Serving on {os.fspath(socket_path)!r}")
+        try:
+            self._stop.wait()
+        except KeyboardInterrupt:
+            LOGGER.info("Stopping the daemon")
+        finally:
+            self.stop()
+            for server in servers:
+                server.shutdown()
+                server.server_close()
+            with contextlib.suppress(OSError):
+                os.remove(socket_path)
+
+    def stop(self) -> None:
+        """Stops the refresh loop and the servers."""
+        self._stop.set()
+
+
+def _unix_server(
+    daemon: Daemon, socket_path: str | os.PathLike
+) -> socketserver.ThreadingUnixStreamServer:
+    """Creates the Unix domain socket server, replacing a stale socket left behind by a previous daemon.
+
+    Args:
+        daemon: Daemon to serve the snapshot from.
+        socket_path: Path of the Unix domain socket.
+
+    Returns:
+        socketserver.ThreadingUnixStreamServer:
+        Returns the server bound to the socket.
+    """
+
+    class Handler(socketserver.StreamRequestHandler):
+        """Answers a single component's name per connection with its JSON encoded snapshot."""
+
+        def handle(self) -> None:
+            """Reads the component's name and writes the snapshot."""
+            if not (component := self.rfile.readline(64).decode(errors="replace")):
+                # Connections that close without a request, like the probe for a running daemon
+                return
+            if (payload := daemon.payload(component)) is None:
+                payload = json.dumps(
+                    dict(error=f"unknown component {component.strip()!r}")
+                ).encode()
+            with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+                self.wfile.write(payload)
+
+    if os.path.exists(socket_path):
+        if _is_listening(socket_path):
+            raise RuntimeError(f"A daemon is already serving on {socket_path!r}")
+        os.remove(socket_path)
+    os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+    server = socketserver.ThreadingUnixStreamServer(os.fspath(socket_path), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def _http_server(daemon: Daemon, port: int) -> http.server.ThreadingHTTPServer:
+    """Creates the HTTP server on localhost, serving ``/`` for all components, ``/<component>`` and ``/metrics``.
+
+    Args:
+        daemon: Daemon to serve the snapshot from.
+        port: Port to listen on.
+
+    Returns:
+        http.server.ThreadingHTTPServer:
+        Returns the server bound to the port.
+    """
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        """Answers GET requests with the JSON encoded snapshot."""
+
+        def do_GET(self) -> None:  # noqa: N802
+            """Writes the snapshot of the requested component, or the metrics."""
+            content_type = "application/json"
+            if self.path == "/metrics":
+                from pyarchitecture import exporter
+
+                payload, content_type = daemon.metrics(), exporter.CONTENT_TYPE
+            elif (payload := daemon.payload(self.path.strip("/"))) is None:
+                self.send_error(404, f"Unknown component {self.path!r}")
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args) -> None:
+            """Routes the access logs to the module's logger."""
+            LOGGER.debug(format % args)
+
+    return http.server.ThreadingHTTPServer(("127.0.0.1", port), Handler)
+
+
+def _is_listening(socket_path: str | os.PathLike) -> bool:
+    """Checks whether a daemon is accepting connections on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(os.fspath(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def request(
+    component: str = "all",
+    socket_path: str | os.PathLike = SOCKET_PATH,
+    timeout: float = 1.0,
+) -> Any:
+    """Requests a component's snapshot from the daemon.
+
+    Args:
+        component: Name of the component - ``all``, ``disks``, ``cpu``, ``gpu`` or ``memory``.
+        socket_path: Path of the daemon's Unix domain socket.
+        timeout: Timeout in seconds for connecting and reading the response.
+
+    Raises:
+        OSError:
+        When the daemon is not running or doesn't respond in time.
+
+    Returns:
+        Any:
+        Returns the component's information.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(os.fspath(socket_path))
+        client.sendall(f"{component}\n".encode())
+        chunks = []
+        while chunk := client.recv(65536):
+            chunks.append(chunk)
+    return json.loads(b"".join(chunks))
+
+
+def get(
+    component: str = "all",
+    socket_path: str | os.PathLike = SOCKET_PATH,
+    timeout: float = 1.0,
+) -> Any:
+    """Get a component's information from the daemon, falling back to direct collection when it isn't running.
+
+    Args:
+        component: Name of the component - ``all``, ``disks``, ``cpu``, ``gpu`` or ``memory``.
+        socket_path: Path of the daemon's Unix domain socket.
+        timeout: Timeout in seconds for the daemon to respond.
+
+    Returns:
+        Any:
+        Returns the component's information.
+    """
+    if component != "all" and component not in COMPONENTS:
+        raise ValueError(
+            f"component must be one of {['all', *COMPONENTS]}, received {component!r}"
+        )
+    if hasattr(socket, "AF_UNIX"):
+        try:
+            return request(component, socket_path, timeout)
+        except (OSError, ValueError) as error:
+            LOGGER.debug(f"Daemon is unavailable, collecting directly: {error}")
+    if component == "all":
+        return pyarchitecture.all_components()
+    return pyarchitecture._collectors()[COMPONENTS[component]]()
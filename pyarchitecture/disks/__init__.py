@@ -1,9 +1,10 @@
 import logging
 import os
+import subprocess
 from typing import Dict, List
 
-from pyarchitecture import config
-from pyarchitecture.disks import linux, macOS, windows
+from pyarchitecture import cache, config, registry, squire
+from pyarchitecture.disks import diskstats
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,26 +19,90 @@ def _get_disk_lib(user_input: str | os.PathLike) -> str:
         user_input
         or os.environ.get("disk_lib")
         or os.environ.get("DISK_LIB")
-        or config.default_disk_lib()[config.OPERATING_SYSTEM]
+        or registry.library("disks")
     )
 
 
-def get_all_disks(disk_lib: str | os.PathLike = None) -> List[Dict[str, str]]:
-    """OS-agnostic function to get all disks connected to the host system.
+def _get_all_disks(library_path: str | os.PathLike) -> List[Dict[str, str]]:
+    """Get all disks using the resolved library path.
 
     Args:
-        disk_lib: Custom disk library path.
+        library_path: Disk library path.
 
     Returns:
         List[Dict[str, str]]:
         Returns a list of disk information.
     """
-    library_path = _get_disk_lib(disk_lib)
+    if config.OPERATING_SYSTEM == config.OperatingSystem.linux and os.path.isdir(
+        library_path
+    ):
+        return squire.import_backend(__name__).sysfs_drive_info(library_path)
     if os.path.isfile(library_path):
-        os_map = {
-            config.OperatingSystem.darwin: macOS.drive_info,
-            config.OperatingSystem.linux: linux.drive_info,
-            config.OperatingSystem.windows: windows.drive_info,
-        }
-        return os_map[config.OperatingSystem(config.OPERATING_SYSTEM)](library_path)
+        try:
+            return squire.import_backend(__name__).drive_info(library_path)
+        except subprocess.TimeoutExpired as error:
+            LOGGER.error(error)
+            return
     LOGGER.error(f"Disk library {library_path!r} doesn't exist")
+
+
+def _with_usage(all_disks: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Adds the usage of each mountpoint to the disks."""
+    from pyarchitecture.disks import usage as disk_usage
+
+    mountpoints = disk_usage.get_usage(
+        mountpoint for disk in all_disks for mountpoint in disk["mountpoints"]
+    )
+    # The cache hands out copies, so the disks are updated in place
+    for disk in all_disks:
+        disk["usage"] = {
+            mountpoint: mountpoints[mountpoint] for mountpoint in disk["mountpoints"]
+        }
+    return all_disks
+
+
+def get_all_disks(
+    disk_lib: str | os.PathLike = None, usage: bool = False
+) -> List[Dict[str, str]]:
+    """OS-agnostic function to get all disks connected to the host system.
+
+    Args:
+        disk_lib: Custom disk library path, or the ``/sys/block`` directory to read sysfs on Linux.
+        usage: Flag to include the space and inode usage of each mountpoint.
+
+    See Also:
+        - The result is cached per library path, use ``pyarchitecture.cache.invalidate("disks")`` to drop it.
+        - Usage is collected on each call, and is ``None`` for the mountpoints that don't respond in time.
+
+    Returns:
+        List[Dict[str, str]]:
+        Returns a list of disk information.
+    """
+    all_disks = cache.CACHE.fetch("disks", _get_disk_lib(disk_lib), _get_all_disks)
+    if not usage or all_disks is None:
+        return all_disks
+    return _with_usage(all_disks)
+
+
+def get_stats_sampler(
+    disk_lib: str | os.PathLike = None,
+    diskstats_lib: str | os.PathLike = diskstats.DISKSTATS,
+) -> diskstats.Sampler | None:
+    """Get a sampler for disk throughput and latency, keyed by the ``device_id`` of each disk, only on Linux.
+
+    Args:
+        disk_lib: Custom disk library path, used to list the disks to track.
+        diskstats_lib: Custom path for the kernel's diskstats file.
+
+    See Also:
+        - Each call to ``sample()`` returns the performance since the previous call.
+
+    Returns:
+        diskstats.Sampler:
+        Returns a sampler object that reads the diskstats file in place.
+    """
+    if not os.path.isfile(diskstats_lib):
+        LOGGER.error(f"Disk stats library {diskstats_lib!r} doesn't exist")
+        return
+    device_ids = [disk["device_id"] for disk in get_all_disks(disk_lib) or []]
+    return diskstats.Sampler(device_ids, diskstats_lib)
@@ -0,0 +1,117 @@
+import os
+import time
+from array import array
+from typing import Dict, Iterable
+
+DISKSTATS = "/proc/diskstats"
+# Offsets of the counters used from each diskstats line, after the major, minor and device name columns
+READS, SECTORS_READ, MS_READING = 0, 2, 3
+WRITES, SECTORS_WRITTEN, MS_WRITING = 4, 6, 7
+IN_PROGRESS, MS_DOING_IO, WEIGHTED_MS_DOING_IO = 8, 9, 10
+WIDTH = 11
+# Sectors in diskstats are always 512 bytes, regardless of the device's block size
+SECTOR_SIZE = 512
+READ_SIZE = 65536
+
+
+class Sampler:
+    """Disk throughput and latency sampler based on the deltas between two readings of ``/proc/diskstats``.
+
+    >>> Sampler
+
+    Only the tracked devices are parsed, so partitions, dm and md devices cost a single split per line.
+    """
+
+    def __init__(
+        self, device_ids: Iterable[str], diskstats: str | os.PathLike = DISKSTATS
+    ):
+        self._fd = os.open(diskstats, os.O_RDONLY)
+        self._size = READ_SIZE
+        self.device_ids = list(dict.fromkeys(device_ids))
+        self._offsets = {
+            device_id.encode(): index * WIDTH
+            for index, device_id in enumerate(self.device_ids)
+        }
+        self._previous = array("Q", bytes(8 * WIDTH * len(self.device_ids)))
+        self._current = array("Q", bytes(8 * WIDTH * len(self.device_ids)))
+        self._found = set()
+        self._timestamp = self._read()
+        self._previous, self._current = self._current, self._previous
+
+    def _read(self) -> float:
+        """Reads the counters of the tracked devices into the current array.
+
+        Returns:
+            float:
+            Returns the monotonic timestamp of the reading.
+        """
+        while len(data := os.pread(self._fd, self._size, 0)) == self._size:
+            self._size *= 2
+        timestamp = time.monotonic()
+        current, offsets = self._current, self._offsets
+        self._found.clear()
+        for line in data.split(b"\n"):
+            # Only the device name is split out, until the device is known to be tracked
+            parts = line.split(None, 3)
+            if len(parts) < 4 or (offset := offsets.get(parts[2])) is None:
+                continue
+            self._found.add(parts[2].decode())
+            for column, value in enumerate(parts[3].split()[:WIDTH]):
+                current[offset + column] = int(value)
+        return timestamp
+
+    def sample(self) -> Dict[str, Dict[str, float]]:
+        """Get the disk throughput and latency since the previous sample.
+
+        Returns:
+            Dict[str, Dict[str, float]]:
+            Returns IOPS, bytes per second, average service time, queue depth and utilization for each device.
+        """
+        timestamp = self._read()
+        elapsed = max(timestamp - self._timestamp, 1e-9)
+        elapsed_ms = elapsed * 1_000
+        previous, current = self._previous, self._current
+        stats = {}
+        for device_id in self.device_ids:
+            if device_id not in self._found:
+                continue
+            offset = self._offsets[device_id.encode()]
+            # Counters wrap around on 32-bit kernels, so negative deltas are ignored
+            delta = [
+                max(0, current[offset + column] - previous[offset + column])
+                for column in range(WIDTH)
+            ]
+            ios = delta[READS] + delta[WRITES]
+            stats[device_id] = dict(
+                read_iops=round(delta[READS] / elapsed, 2),
+                write_iops=round(delta[WRITES] / elapsed, 2),
+                read_bytes_per_sec=round(
+                    delta[SECTORS_READ] * SECTOR_SIZE / elapsed, 2
+                ),
+                write_bytes_per_sec=round(
+                    delta[SECTORS_WRITTEN] * SECTOR_SIZE / elapsed, 2
+                ),
+                service_time_ms=round(
+                    (delta[MS_READING] + delta[MS_WRITING]) / ios if ios else 0.0, 3
+                ),
+                queue_depth=round(delta[WEIGHTED_MS_DOING_IO] / elapsed_ms, 2),
+                in_progress=current[offset + IN_PROGRESS],
+                utilization=round(min(100.0, 100 * delta[MS_DOING_IO] / elapsed_ms), 2),
+            )
+        self._previous, self._current = current, previous
+        self._timestamp = timestamp
+        return stats
+
+    def close(self) -> None:
+        """Closes the diskstats file."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "Sampler":
+        """Opens the sampler as a context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Closes the sampler when exiting the context manager."""
+        self.close()
@@ -1,29 +1,62 @@
 import json
+import logging
 import os
-import subprocess
-from typing import Dict, List
+import re
+from typing import Dict, Iterable, Iterator, List, Tuple
 
+from pyarchitecture import runner, squire
+
+LOGGER = logging.getLogger(__name__)
+
+MOUNTINFO = "/proc/self/mountinfo"
+SYS_BLOCK = "/sys/block"
+# Block devices that are not reported as type "disk" by lsblk
+VIRTUAL_PREFIXES = ("dm-", "loop", "md")
+# SCSI peripheral device types that are reported as type "disk" by lsblk
+SCSI_DISK_TYPES = ("0", "7", "14")
+# RAM disks are excluded by lsblk by default
+RAM_DISK_MAJOR = "1:"
+
+
+def drive_info_command(disk_lib: str | os.PathLike) -> List[str]:
+    """Command to get disks attached to Linux devices."""
+    return [disk_lib, "-o", "NAME,SIZE,TYPE,MODEL,MOUNTPOINT", "-J"]
+
+
+def exact_size(device_path: str | os.PathLike) -> int | None:
+    """Get the exact size in bytes of a block device from sysfs, ``None`` when it can't be read.
+
+    Args:
+        device_path: Path to the block device in sysfs.
+    """
+    # Size is always reported in 512-byte sectors, regardless of the device's block size
+    if (sectors := squire.read_attribute(os.path.join(device_path, "size"))) is None:
+        return
+    return int(sectors) * 512
 
-def drive_info(disk_lib: str | os.PathLike) -> List[Dict[str, str]]:
-    """Get disks attached to Linux devices.
+
+def parse_drive_info(
+    output: str, sys_block: str | os.PathLike = SYS_BLOCK
+) -> List[Dict[str, str]]:
+    """Parses the JSON output from lsblk into disks information.
+
+    Args:
+        output: Standard output from lsblk command.
+        sys_block: Path to the block devices' directory in sysfs, to read the exact sizes from.
 
     Returns:
         List[Dict[str, str]]:
         Returns disks information for Linux distros.
     """
-    # Using -d to list only physical disks, and filtering out loop devices
-    result = subprocess.run(
-        [disk_lib, "-o", "NAME,SIZE,TYPE,MODEL,MOUNTPOINT", "-J"],
-        capture_output=True,
-        text=True,
-    )
-    data = json.loads(result.stdout)
+    data = json.loads(output)
     disks = []
     for device in data.get("blockdevices", []):
         if device["type"] == "disk":
             disk_info = {
                 "device_id": device["name"],
                 "size": device["size"],
+                # lsblk rounds the size it prints, so the exact size is read from sysfs
+                "size_bytes": exact_size(os.path.join(sys_block, device["name"])),
                 "name": device.get("model", "Unknown"),
                 "mountpoints": [],
             }
@@ -41,3 +74,216 @@ def drive_info(disk_lib: str | os.PathLike) -> List[Dict[str, str]]:
                 disk_info["mountpoints"] = []
             disks.append(disk_info)
     return disks
+
+
+def drive_info(disk_lib: str | os.PathLike) -> List[Dict[str, str]]:
+    """Get disks attached to Linux devices.
+
+    Returns:
+        List[Dict[str, str]]:
+        Returns disks information for Linux distros.
+    """
+    # Only the devices of type disk are retained, filtering out loop devices and partitions
+    return parse_drive_info(runner.run(drive_info_command(disk_lib)).stdout)
+
+
+def _unescape(path: str) -> str:
+    """Decodes the octal escape sequences used in mountinfo for spaces, tabs and backslashes."""
+    return re.sub(r"\\([0-7]{3})", lambda match: chr(int(match.group(1), 8)), path)
+
+
+def mount_entries(lines: Iterable[str]) -> Iterator[Tuple[str, str, str, str]]:
+    """Parses the mountinfo lines into the device number, root, mountpoint and source of each mount.
+
+    Args:
+        lines: Lines from the mountinfo file.
+
+    Yields:
+        Tuple[str, str, str, str]:
+        Yields the ``major:minor`` device number, the root of the mount within the filesystem, the mountpoint,
+        and the mount source (eg: ``/dev/sda2``).
+    """
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 5:
+            continue
+        # Optional fields precede the separator, followed by the filesystem type and the mount source
+        try:
+            source = _unescape(fields[fields.index("-", 5) + 2])
+        except (ValueError, IndexError):
+            source = ""
+        yield fields[2], fields[3], _unescape(fields[4]), source
+
+
+def _mountpoints(entries: Iterable[Tuple[str, str, str, str]]) -> Dict[str, str]:
+    """Get the mountpoint of each device number, and of each device node that is a mount source."""
+    mounts: Dict[str, Tuple[str, str]] = {}
+    for device_number, root, mountpoint, source in entries:
+        # Filesystems on anonymous devices (eg: btrfs) report a 0:NN device number, so the source is matched as well
+        for key in (
+            (device_number, source) if source.startswith("/dev/") else (device_number,)
+        ):
+            # Bind mounts of a subdirectory are only used when the filesystem's root is not mounted
+            if key not in mounts or (root == "/" and mounts[key][0] != "/"):
+                mounts[key] = (root, mountpoint)
+    return {key: mount[1] for key, mount in mounts.items()}
+
+
+def parse_mountinfo(lines: Iterable[str]) -> Dict[str, str]:
+    """Parses the mountinfo lines into a mapping of device numbers and their mountpoints.
+
+    Args:
+        lines: Lines from the mountinfo file.
+
+    Returns:
+        Dict[str, str]:
+        Returns a dictionary of ``major:minor``, and ``/dev/<name>`` for the mount sources, as key and the mountpoint
+        as value.
+    """
+    return _mountpoints(mount_entries(lines))
+
+
+def _read_mountinfo(mountinfo: str | os.PathLike) -> List[Tuple[str, str, str, str]]:
+    """Reads the mount entries from the mountinfo file, empty when it can't be read."""
+    try:
+        with open(mountinfo) as file:
+            return list(mount_entries(file))
+    except OSError as error:
+        LOGGER.debug(error)
+        return []
+
+
+def mount_devices(mountinfo: str | os.PathLike = MOUNTINFO) -> Dict[str, str]:
+    """Reads the device number of every mountpoint, including bind mounts, without touching the mounts themselves.
+
+    Args:
+        mountinfo: Path to the mountinfo file.
+
+    Returns:
+        Dict[str, str]:
+        Returns a dictionary of mountpoint as key and ``major:minor`` as value, empty when it can't be read.
+    """
+    return {
+        mountpoint: device_number
+        for device_number, _, mountpoint, _ in _read_mountinfo(mountinfo)
+    }
+
+
+def is_disk(device_path: str, name: str, device_number: str) -> bool:
+    """Checks if a block device would be reported as type disk by lsblk.
+
+    Args:
+        device_path: Path to the block device in sysfs.
+        name: Name of the block device.
+        device_number: Device number of the block device as ``major:minor``.
+
+    Returns:
+        bool:
+        Returns a boolean flag to indicate whether the block device is a disk.
+    """
+    if name.startswith(VIRTUAL_PREFIXES) or device_number.startswith(RAM_DISK_MAJOR):
+        return False
+    scsi_type = squire.read_attribute(os.path.join(device_path, "device", "type"))
+    return scsi_type is None or scsi_type in SCSI_DISK_TYPES
+
+
+def _natural_key(text: str) -> List[str | int]:
+    """Sort key to order names by their numbers, eg: ``sda2`` before ``sda10``."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", text)]
+
+
+def _device_number_key(device_number: str) -> Tuple[int, int]:
+    """Sort key to list the block devices in the order of their device numbers, like lsblk."""
+    major, _, minor = device_number.partition(":")
+    return int(major or 0), int(minor or 0)
+
+
+def read_mountpoints(mountinfo: str | os.PathLike = MOUNTINFO) -> Dict[str, str]:
+    """Reads the mountinfo file into the mountpoint of each device number, empty when it can't be read."""
+    return _mountpoints(_read_mountinfo(mountinfo))
+
+
+def sysfs_disk(
+    device_path: str | os.PathLike,
+    name: str,
+    device_number: str,
+    mountpoints: Dict[str, str],
+) -> Dict[str, str]:
+    """Get a disk's information from its directory in sysfs.
+
+    Args:
+        device_path: Path to the block device in sysfs.
+        name: Name of the block device.
+        device_number: Device number of the block device as ``major:minor``.
+        mountpoints: Mountpoint of each device number and device node.
+
+    Raises:
+        FileNotFoundError:
+        When the device is removed while being read.
+
+    Returns:
+        Dict[str, str]:
+        Returns the disk's information.
+    """
+    size = exact_size(device_path) or 0
+    disk_info = {
+        "device_id": name,
+        "size": squire.size_converter(size),
+        "size_bytes": size,
+        "name": squire.read_attribute(os.path.join(device_path, "device", "model")),
+        "mountpoints": [],
+    }
+    # Collect mount points from partitions
+    with os.scandir(device_path) as entries:
+        partitions = sorted(
+            (
+                entry.path
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and os.path.isfile(os.path.join(entry.path, "partition"))
+            ),
+            key=_natural_key,
+        )
+    for partition in partitions:
+        partition_number = squire.read_attribute(os.path.join(partition, "dev"))
+        if mountpoint := mountpoints.get(partition_number) or mountpoints.get(
+            f"/dev/{os.path.basename(partition)}"
+        ):
+            disk_info["mountpoints"].append(mountpoint)
+    if not disk_info["mountpoints"] and (
+        mountpoint := mountpoints.get(device_number) or mountpoints.get(f"/dev/{name}")
+    ):
+        disk_info["mountpoints"] = [mountpoint]
+    return disk_info
+
+
+def sysfs_drive_info(
+    sys_block: str | os.PathLike, mountinfo: str | os.PathLike = MOUNTINFO
+) -> List[Dict[str, str]]:
+    """Get disks attached to Linux devices by reading sysfs, without spawning lsblk.
+
+    Args:
+        sys_block: Path to the block devices' directory in sysfs.
+        mountinfo: Path to the mountinfo file to resolve the mountpoints.
+
+    Returns:
+        List[Dict[str, str]]:
+        Returns disks information for Linux distros.
+    """
+    mountpoints = read_mountpoints(mountinfo)
+    devices = {}
+    for name in os.listdir(sys_block):
+        device_path = os.path.join(sys_block, name)
+        device_number = squire.read_attribute(os.path.join(device_path, "dev")) or ""
+        if is_disk(device_path, name, device_number):
+            devices[device_number] = (device_path, name)
+    disks = []
+    for device_number in sorted(devices, key=_device_number_key):
+        try:
+            disks.append(
+                sysfs_disk(*devices[device_number], device_number, mountpoints)
+            )
+        except FileNotFoundError as error:
+            # Devices can be removed between the listing and the scan of their partitions
+            LOGGER.debug(error)
+    return disks
@@ -1,12 +1,11 @@
 import logging
 import os
 import re
-import subprocess
 from collections import defaultdict
 from collections.abc import Generator
 from typing import Dict, List
 
-from pyarchitecture import squire
+from pyarchitecture import runner, squire
 
 LOGGER = logging.getLogger(__name__)
 
@@ -81,18 +80,27 @@ def parse_diskutil_output(stdout: str) -> List[Dict[str, str]]:
     return disks
 
 
-def base_physical_device_id(disk_lib: str | os.PathLike) -> Generator[str]:
-    """Get base physical device IDs for macOS devices.
+def info_command(disk_lib: str | os.PathLike) -> List[str]:
+    """Command to get information about all the disks on macOS devices."""
+    return [disk_lib, "info", "-all"]
+
+
+def list_command(disk_lib: str | os.PathLike) -> List[str]:
+    """Command to list all the disks on macOS devices."""
+    return [disk_lib, "list"]
+
+
+def parse_physical_device_ids(stdout: str) -> Generator[str]:
+    """Parses `diskutil list` output into base physical device IDs.
 
     Args:
-        disk_lib: Disk library path.
+        stdout: Standard output from diskutil command.
 
     Yields:
         str:
         Yields base physical device IDs.
     """
-    result = subprocess.run([disk_lib, "list"], capture_output=True, text=True)
-    for line in result.stdout.splitlines():
+    for line in stdout.splitlines():
         if (
             (line := line.strip())
             and "physical" in line
@@ -101,28 +109,44 @@ def base_physical_device_id(disk_lib: str | os.PathLike) -> Generator[str]:
             yield line.split()[0]
 
 
-def drive_info(disk_lib: str | os.PathLike) -> List[Dict[str, str | List[str]]]:
-    """Get disks attached to macOS devices.
+def base_physical_device_id(disk_lib: str | os.PathLike) -> Generator[str]:
+    """Get base physical device IDs for macOS devices.
+
+    Args:
+        disk_lib: Disk library path.
+
+    Yields:
+        str:
+        Yields base physical device IDs.
+    """
+    yield from parse_physical_device_ids(runner.run(list_command(disk_lib)).stdout)
+
+
+def parse_drive_info(
+    info_stdout: str, list_stdout: str
+) -> List[Dict[str, str | List[str]]]:
+    """Parses the output from `diskutil info -all` and `diskutil list` into disks information.
+
+    Args:
+        info_stdout: Standard output from diskutil info command.
+        list_stdout: Standard output from diskutil list command.
 
     Returns:
         List[Dict[str, str | List[str]]]:
         Returns disks information for macOS devices.
     """
-    all_disk_info = subprocess.run(
-        [disk_lib, "info", "-all"], capture_output=True, text=True
-    )
-    all_disks = parse_diskutil_output(all_disk_info.stdout)
+    all_disks = parse_diskutil_output(info_stdout)
     device_ids = defaultdict(list)
     physical_disks = []
-    physical_disk_ids = list(base_physical_device_id(disk_lib))
+    physical_disk_ids = list(parse_physical_device_ids(list_stdout))
     for disk in all_disks:
         if disk.get("Virtual") == "No" or disk.get("Device Node") in physical_disk_ids:
+            size = parse_size(disk.get("Disk Size", ""))
             physical_disks.append(
                 {
                     "name": disk.get("Device / Media Name"),
-                    "size": squire.size_converter(
-                        parse_size(disk.get("Disk Size", ""))
-                    ),
+                    "size": squire.size_converter(size),
+                    "size_bytes": size,
                     "device_id": disk.get("Device Identifier"),
                     "node": disk.get("Device Node"),
                 }
@@ -133,3 +157,15 @@ def drive_info(disk_lib: str | os.PathLike) -> List[Dict[str, str | List[str]]]:
     for disk in physical_disks:
         disk["mountpoints"] = mountpoints[disk["device_id"]]
     return physical_disks
+
+
+def drive_info(disk_lib: str | os.PathLike) -> List[Dict[str, str | List[str]]]:
+    """Get disks attached to macOS devices.
+
+    Returns:
+        List[Dict[str, str | List[str]]]:
+        Returns disks information for macOS devices.
+    """
+    all_disk_info = runner.run(info_command(disk_lib))
+    physical_disks = runner.run(list_command(disk_lib))
+    return parse_drive_info(all_disk_info.stdout, physical_disks.stdout)
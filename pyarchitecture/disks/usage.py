@@ -0,0 +1,198 @@
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, Iterable
+
+from pyarchitecture import config
+
+LOGGER = logging.getLogger(__name__)
+
+# Timeout in seconds for the usage of each mountpoint, counted from when its filesystem starts being queried
+TIMEOUT = 2.0
+MAX_WORKERS = 8
+
+
+def filesystem_usage(mountpoint: str) -> Dict[str, int]:
+    """Get the space and inode usage of the filesystem mounted at a path.
+
+    Args:
+        mountpoint: Path where the filesystem is mounted.
+
+    Returns:
+        Dict[str, int]:
+        Returns the total, used and free bytes, along with the total, used and free inodes where available.
+    """
+    if not hasattr(os, "statvfs"):
+        # Windows has no statvfs, or inodes
+        total, used, free = shutil.disk_usage(mountpoint)
+        return dict(total=total, used=used, free=free)
+    stat = os.statvfs(mountpoint)
+    # Free space and inodes are the ones available to unprivileged users, like df
+    return dict(
+        total=stat.f_blocks * stat.f_frsize,
+        used=(stat.f_blocks - stat.f_bfree) * stat.f_frsize,
+        free=stat.f_bavail * stat.f_frsize,
+        inodes_total=stat.f_files,
+        inodes_used=stat.f_files - stat.f_ffree,
+        inodes_free=stat.f_favail,
+    )
+
+
+class Pool:
+    """Bounded pool of daemon threads to query the filesystems, so a dead mount never blocks the caller.
+
+    >>> Pool
+
+    A worker stuck on a dead mount is left behind, and the mount is not queried again until it returns.
+    Stuck workers don't count towards the limit, so they are replaced and never starve the healthy mounts.
+    Being daemon threads, stuck workers don't block the interpreter from exiting either.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS, stuck_after: float = TIMEOUT):
+        self.max_workers = max_workers
+        self.stuck_after = stuck_after
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        # Filesystems being queried, and when their query started
+        self._running: Dict[str, float] = {}
+        self._workers = 0
+
+    def _stuck(self) -> int:
+        """Get the number of workers querying a filesystem for longer than ``stuck_after``, with the lock held."""
+        now = time.monotonic()
+        return sum(now - start >= self.stuck_after for start in self._running.values())
+
+    def _replenish(self) -> None:
+        """Starts workers for the queued filesystems, with the lock held."""
+        idle = self._workers - len(self._running)
+        queued = len(self._pending) - len(self._running)
+        stuck = self._stuck()
+        while idle < queued and self._workers - stuck < self.max_workers:
+            self._workers += 1
+            idle += 1
+            threading.Thread(target=self._work, daemon=True).start()
+
+    def _work(self) -> None:
+        """Queries the queued mountpoints, until the worker is no longer needed."""
+        while True:
+            key, mountpoint, future = self._queue.get()
+            with self._lock:
+                self._running[key] = time.monotonic()
+            try:
+                future.set_result(filesystem_usage(mountpoint))
+            except OSError as error:
+                future.set_exception(error)
+            finally:
+                with self._lock:
+                    self._pending.pop(key, None)
+                    self._running.pop(key, None)
+                    # Replaced while stuck, so the surplus exits once its filesystem returns
+                    if self._workers - self._stuck() > self.max_workers:
+                        self._workers -= 1
+                        return
+
+    def submit(self, key: str, mountpoint: str) -> Future:
+        """Queues a mountpoint, or returns the pending query for the same filesystem.
+
+        Args:
+            key: Identifier of the filesystem, shared by its bind mounts.
+            mountpoint: Path where the filesystem is mounted.
+
+        Returns:
+            Future:
+            Returns a future for the filesystem's usage.
+        """
+        with self._lock:
+            if (future := self._pending.get(key)) is not None:
+                return future
+            future = self._pending[key] = Future()
+            self._replenish()
+        self._queue.put((key, mountpoint, future))
+        return future
+
+    def result(self, key: str, future: Future, timeout: float) -> Dict[str, int]:
+        """Waits for the usage of a filesystem, up to the timeout from when its query started.
+
+        Args:
+            key: Identifier of the filesystem.
+            future: Future returned when submitting the filesystem.
+            timeout: Timeout in seconds, not counting the time spent queued.
+
+        Raises:
+            concurrent.futures.TimeoutError:
+            When the query doesn't finish in time, or is still stuck from a previous call.
+
+        Returns:
+            Dict[str, int]:
+            Returns the usage of the filesystem.
+        """
+        while True:
+            with self._lock:
+                started = self._running.get(key)
+                # Workers that got stuck since the filesystem was queued are replaced
+                self._replenish()
+            if started is None:
+                remaining = timeout
+            else:
+                remaining = max(started + timeout - time.monotonic(), 0)
+            try:
+                return future.result(remaining)
+            except FutureTimeoutError:
+                if started is not None:
+                    raise
+
+
+POOL = Pool()
+
+
+def _filesystem_keys(mountpoints: Iterable[str]) -> Dict[str, str]:
+    """Get an identifier of the filesystem behind each mountpoint, so bind mounts are queried only once.
+
+    On Linux, the device numbers are read from mountinfo, since a stat on a dead mount would hang as well.
+    """
+    if config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+        from pyarchitecture.disks import linux
+
+        devices = linux.mount_devices()
+        return {
+            mountpoint: devices.get(mountpoint, mountpoint)
+            for mountpoint in mountpoints
+        }
+    return {mountpoint: mountpoint for mountpoint in mountpoints}
+
+
+def get_usage(
+    mountpoints: Iterable[str], timeout: float = TIMEOUT
+) -> Dict[str, Dict[str, int] | None]:
+    """Get the usage of each mountpoint, querying the filesystems in parallel.
+
+    Args:
+        mountpoints: Paths where the filesystems are mounted.
+        timeout: Timeout in seconds for each mountpoint, not counting the time it is queued behind the others.
+
+    Returns:
+        Dict[str, Dict[str, int] | None]:
+        Returns the usage of each mountpoint, ``None`` for the ones that are unavailable or didn't respond in time.
+    """
+    keys = _filesystem_keys(dict.fromkeys(mountpoints))
+    futures = {key: None for key in keys.values()}
+    for mountpoint, key in keys.items():
+        if futures[key] is None:
+            futures[key] = POOL.submit(key, mountpoint)
+    usage = {}
+    for mountpoint, key in keys.items():
+        try:
+            usage[mountpoint] = POOL.result(key, futures[key], timeout)
+        except FutureTimeoutError:
+            LOGGER.warning(f"Usage of {mountpoint!r} timed out after {timeout} seconds")
+            usage[mountpoint] = None
+        except OSError as error:
+            LOGGER.warning(f"Usage of {mountpoint!r} is unavailable: {error}")
+            usage[mountpoint] = None
+    return usage
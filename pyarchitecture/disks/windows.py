@@ -3,13 +3,29 @@ import json
 import logging
 import os
 import re
-import subprocess
 from typing import Dict, List, Tuple
 
-from pyarchitecture import squire
+from pyarchitecture import runner, squire
 
 LOGGER = logging.getLogger(__name__)
 
+# noinspection LongLine
+DRIVES_COMMAND = "Get-CimInstance Win32_DiskDrive | Select-Object Caption, DeviceID, Model, Partitions, Size | ConvertTo-Json"  # noqa: E501
+PARTITIONS_COMMAND = """
+        Get-PhysicalDisk | ForEach-Object {
+            $disk = $_
+            $partitions = Get-Partition -DiskNumber $disk.DeviceID
+            $partitions | ForEach-Object {
+                [PSCustomObject]@{
+                    DiskNumber = $disk.DeviceID
+                    Partition = $_.PartitionNumber
+                    DriveLetter = (Get-Volume -Partition $_).DriveLetter
+                    MountPoint = (Get-Volume -Partition $_).DriveLetter
+                }
+            }
+        }
+        """
+
 
 def reformat_windows(data: Dict[str, str | int | float]) -> Dict[str, str]:
     """Reformats each drive's information for Windows OS.
@@ -25,6 +41,7 @@ def reformat_windows(data: Dict[str, str | int | float]) -> Dict[str, str]:
     data["name"] = data["Model"]
     data["device_id"] = data["DeviceID"].replace("\\", "").replace(".", "")
     data["size"] = squire.size_converter(data["Size"])
+    data["size_bytes"] = data["Size"]
     data.pop("Caption", None)
     data.pop("Model", None)
     data.pop("DeviceID", None)
@@ -33,24 +50,37 @@ def reformat_windows(data: Dict[str, str | int | float]) -> Dict[str, str]:
     return data
 
 
-def get_drives(disk_lib: str | os.PathLike) -> List[Dict[str, str | List[str]]]:
-    """Get physical drives connected to a Windows machine.
+def drives_command(disk_lib: str | os.PathLike) -> List[str]:
+    """Powershell Core command to get physical drives connected to a Windows machine."""
+    return [disk_lib, "-Command", DRIVES_COMMAND]
+
+
+def parse_drives(stdout: str) -> List[Dict[str, str | List[str]]]:
+    """Parses the JSON output of physical drives connected to a Windows machine.
+
+    Args:
+        stdout: Standard output from the powershell command.
 
     Returns:
         List[Dict[str, str | List[str]]]:
         Returns the formatted data for all the drives as a list of key-value pairs.
     """
-    # noinspection LongLine
-    ps_command = "Get-CimInstance Win32_DiskDrive | Select-Object Caption, DeviceID, Model, Partitions, Size | ConvertTo-Json"  # noqa: E501
-    result = subprocess.run(
-        [disk_lib, "-Command", ps_command], capture_output=True, text=True
-    )
-    disks_info = json.loads(result.stdout)
+    disks_info = json.loads(stdout)
     if isinstance(disks_info, list):
         return [reformat_windows(info) for info in disks_info]
     return [reformat_windows(disks_info)]
 
 
+def get_drives(disk_lib: str | os.PathLike) -> List[Dict[str, str | List[str]]]:
+    """Get physical drives connected to a Windows machine.
+
+    Returns:
+        List[Dict[str, str | List[str]]]:
+        Returns the formatted data for all the drives as a list of key-value pairs.
+    """
+    return parse_drives(runner.run(drives_command(disk_lib)).stdout)
+
+
 def clean_ansi_escape_sequences(text: str) -> str:
     """Regular expression to remove ANSI escape sequences.
 
@@ -65,45 +95,23 @@ def clean_ansi_escape_sequences(text: str) -> str:
     return ansi_escape.sub("", text)
 
 
-def get_physical_disks_and_partitions(
-    disk_lib: str | os.PathLike,
-) -> List[Tuple[str, str, str]]:
-    """Powershell Core command to get physical disks and their partitions with drive letters (mount points).
+def partitions_command(disk_lib: str | os.PathLike) -> List[str]:
+    """Powershell Core command to get physical disks and their partitions with drive letters (mount points)."""
+    return [disk_lib, "-Command", PARTITIONS_COMMAND]
+
+
+def parse_physical_disks_and_partitions(stdout: str) -> List[Tuple[str, str, str]]:
+    """Parses the physical disks and their partitions from the powershell output.
+
+    Args:
+        stdout: Standard output from the powershell command.
 
     Returns:
         List[Tuple[str, str, str]]:
         List of tuples with disk_number, partition_number, mount_point.
     """
-    command_ps = [
-        disk_lib,
-        "-Command",
-        """
-        Get-PhysicalDisk | ForEach-Object {
-            $disk = $_
-            $partitions = Get-Partition -DiskNumber $disk.DeviceID
-            $partitions | ForEach-Object {
-                [PSCustomObject]@{
-                    DiskNumber = $disk.DeviceID
-                    Partition = $_.PartitionNumber
-                    DriveLetter = (Get-Volume -Partition $_).DriveLetter
-                    MountPoint = (Get-Volume -Partition $_).DriveLetter
-                }
-            }
-        }
-        """,
-    ]
-
-    # Run the PowerShell command using subprocess.run
-    result = subprocess.run(
-        command_ps, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-    )
-
-    if result.stderr:
-        LOGGER.error(result.stderr)
-        return []
-
     # Clean the output to remove ANSI escape sequences
-    cleaned_output = clean_ansi_escape_sequences(result.stdout)
+    cleaned_output = clean_ansi_escape_sequences(stdout)
 
     # Parse the output to get disk and partition info
     disks_and_partitions = []
@@ -125,15 +133,36 @@ def get_physical_disks_and_partitions(
     return disks_and_partitions
 
 
-def get_disk_usage(disk_lib: str | os.PathLike) -> Dict[str, List[str]]:
-    """Get all physical disks and their partitions with mount points.
+def get_physical_disks_and_partitions(
+    disk_lib: str | os.PathLike,
+) -> List[Tuple[str, str, str]]:
+    """Powershell Core command to get physical disks and their partitions with drive letters (mount points).
+
+    Returns:
+        List[Tuple[str, str, str]]:
+        List of tuples with disk_number, partition_number, mount_point.
+    """
+    result = runner.run(partitions_command(disk_lib))
+
+    if result.stderr:
+        LOGGER.error(result.stderr)
+        return []
+
+    return parse_physical_disks_and_partitions(result.stdout)
+
+
+def map_disk_usage(
+    disks_and_partitions: List[Tuple[str, str, str]],
+) -> Dict[str, List[str]]:
+    """Maps the partitions' mount points to their physical disks.
+
+    Args:
+        disks_and_partitions: List of tuples with disk_number, partition_number, mount_point.
 
     Returns:
         Dict[str, List[str]]:
         Returns a dictionary of DeviceID as key and mount paths as value.
     """
-    disks_and_partitions = get_physical_disks_and_partitions(disk_lib)
-
     if not disks_and_partitions:
         LOGGER.error("No disks or partitions found.")
         return {}
@@ -147,17 +176,41 @@ def get_disk_usage(disk_lib: str | os.PathLike) -> Dict[str, List[str]]:
     return output_data
 
 
-def drive_info(disk_lib: str | os.PathLike) -> List[Dict[str, str | List[str]]]:
-    """Get disks attached to Windows devices.
+def get_disk_usage(disk_lib: str | os.PathLike) -> Dict[str, List[str]]:
+    """Get all physical disks and their partitions with mount points.
+
+    Returns:
+        Dict[str, List[str]]:
+        Returns a dictionary of DeviceID as key and mount paths as value.
+    """
+    return map_disk_usage(get_physical_disks_and_partitions(disk_lib))
+
+
+def merge_drive_info(
+    data: List[Dict[str, str | List[str]]], usage: Dict[str, List[str]]
+) -> List[Dict[str, str | List[str]]]:
+    """Merges the mount points into each drive's information.
+
+    Args:
+        data: Formatted data for all the drives.
+        usage: Dictionary of DeviceID as key and mount paths as value.
 
     Returns:
         List[Dict[str, str | List[str]]]
         Returns disks information for Windows machines.
     """
-    data = get_drives(disk_lib)
-    usage = get_disk_usage(disk_lib)
     for item in data:
         device_id = item["id"]
         item.pop("id")
         item["mountpoints"] = usage.get(device_id, [])
     return data
+
+
+def drive_info(disk_lib: str | os.PathLike) -> List[Dict[str, str | List[str]]]:
+    """Get disks attached to Windows devices.
+
+    Returns:
+        List[Dict[str, str | List[str]]]
+        Returns disks information for Windows machines.
+    """
+    return merge_drive_info(get_drives(disk_lib), get_disk_usage(disk_lib))
@@ -0,0 +1,190 @@
+import logging
+from typing import Any, Dict, List
+
+from pyarchitecture import config, cpu, disks, memory
+
+LOGGER = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = "pyarchitecture"
+
+
+def escape(value: Any) -> str:
+    """Escapes a label value for the text exposition format.
+
+    Args:
+        value: Label value.
+
+    Returns:
+        str:
+        Returns the value with backslashes, double quotes and newlines escaped.
+    """
+    return (
+        str(value if value is not None else "")
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def header(name: str, metric_type: str, description: str) -> str:
+    """Renders the ``# HELP`` and ``# TYPE`` lines of a metric.
+
+    Args:
+        name: Name of the metric.
+        metric_type: Type of the metric, eg: ``gauge`` or ``counter``.
+        description: Help text of the metric.
+
+    Returns:
+        str:
+        Returns the header lines.
+    """
+    return f"# HELP {name} {description}\n# TYPE {name} {metric_type}\n"
+
+
+def series(name: str, **labels: Any) -> str:
+    """Renders a series' name and label set, up to the space before its value.
+
+    Args:
+        name: Name of the metric.
+        labels: Label names and values.
+
+    Returns:
+        str:
+        Returns the series prefix, eg: ``name{label="value"} ``
+    """
+    if not labels:
+        return f"{name} "
+    rendered = ",".join(f'{key}="{escape(label)}"' for key, label in labels.items())
+    return f"{name}{{{rendered}}} "
+
+
+def value(number: int | float | None) -> str:
+    """Renders a sample's value, with ``NaN`` for missing values."""
+    if number is None:
+        return "NaN"
+    return str(number) if isinstance(number, int) else repr(float(number))
+
+
+CPU_INFO = f"{PREFIX}_cpu_info"
+CPU_USAGE = f"{PREFIX}_cpu_usage_percent"
+DISK_SIZE = f"{PREFIX}_disk_size_bytes"
+DISK_MOUNT = f"{PREFIX}_disk_mount_info"
+HEADERS = {
+    CPU_INFO: header(CPU_INFO, "gauge", "Processor model, always 1."),
+    CPU_USAGE: header(
+        CPU_USAGE, "gauge", "CPU utilization by mode since the previous scrape."
+    ),
+    DISK_SIZE: header(DISK_SIZE, "gauge", "Size of the physical disk in bytes."),
+    DISK_MOUNT: header(
+        DISK_MOUNT, "gauge", "Mountpoints of the physical disk, always 1."
+    ),
+}
+
+
+class Exporter:
+    """Renders the collectors in the Prometheus text exposition format.
+
+    >>> Exporter
+
+    Headers and label sets are rendered once, and only the values are rendered on each scrape.
+    Blocks for the static components are reused until their cached collectors return a new result.
+    """
+
+    def __init__(self, cpu_usage: bool = True):
+        self._static: Dict[str, tuple] = {}
+        self._memory_series: Dict[str, str] = {}
+        self._usage_series: Dict[tuple, str] = {}
+        self._sampler = None
+        if cpu_usage and config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+            self._sampler = cpu.get_usage_sampler()
+
+    def _reuse(self, component: str, source: Any) -> str | None:
+        """Get the rendered block of a static component, when the collector returned an equal result."""
+        # Compared by value, since the cache hands out a copy on every call
+        if (entry := self._static.get(component)) and entry[0] == source:
+            return entry[1]
+
+    def _cpu(self) -> str:
+        """Renders the processor's model."""
+        model = cpu.get_cpu_info()
+        if (block := self._reuse("cpu", model)) is None:
+            block = HEADERS[CPU_INFO] + series(CPU_INFO, model=model) + "1\n"
+            self._static["cpu"] = (model, block)
+        return block
+
+    def _cpu_usage(self) -> str:
+        """Renders the CPU utilization since the previous scrape."""
+        if not self._sampler:
+            return ""
+        lines = [HEADERS[CPU_USAGE]]
+        for name, modes in self._sampler.sample().items():
+            for mode, percent in modes.items():
+                if (prefix := self._usage_series.get((name, mode))) is None:
+                    prefix = self._usage_series[(name, mode)] = series(
+                        CPU_USAGE, cpu=name, mode=mode
+                    )
+                lines.append(f"{prefix}{value(percent)}\n")
+        return "".join(lines)
+
+    def _memory(self) -> str:
+        """Renders the memory information in bytes."""
+        lines = []
+        for key, number in (memory.get_memory_info(humanize=False) or {}).items():
+            if (prefix := self._memory_series.get(key)) is None:
+                name = f"{PREFIX}_memory_{key}_bytes"
+                description = f"{key.replace('_', ' ').capitalize()} memory in bytes."
+                prefix = self._memory_series[key] = header(
+                    name, "gauge", description
+                ) + series(name)
+            lines.append(f"{prefix}{value(number)}\n")
+        return "".join(lines)
+
+    def _disks(self) -> str:
+        """Renders the size and mountpoints of the physical disks."""
+        all_disks = disks.get_all_disks()
+        if (block := self._reuse("disks", all_disks)) is None:
+            sizes: List[str] = [HEADERS[DISK_SIZE]]
+            mounts: List[str] = [HEADERS[DISK_MOUNT]]
+            for disk in all_disks or []:
+                # Exact size from the backend, since the humanized size is rounded
+                size = disk.get("size_bytes")
+                sizes.append(
+                    series(DISK_SIZE, device_id=disk["device_id"], model=disk["name"])
+                    + f"{value(size)}\n"
+                )
+                for mountpoint in disk["mountpoints"]:
+                    mounts.append(
+                        series(
+                            DISK_MOUNT,
+                            device_id=disk["device_id"],
+                            mountpoint=mountpoint,
+                        )
+                        + "1\n"
+                    )
+            block = "".join(sizes + mounts)
+            self._static["disks"] = (all_disks, block)
+        return block
+
+    def render(self) -> str:
+        """Renders all the metrics, skipping the collectors that fail.
+
+        Returns:
+            str:
+            Returns the metrics in the text exposition format.
+        """
+        blocks = []
+        for render in (self._cpu, self._cpu_usage, self._memory, self._disks):
+            try:
+                blocks.append(render())
+            except Exception as error:
+                LOGGER.error(
+                    f"Failed to render {render.__name__[1:]} metrics: {error!r}"
+                )
+        return "".join(blocks)
+
+    def close(self) -> None:
+        """Closes the CPU usage sampler."""
+        if self._sampler:
+            self._sampler.close()
+            self._sampler = None
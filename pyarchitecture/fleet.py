@@ -0,0 +1,253 @@
+import functools
+import json
+import logging
+import math
+import multiprocessing
+import os
+from collections import Counter
+from collections.abc import Generator
+from typing import Any, Dict, Iterable, List
+
+from pyarchitecture import squire
+
+LOGGER = logging.getLogger(__name__)
+
+# Number of snapshot files handed to a worker at a time, large enough to amortize the IPC for each batch
+BATCH_SIZE = 256
+
+
+@functools.lru_cache(maxsize=4096)
+def to_bytes(size: str) -> int | None:
+    """Converts a humanized size back to bytes, memoized since the same sizes repeat across a fleet.
+
+    Args:
+        size: Humanized size, eg: ``1.82 TB`` or ``256G``.
+
+    Returns:
+        int:
+        Returns the size in bytes, or ``None`` when it can't be parsed.
+    """
+    try:
+        return squire.convert_to_bytes(size)
+    except (ValueError, IndexError, AttributeError):
+        return
+
+
+def size_bucket(size: int) -> int:
+    """Rounds a size to two significant decimal digits, the way drives are marketed.
+
+    Binary sizes of the same drive (eg: 1.82 TiB for 2 TB) land in the same bucket, while drives of different
+    marketed sizes (eg: 2, 3 and 4 TB) stay apart.
+    """
+    if size <= 0:
+        return 0
+    return round(size, 1 - math.floor(math.log10(size)))
+
+
+def decimal_size(size: int) -> str:
+    """Formats a size bucket in decimal units, eg: ``3 TB`` for 3,000,000,000,000 bytes."""
+    units = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
+    index = min(int(math.log10(size) // 3), len(units) - 1) if size > 0 else 0
+    return f"{squire.format_nos(round(size / 1000**index, 2))} {units[index]}"
+
+
+def empty() -> Dict[str, Any]:
+    """Get an empty aggregate, which is also the partial aggregate of each batch."""
+    return dict(
+        hosts=0,
+        errors=0,
+        gpu_models=Counter(),
+        disk_sizes=Counter(),
+        # CPU model -> [hosts, total memory, smallest memory, largest memory]
+        memory_by_cpu={},
+    )
+
+
+def add(aggregate: Dict[str, Any], snapshot: Dict[str, Any]) -> None:
+    """Adds a host's snapshot to an aggregate.
+
+    Args:
+        aggregate: Aggregate to update in place.
+        snapshot: Information stored by the ``save`` command.
+
+    Raises:
+        TypeError:
+        When the snapshot is not a dictionary, leaving the aggregate untouched.
+    """
+    if not isinstance(snapshot, dict):
+        raise TypeError(f"snapshot must be a dict, received {type(snapshot).__name__}")
+    # Built apart and merged once complete, so a malformed snapshot is never partially counted
+    host = empty()
+    host["hosts"] = 1
+    for gpu in snapshot.get("GPU") or []:
+        host["gpu_models"][gpu.get("model")] += 1
+    for disk in snapshot.get("Disks") or []:
+        if (size := to_bytes(disk.get("size") or "")) is not None:
+            host["disk_sizes"][size_bucket(size)] += 1
+    total = (snapshot.get("Memory") or {}).get("total")
+    # Snapshots saved without humanizing have the sizes in bytes already
+    if isinstance(total, str):
+        total = to_bytes(total)
+    if isinstance(total, int):
+        host["memory_by_cpu"][snapshot.get("CPU")] = [1, total, total, total]
+    merge(aggregate, host)
+
+
+def merge(aggregate: Dict[str, Any], partial: Dict[str, Any]) -> Dict[str, Any]:
+    """Merges a partial aggregate into an aggregate.
+
+    Args:
+        aggregate: Aggregate to update in place.
+        partial: Partial aggregate of a batch.
+
+    Returns:
+        Dict[str, Any]:
+        Returns the updated aggregate.
+    """
+    aggregate["hosts"] += partial["hosts"]
+    aggregate["errors"] += partial["errors"]
+    aggregate["gpu_models"].update(partial["gpu_models"])
+    aggregate["disk_sizes"].update(partial["disk_sizes"])
+    for cpu, (hosts, total, smallest, largest) in partial["memory_by_cpu"].items():
+        if (entry := aggregate["memory_by_cpu"].get(cpu)) is None:
+            aggregate["memory_by_cpu"][cpu] = [hosts, total, smallest, largest]
+            continue
+        entry[0] += hosts
+        entry[1] += total
+        entry[2] = min(entry[2], smallest)
+        entry[3] = max(entry[3], largest)
+    return aggregate
+
+
+def aggregate_batch(filenames: List[str]) -> Dict[str, Any]:
+    """Aggregates a batch of snapshot files, parsing one file at a time.
+
+    Args:
+        filenames: Paths of the snapshot files.
+
+    Returns:
+        Dict[str, Any]:
+        Returns the partial aggregate of the batch.
+    """
+    partial = empty()
+    for filename in filenames:
+        try:
+            with open(filename) as file:
+                snapshot = json.load(file)
+            add(partial, snapshot)
+        except (OSError, ValueError, TypeError, AttributeError) as error:
+            LOGGER.debug(f"Failed to aggregate {filename!r}: {error}")
+            partial["errors"] += 1
+    return partial
+
+
+def snapshot_files(directory: str | os.PathLike) -> Generator[str]:
+    """Walks a directory for the JSON snapshot files, lazily.
+
+    Args:
+        directory: Directory with the saved snapshots, including sub-directories.
+
+    Yields:
+        str:
+        Yields the path of each snapshot file.
+    """
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            if filename.endswith(".json"):
+                yield os.path.join(root, filename)
+
+
+def batches(filenames: Iterable[str], size: int = BATCH_SIZE) -> Generator[List[str]]:
+    """Groups the filenames into batches, without materializing the whole listing."""
+    batch = []
+    for filename in filenames:
+        batch.append(filename)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def aggregate(
+    directory: str | os.PathLike, processes: int = None, batch_size: int = BATCH_SIZE
+) -> Dict[str, Any]:
+    """Aggregates a directory of saved snapshots, streaming batches of files through a pool of processes.
+
+    Args:
+        directory: Directory with the saved snapshots.
+        processes: Number of worker processes, defaults to the number of CPUs, ``1`` to aggregate in process.
+        batch_size: Number of files handed to a worker at a time.
+
+    Returns:
+        Dict[str, Any]:
+        Returns the number of hosts and unreadable files, along with the GPU models, disk sizes and memory by CPU.
+    """
+    result = empty()
+    work = batches(snapshot_files(directory), batch_size)
+    if processes == 1:
+        for batch in work:
+            merge(result, aggregate_batch(batch))
+        return result
+    with multiprocessing.Pool(processes) as pool:
+        for partial in pool.imap_unordered(aggregate_batch, work):
+            merge(result, partial)
+    return result
+
+
+def summarize(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarizes an aggregate into tables, with humanized sizes.
+
+    Args:
+        result: Aggregate of the fleet.
+
+    Returns:
+        Dict[str, Any]:
+        Returns the host counts, and the rows of the GPU models, disk sizes and memory by CPU tables.
+    """
+    return dict(
+        hosts=result["hosts"],
+        errors=result["errors"],
+        gpu_models=[
+            dict(model=model, count=count)
+            for model, count in result["gpu_models"].most_common()
+        ],
+        disk_sizes=[
+            dict(size=decimal_size(size), count=count)
+            for size, count in sorted(result["disk_sizes"].items())
+        ],
+        memory_by_cpu=[
+            dict(
+                cpu=cpu,
+                hosts=hosts,
+                total=squire.size_converter(total),
+                average=squire.size_converter(total / hosts),
+                smallest=squire.size_converter(smallest),
+                largest=squire.size_converter(largest),
+            )
+            for cpu, (hosts, total, smallest, largest) in sorted(
+                result["memory_by_cpu"].items(), key=lambda item: -item[1][0]
+            )
+        ],
+    )
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    """Formats the rows of a summary table as aligned plain text columns.
+
+    Args:
+        rows: Rows of the table, with the same keys in each row.
+
+    Returns:
+        str:
+        Returns the table with a header line.
+    """
+    if not rows:
+        return "(none)"
+    headers = list(rows[0])
+    cells = [headers] + [[str(row[header]) for header in headers] for row in rows]
+    widths = [max(len(line[index]) for line in cells) for index in range(len(headers))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip()
+        for line in cells
+    )
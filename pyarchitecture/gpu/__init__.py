@@ -2,7 +2,7 @@ import logging
 import os
 from typing import Dict, List
 
-from pyarchitecture import config
+from pyarchitecture import cache, config, registry
 from pyarchitecture.gpu import main
 
 LOGGER = logging.getLogger(__name__)
@@ -18,21 +18,43 @@ def _get_gpu_lib(user_input: str | os.PathLike) -> str:
         user_input
         or os.environ.get("gpu_lib")
         or os.environ.get("GPU_LIB")
-        or config.default_gpu_lib()[config.OPERATING_SYSTEM]
+        or registry.library("gpu")
     )
 
 
-def get_gpu_info(gpu_lib: str | os.PathLike = None) -> List[Dict[str, str]]:
-    """OS-agnostic function to get all GPUs connected to the host system.
+def _get_gpu_info(library_path: str | os.PathLike) -> List[Dict[str, str]]:
+    """Get the GPU model and vendor information using the resolved library path.
 
     Args:
-        gpu_lib: Custom GPU library path.
+        library_path: GPU library path.
 
     Returns:
         List[Dict[str, str]]:
         Returns the GPU model and vendor information as a list of key-value pairs.
     """
-    library_path = _get_gpu_lib(gpu_lib)
+    if config.OPERATING_SYSTEM == config.OperatingSystem.linux and os.path.isdir(
+        library_path
+    ):
+        # pci.ids is only indexed when sysfs is used, so the module is imported on demand
+        from pyarchitecture.gpu import pci
+
+        return pci.get_names(library_path)
     if os.path.isfile(library_path):
         return main.get_names(library_path)
     LOGGER.error(f"GPU library {library_path!r} doesn't exist")
+
+
+def get_gpu_info(gpu_lib: str | os.PathLike = None) -> List[Dict[str, str]]:
+    """OS-agnostic function to get all GPUs connected to the host system.
+
+    Args:
+        gpu_lib: Custom GPU library path, or the ``/sys/bus/pci/devices`` directory to read sysfs on Linux.
+
+    See Also:
+        - The result is cached per library path, use ``pyarchitecture.cache.invalidate("gpu")`` to drop it.
+
+    Returns:
+        List[Dict[str, str]]:
+        Returns the GPU model and vendor information as a list of key-value pairs.
+    """
+    return cache.CACHE.fetch("gpu", _get_gpu_lib(gpu_lib), _get_gpu_info)
@@ -4,27 +4,34 @@ import os
 import subprocess
 from typing import Dict, List, Optional
 
-from pyarchitecture import config
+from pyarchitecture import config, runner
 
 LOGGER = logging.getLogger(__name__)
 
+# Device classes of display controllers as reported by lspci
+DISPLAY_CONTROLLERS = (
+    "VGA compatible controller",
+    "3D controller",
+    "Display controller",
+)
 
-def _darwin(gpu_lib: str | os.PathLike) -> Optional[List[Dict[str, str]]]:
-    """Get GPU model and vendor information for Linux operating system.
+
+def darwin_command(gpu_lib: str | os.PathLike) -> List[str]:
+    """Command to get GPU model and vendor information for macOS operating system."""
+    return [gpu_lib, "SPDisplaysDataType", "-json"]
+
+
+def parse_darwin(output: str) -> List[Dict[str, str]]:
+    """Parse GPU model and vendor information from the system_profiler output on macOS.
+
+    Args:
+        output: Standard output from system_profiler command.
 
     Returns:
         List[Dict[str, str]]:
         Returns a list of GPU model and vendor information.
     """
-    result = subprocess.run(
-        [gpu_lib, "SPDisplaysDataType", "-json"],
-        capture_output=True,
-        text=True,
-    )
-    if result.stderr:
-        LOGGER.debug(result.stderr)
-        return
-    displays = json.loads(result.stdout).get("SPDisplaysDataType", [])
+    displays = json.loads(output).get("SPDisplaysDataType", [])
     gpu_info = []
     for display in displays:
         if "sppci_model" in display.keys():
@@ -41,25 +48,38 @@ def _darwin(gpu_lib: str | os.PathLike) -> Optional[List[Dict[str, str]]]:
     return gpu_info
 
 
-def _linux(gpu_lib: str | os.PathLike) -> Optional[List[Dict[str, str]]]:
+def _darwin(gpu_lib: str | os.PathLike) -> Optional[List[Dict[str, str]]]:
     """Get GPU model and vendor information for Linux operating system.
 
     Returns:
         List[Dict[str, str]]:
         Returns a list of GPU model and vendor information.
     """
-    result = subprocess.run(
-        [gpu_lib],
-        capture_output=True,
-        text=True,
-    )
+    result = runner.run(darwin_command(gpu_lib))
     if result.stderr:
         LOGGER.debug(result.stderr)
         return
-    gpus = result.stdout.splitlines()
+    return parse_darwin(result.stdout)
+
+
+def linux_command(gpu_lib: str | os.PathLike) -> List[str]:
+    """Command to get GPU model and vendor information for Linux operating system."""
+    return [gpu_lib]
+
+
+def parse_linux(output: str) -> List[Dict[str, str]]:
+    """Parse GPU model and vendor information from the lspci output on Linux.
+
+    Args:
+        output: Standard output from lspci command.
+
+    Returns:
+        List[Dict[str, str]]:
+        Returns a list of GPU model and vendor information.
+    """
     gpu_info = []
-    for line in gpus:
-        if "VGA" in line:
+    for line in output.splitlines():
+        if any(f" {controller}: " in line for controller in DISPLAY_CONTROLLERS):
             gpu = line.split(":")[-1].strip()
         else:
             continue
@@ -71,29 +91,43 @@ def _linux(gpu_lib: str | os.PathLike) -> Optional[List[Dict[str, str]]]:
     return gpu_info
 
 
-def _windows(gpu_lib: str | os.PathLike) -> Optional[List[Dict[str, str]]]:
-    """Get GPU model and vendor information for Windows operating system.
+def _linux(gpu_lib: str | os.PathLike) -> Optional[List[Dict[str, str]]]:
+    """Get GPU model and vendor information for Linux operating system.
 
     Returns:
         List[Dict[str, str]]:
         Returns a list of GPU model and vendor information.
     """
-    result = subprocess.run(
-        [
-            gpu_lib,
-            "path",
-            "win32_videocontroller",
-            "get",
-            "Name,AdapterCompatibility",
-            "/format:csv",
-        ],
-        stdout=subprocess.PIPE,
-        text=True,
-    )
+    result = runner.run(linux_command(gpu_lib))
     if result.stderr:
         LOGGER.debug(result.stderr)
         return
-    gpus_raw = [line for line in result.stdout.splitlines() if line.strip()]
+    return parse_linux(result.stdout)
+
+
+def windows_command(gpu_lib: str | os.PathLike) -> List[str]:
+    """Command to get GPU model and vendor information for Windows operating system."""
+    return [
+        gpu_lib,
+        "path",
+        "win32_videocontroller",
+        "get",
+        "Name,AdapterCompatibility",
+        "/format:csv",
+    ]
+
+
+def parse_windows(output: str) -> Optional[List[Dict[str, str]]]:
+    """Parse GPU model and vendor information from the wmic output on Windows.
+
+    Args:
+        output: Standard output from wmic command.
+
+    Returns:
+        List[Dict[str, str]]:
+        Returns a list of GPU model and vendor information.
+    """
+    gpus_raw = [line for line in output.splitlines() if line.strip()]
     try:
         keys = (
             gpus_raw[0]
@@ -115,6 +149,17 @@ def _windows(gpu_lib: str | os.PathLike) -> Optional[List[Dict[str, str]]]:
         LOGGER.debug("ValueError: Not enough values for the keys")
 
 
+def _windows(gpu_lib: str | os.PathLike) -> Optional[List[Dict[str, str]]]:
+    """Get GPU model and vendor information for Windows operating system.
+
+    Returns:
+        List[Dict[str, str]]:
+        Returns a list of GPU model and vendor information.
+    """
+    # Only the output was ever captured for wmic, so warnings on stderr don't discard it
+    return parse_windows(runner.run(windows_command(gpu_lib)).stdout)
+
+
 def get_names(gpu_lib: str | os.PathLike) -> List[Dict[str, str]]:
     """Get list of GPU model and vendor information based on the operating system."""
     fn_map = dict(linux=_linux, darwin=_darwin, windows=_windows)
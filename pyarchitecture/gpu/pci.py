@@ -0,0 +1,188 @@
+import bisect
+import functools
+import logging
+import mmap
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+PCI_DEVICES = "/sys/bus/pci/devices"
+PCI_IDS = (
+    "/usr/share/hwdata/pci.ids",
+    "/usr/share/misc/pci.ids",
+    "/usr/share/pci.ids",
+    "/usr/share/pciids/pci.ids",
+)
+# Base class code for display controllers (VGA compatible, XGA, 3D and other display controllers)
+DISPLAY_CLASS = 0x03
+VENDOR_PATTERN = re.compile(rb"^([0-9a-f]{4})  ", re.MULTILINE)
+
+
+class PciIds:
+    """Memory-mapped, binary-searchable index of the vendors and devices in a ``pci.ids`` database.
+
+    >>> PciIds
+
+    The index holds only the offset of each vendor's block, device names are resolved on demand.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        blocks = []
+        for match in VENDOR_PATTERN.finditer(self._mmap):
+            if blocks:
+                blocks[-1][2] = match.start()
+            blocks.append([int(match.group(1), 16), match.start(), len(self._mmap)])
+        # Device classes are listed after the vendors, and shouldn't be searched for device names
+        if blocks and (classes := self._mmap.find(b"\nC ", blocks[-1][1])) != -1:
+            blocks[-1][2] = classes
+        blocks.sort()
+        self._vendors = [block[0] for block in blocks]
+        self._blocks: List[Tuple[int, int]] = [(block[1], block[2]) for block in blocks]
+
+    def _line(self, start: int) -> str:
+        """Reads the name from a line in the database, starting at the given offset."""
+        end = self._mmap.find(b"\n", start)
+        return self._mmap[start : end if end != -1 else None].decode(  # noqa: E203
+            errors="replace"
+        )
+
+    def _block(self, vendor_id: int) -> Optional[Tuple[int, int]]:
+        """Binary search for the start and end offsets of a vendor's block."""
+        index = bisect.bisect_left(self._vendors, vendor_id)
+        if index < len(self._vendors) and self._vendors[index] == vendor_id:
+            return self._blocks[index]
+
+    def vendor(self, vendor_id: int) -> Optional[str]:
+        """Get the vendor name for a vendor ID.
+
+        Args:
+            vendor_id: PCI vendor ID.
+
+        Returns:
+            str:
+            Returns the vendor name, or None when the vendor is unknown.
+        """
+        if block := self._block(vendor_id):
+            # Vendor lines are formatted as "vvvv  name"
+            return self._line(block[0] + 6)
+
+    def device(self, vendor_id: int, device_id: int) -> Optional[str]:
+        """Get the device name for a vendor and device ID.
+
+        Args:
+            vendor_id: PCI vendor ID.
+            device_id: PCI device ID.
+
+        Returns:
+            str:
+            Returns the device name, or None when the device is unknown.
+        """
+        if block := self._block(vendor_id):
+            # Device lines are formatted as "\tdddd  name" within the vendor's block
+            needle = b"\n\t%04x  " % device_id
+            if (offset := self._mmap.find(needle, block[0], block[1])) != -1:
+                return self._line(offset + len(needle))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_pci_ids(path: str, mtime: float) -> PciIds:
+    """Builds the index for a pci.ids database, cached until the file is modified."""
+    return PciIds(path)
+
+
+def pci_ids(path: str | os.PathLike = None) -> Optional[PciIds]:
+    """Get the indexed pci.ids database, built once and reused for subsequent lookups.
+
+    Args:
+        path: Custom path for the pci.ids database.
+
+    Returns:
+        PciIds:
+        Returns the indexed database, or None when no database is available.
+    """
+    for candidate in (path,) if path else PCI_IDS:
+        try:
+            return _load_pci_ids(os.fspath(candidate), os.stat(candidate).st_mtime)
+        except (OSError, ValueError) as error:
+            LOGGER.debug(error)
+
+
+def _read_hex(path: str) -> Optional[int]:
+    """Reads a hexadecimal sysfs attribute as an integer."""
+    try:
+        with open(path) as file:
+            return int(file.read().strip(), 16)
+    except (OSError, ValueError):
+        return None
+
+
+def display_devices(
+    pci_devices: str | os.PathLike = PCI_DEVICES,
+) -> List[Dict[str, int | str]]:
+    """Enumerates the display controllers from sysfs, filtering by class code before any name resolution.
+
+    Args:
+        pci_devices: Path to the PCI devices' directory in sysfs.
+
+    Returns:
+        List[Dict[str, int | str]]:
+        Returns a list of PCI slot, vendor ID and device ID for each display controller.
+    """
+    devices = []
+    for slot in sorted(os.listdir(pci_devices)):
+        path = os.path.join(pci_devices, slot)
+        pci_class = _read_hex(os.path.join(path, "class"))
+        # Class code is formatted as 0xCCSSPP - base class, subclass and programming interface
+        if pci_class is None or pci_class >> 16 != DISPLAY_CLASS:
+            continue
+        devices.append(
+            dict(
+                slot=slot,
+                vendor_id=_read_hex(os.path.join(path, "vendor")),
+                device_id=_read_hex(os.path.join(path, "device")),
+            )
+        )
+    return devices
+
+
+def describe(vendor_id: int, device_id: int, database: PciIds | None) -> Dict[str, str]:
+    """Get the model and vendor names of a PCI device, falling back to the IDs when they are unknown.
+
+    Args:
+        vendor_id: PCI vendor ID.
+        device_id: PCI device ID.
+        database: Index of the pci.ids database.
+
+    Returns:
+        Dict[str, str]:
+        Returns the model and vendor information.
+    """
+    vendor = (database and database.vendor(vendor_id)) or f"Vendor {vendor_id:04x}"
+    model = (
+        database and database.device(vendor_id, device_id)
+    ) or f"Device {device_id:04x}"
+    return dict(model=f"{vendor} {model}", vendor=vendor)
+
+
+def get_names(
+    pci_devices: str | os.PathLike = PCI_DEVICES, pci_ids_path: str | os.PathLike = None
+) -> List[Dict[str, str]]:
+    """Get GPU model and vendor information from sysfs, without spawning lspci.
+
+    Args:
+        pci_devices: Path to the PCI devices' directory in sysfs.
+        pci_ids_path: Custom path for the pci.ids database.
+
+    Returns:
+        List[Dict[str, str]]:
+        Returns a list of GPU model and vendor information.
+    """
+    database = pci_ids(pci_ids_path)
+    return [
+        describe(device["vendor_id"] or 0, device["device_id"] or 0, database)
+        for device in display_devices(pci_devices)
+    ]
@@ -0,0 +1,309 @@
+import errno
+import logging
+import os
+import selectors
+import socket
+from typing import Callable, Dict, List, Tuple
+
+from pyarchitecture import cache, config
+from pyarchitecture.disks import linux
+from pyarchitecture.gpu import pci
+
+LOGGER = logging.getLogger(__name__)
+
+SYSFS = "/sys"
+# Netlink protocol and multicast group for the kernel's uevents (as opposed to the ones rebroadcast by udev)
+NETLINK_KOBJECT_UEVENT = 15
+KERNEL_GROUP = 1
+RECEIVE_BUFFER = 1024 * 1024
+MESSAGE_SIZE = 16384
+
+Callback = Callable[[str, List[Dict[str, str]], List[Dict[str, str]]], None]
+Difference = Tuple[List[Dict[str, str]], List[Dict[str, str]]]
+
+
+def parse_uevent(message: bytes) -> Dict[str, str]:
+    """Parses a kernel uevent into its properties.
+
+    Args:
+        message: Raw uevent, a ``action@devpath`` summary followed by null-separated ``KEY=value`` pairs.
+
+    Returns:
+        Dict[str, str]:
+        Returns the uevent's properties, empty for messages that are not kernel uevents.
+    """
+    summary, _, payload = message.partition(b"\0")
+    if b"@" not in summary:
+        # Messages rebroadcast by udev start with a libudev header instead
+        return {}
+    properties = {}
+    for field in payload.split(b"\0"):
+        key, separator, value = field.partition(b"=")
+        if separator:
+            properties[key.decode()] = value.decode(errors="replace")
+    return properties
+
+
+def uevent(action: str, devpath: str, **properties: str) -> bytes:
+    """Builds a kernel uevent, to inject synthetic events into a watcher.
+
+    Args:
+        action: Action of the event, eg: ``add`` or ``remove``.
+        devpath: Path of the device within sysfs.
+        properties: Additional properties, eg: ``SUBSYSTEM="block"``.
+
+    Returns:
+        bytes:
+        Returns the uevent in the format sent by the kernel.
+    """
+    fields = dict(ACTION=action, DEVPATH=devpath, **properties)
+    return b"\0".join(
+        [f"{action}@{devpath}".encode()]
+        + [f"{key}={value}".encode() for key, value in fields.items()]
+    )
+
+
+def open_socket() -> socket.socket:
+    """Opens a netlink socket subscribed to the kernel's uevents."""
+    sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+    # Bursts of events, like a disk with many partitions, shouldn't overflow the socket
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER)
+    sock.bind((0, KERNEL_GROUP))
+    return sock
+
+
+class Watcher:
+    """Holds an inventory of the disks and GPUs, updated incrementally from the kernel's uevents.
+
+    >>> Watcher
+
+    The watcher blocks on the socket between events, so it costs no CPU while nothing changes.
+    """
+
+    def __init__(
+        self,
+        callbacks: List[Callback] = None,
+        sock: socket.socket = None,
+        sysfs: str | os.PathLike = SYSFS,
+    ):
+        self.callbacks = callbacks or []
+        self.sysfs = sysfs
+        # Subscribed before taking the inventory, so no event is missed in between
+        self._sock = sock or open_socket()
+        self._waker, self._wake = socket.socketpair()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._sock, selectors.EVENT_READ)
+        self._selector.register(self._waker, selectors.EVENT_READ)
+        self._running = False
+        self._database = pci.pci_ids()
+        self.disks, self.gpus = self._scan()
+
+    def _scan(self) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, str]]]:
+        """Takes the inventory of the disks and GPUs from sysfs.
+
+        Returns:
+            Tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, str]]]:
+            Returns the disks keyed by their device ID, and the GPUs keyed by their PCI slot.
+        """
+        # Read from sysfs like the incremental updates, so a change event compares like with like
+        disks = {
+            disk["device_id"]: disk
+            for disk in linux.sysfs_drive_info(os.path.join(self.sysfs, "block"))
+        }
+        gpus = {
+            device["slot"]: pci.describe(
+                device["vendor_id"] or 0, device["device_id"] or 0, self._database
+            )
+            for device in self._display_devices()
+        }
+        return disks, gpus
+
+    def _display_devices(self) -> List[Dict[str, int | str]]:
+        """Enumerates the display controllers, empty when sysfs is unavailable."""
+        try:
+            return pci.display_devices(os.path.join(self.sysfs, "bus/pci/devices"))
+        except OSError as error:
+            LOGGER.debug(error)
+            return []
+
+    def _block_event(self, event: Dict[str, str]) -> Difference:
+        """Applies a block device's event to the inventory.
+
+        Args:
+            event: Properties of the uevent.
+
+        Returns:
+            Difference:
+            Returns the added and removed disks.
+        """
+        name = event.get("DEVNAME", "").rpartition("/")[2]
+        if event.get("DEVTYPE") != "disk" or not name:
+            return [], []
+        removed = [self.disks.pop(name)] if name in self.disks else []
+        if event["ACTION"] == "remove":
+            return [], removed
+        device_path = os.path.join(self.sysfs, event["DEVPATH"].lstrip("/"))
+        device_number = f"{event.get('MAJOR', '')}:{event.get('MINOR', '')}"
+        if not linux.is_disk(device_path, name, device_number):
+            return [], removed
+        try:
+            disk = linux.sysfs_disk(
+                device_path, name, device_number, linux.read_mountpoints()
+            )
+        except OSError as error:
+            # Devices can be removed again before their sysfs entries are read
+            LOGGER.debug(error)
+            return [], removed
+        self.disks[name] = disk
+        if removed == [disk]:
+            return [], []
+        # Changes to a known disk (eg: a resize) are reported as a removal and an addition
+        return [disk], removed
+
+    def _pci_event(self, event: Dict[str, str]) -> Difference:
+        """Applies a PCI device's event to the inventory.
+
+        Args:
+            event: Properties of the uevent.
+
+        Returns:
+            Difference:
+            Returns the added and removed GPUs.
+        """
+        slot = event.get("PCI_SLOT_NAME")
+        if not slot:
+            return [], []
+        if event["ACTION"] == "remove":
+            return [], [self.gpus.pop(slot)] if slot in self.gpus else []
+        if event["ACTION"] != "add" or slot in self.gpus:
+            return [], []
+        # Class code is formatted as CCSSPP - base class, subclass and programming interface
+        if int(event.get("PCI_CLASS", "0"), 16) >> 16 != pci.DISPLAY_CLASS:
+            return [], []
+        vendor_id, _, device_id = event.get("PCI_ID", "0:0").partition(":")
+        self.gpus[slot] = pci.describe(
+            int(vendor_id, 16), int(device_id or "0", 16), self._database
+        )
+        return [self.gpus[slot]], []
+
+    def handle(self, message: bytes) -> None:
+        """Applies a uevent to the inventory, invoking the callbacks with the difference.
+
+        Args:
+            message: Raw uevent.
+        """
+        event = parse_uevent(message)
+        if event.get("ACTION") not in ("add", "remove", "change"):
+            return
+        if event.get("SUBSYSTEM") == "block":
+            component, (added, removed) = "disks", self._block_event(event)
+        elif event.get("SUBSYSTEM") == "pci":
+            component, (added, removed) = "gpu", self._pci_event(event)
+        else:
+            return
+        self._notify(component, added, removed)
+
+    def _notify(
+        self, component: str, added: List[Dict[str, str]], removed: List[Dict[str, str]]
+    ) -> None:
+        """Invokes the callbacks with a component's difference, when there is one."""
+        if not added and not removed:
+            return
+        LOGGER.debug(f"{component}: added {added}, removed {removed}")
+        # Cached results of the regular getters are stale from here on
+        cache.invalidate(component)
+        for callback in self.callbacks:
+            callback(component, added, removed)
+
+    def rescan(self) -> None:
+        """Rebuilds the inventory from sysfs, invoking the callbacks with the difference to the previous one."""
+        disks, gpus = self._scan()
+        for component, previous, current in (
+            ("disks", self.disks, disks),
+            ("gpu", self.gpus, gpus),
+        ):
+            # Changed devices are reported as a removal and an addition, like the incremental updates
+            added = [
+                entry for key, entry in current.items() if previous.get(key) != entry
+            ]
+            removed = [
+                entry for key, entry in previous.items() if current.get(key) != entry
+            ]
+            self._notify(component, added, removed)
+        self.disks, self.gpus = disks, gpus
+
+    def poll(self, timeout: float = None) -> bool:
+        """Waits for events and applies them, returning when the timeout elapses or the watcher is stopped.
+
+        Args:
+            timeout: Timeout in seconds, ``None`` to wait until an event arrives, ``0`` to not wait at all.
+
+        Returns:
+            bool:
+            Returns ``False`` when the watcher was stopped.
+        """
+        for key, _ in self._selector.select(timeout):
+            if key.fileobj is self._waker:
+                self._waker.recv(1)
+                return False
+            try:
+                message = self._sock.recv(MESSAGE_SIZE)
+            except BlockingIOError:
+                continue
+            except OSError as error:
+                if error.errno != errno.ENOBUFS:
+                    LOGGER.warning(f"Failed to receive uevents: {error}")
+                    continue
+                # Events were dropped while the receive buffer was full, so the inventory is taken again
+                LOGGER.warning("Uevents were dropped, rescanning the disks and GPUs")
+                self.rescan()
+                continue
+            self.handle(message)
+        return True
+
+    def run(self) -> None:
+        """Applies the events as they arrive, until the watcher is stopped."""
+        self._running = True
+        while self._running and self.poll():
+            pass
+
+    def stop(self) -> None:
+        """Stops the watcher from another thread, or from a callback."""
+        self._running = False
+        self._wake.send(b"\0")
+
+    def close(self) -> None:
+        """Closes the sockets."""
+        self._selector.close()
+        for sock in (self._sock, self._waker, self._wake):
+            sock.close()
+
+    def __enter__(self) -> "Watcher":
+        """Opens the watcher as a context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Closes the sockets when exiting the context manager."""
+        self.close()
+
+
+def get_watcher(callbacks: List[Callback] = None) -> Watcher | None:
+    """Get a watcher for disk and GPU hot-plug events, only on Linux.
+
+    Args:
+        callbacks: Functions to call with the component (``disks`` or ``gpu``), and the added and removed devices.
+
+    See Also:
+        - Use ``run()`` to apply the events in a loop, or ``poll(timeout)`` to apply the pending ones.
+
+    Returns:
+        Watcher:
+        Returns a watcher object, with the inventory in the ``disks`` and ``gpus`` attributes.
+    """
+    if config.OPERATING_SYSTEM != config.OperatingSystem.linux:
+        LOGGER.error("Hot-plug detection is only available on Linux")
+        return
+    try:
+        return Watcher(callbacks)
+    except OSError as error:
+        LOGGER.error(f"Failed to subscribe to uevents: {error}")
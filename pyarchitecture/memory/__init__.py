@@ -1,9 +1,12 @@
+import contextlib
 import logging
 import os
-from typing import Dict
+import subprocess
+from collections.abc import Generator
+from typing import Callable, Dict, List
 
-from pyarchitecture import config, squire
-from pyarchitecture.memory import linux, macOS, windows
+from pyarchitecture import config, registry, squire
+from pyarchitecture.memory import watcher
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,34 +21,100 @@ def _get_mem_lib(user_input: str | os.PathLike) -> str:
         user_input
         or os.environ.get("mem_lib")
         or os.environ.get("MEM_LIB")
-        or config.default_mem_lib()[config.OPERATING_SYSTEM]
+        or registry.library("memory")
         or __file__  # placeholder for windows
     )
 
 
 def get_memory_info(
-    mem_lib: str | os.PathLike = None, humanize: bool = True
+    mem_lib: str | os.PathLike = None,
+    humanize: bool = True,
+    full: bool = False,
+    effective: bool = False,
 ) -> Dict[str, int | str]:
     """OS-agnostic function to get memory information.
 
     Args:
         mem_lib: Custom memory library path.
         humanize: Flag to return humanized memory info.
+        full: Flag to return every field reported by meminfo (``Cached``, ``Dirty``, ``Slab`` etc.), only on Linux.
+        effective: Flag to bound the memory info by the limits of the process' cgroup, only on Linux.
 
     Returns:
         Dict[str, int]:
         Returns the memory information as key-value pairs.
     """
-    os_map = {
-        config.OperatingSystem.darwin: macOS.get_memory_info,
-        config.OperatingSystem.linux: linux.get_memory_info,
-        config.OperatingSystem.windows: windows.get_memory_info,
-    }
+    if full and config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+        library_path = _get_mem_lib(mem_lib)
+        if os.path.isfile(library_path):
+            return (
+                squire.import_backend(__name__)
+                .get_full_memory_info(library_path)
+                .to_dict(humanize)
+            )
+        LOGGER.error(f"Memory library {library_path!r} doesn't exist")
+        return
     library_path = _get_mem_lib(mem_lib)
     if os.path.isfile(library_path):
-        raw_info = os_map[config.OPERATING_SYSTEM](library_path)
+        try:
+            raw_info = squire.import_backend(__name__).get_memory_info(library_path)
+        except subprocess.TimeoutExpired as error:
+            LOGGER.error(error)
+            return
+        if effective and config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+            from pyarchitecture import cgroup
+
+            if cgroup_info := cgroup.get_cgroup():
+                raw_info = cgroup.effective_memory(raw_info, cgroup_info)
         if humanize:
             return {k: squire.size_converter(v) for k, v in raw_info.items()}
         return raw_info
     else:
         LOGGER.error(f"Memory library {library_path!r} doesn't exist")
+
+
+def watch(
+    mem_lib: str | os.PathLike = None,
+    interval: float = 5.0,
+    fast_interval: float = 0.5,
+    available_below: int = None,
+    swap_used_above: int = None,
+    callbacks: List[Callable[[str, bool, Dict[str, int]], None]] = None,
+) -> Generator[Dict[str, int]]:
+    """OS-agnostic generator to sample memory information, with callbacks for threshold crossings.
+
+    Args:
+        mem_lib: Custom memory library path.
+        interval: Interval in seconds between samples, when none of the thresholds are breached.
+        fast_interval: Interval in seconds between samples, while any of the thresholds are breached.
+        available_below: Threshold in bytes, below which the available memory is under pressure.
+        swap_used_above: Threshold in bytes, above which the used swap memory is under pressure.
+        callbacks: Functions to call with the threshold's key, breach flag and the sample, when a threshold is crossed.
+
+    See Also:
+        - On Linux, the memory library is kept open and re-read in place for every sample.
+        - Callbacks are invoked as ``callback("available", True, sample)`` when the threshold is breached,
+          and as ``callback("available", False, sample)`` when it recovers.
+
+    Yields:
+        Dict[str, int]:
+        Yields the raw memory information (in bytes) for each sample.
+    """
+    library_path = _get_mem_lib(mem_lib)
+    if not os.path.isfile(library_path):
+        LOGGER.error(f"Memory library {library_path!r} doesn't exist")
+        return
+    backend = squire.import_backend(__name__)
+    with contextlib.ExitStack() as stack:
+        if config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+            sampler = stack.enter_context(backend.Reader(library_path)).read
+        else:
+            sampler = lambda: backend.get_memory_info(library_path)
+        yield from watcher.watch(
+            sampler,
+            interval,
+            fast_interval,
+            available_below,
+            swap_used_above,
+            callbacks or [],
+        )
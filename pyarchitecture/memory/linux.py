@@ -1,32 +1,38 @@
+import functools
 import os
-from typing import Dict
+from array import array
+from typing import Dict, Iterable, Iterator, Tuple
 
+from pyarchitecture import squire
+
+# meminfo is well under a page on most kernels, the buffer grows when it doesn't fit
+READ_SIZE = 4096
 
-def get_memory_info(mem_lib: str | os.PathLike) -> Dict[str, int | str]:
-    """Get memory information on Linux systems.
+
+def parse_memory_info(lines: Iterable[str]) -> Dict[str, int]:
+    """Parses the meminfo lines into memory information.
 
     Args:
-        mem_lib: Memory library path.
+        lines: Lines from the memory library.
 
     Returns:
         Dict[str, int]:
         Returns the memory information as key-value pairs.
     """
     memory_info = {}
-    with open(mem_lib) as mem_file:
-        for line in mem_file:
-            if line.startswith(
-                (
-                    "MemTotal",
-                    "MemFree",
-                    "MemAvailable",
-                    "SwapTotal",
-                    "SwapFree",
-                )
-            ):
-                parts = line.split()
-                # Convert the memory value to int (in kB)
-                memory_info[parts[0][:-1]] = int(parts[1])
+    for line in lines:
+        if line.startswith(
+            (
+                "MemTotal",
+                "MemFree",
+                "MemAvailable",
+                "SwapTotal",
+                "SwapFree",
+            )
+        ):
+            parts = line.split()
+            # Convert the memory value to int (in kB)
+            memory_info[parts[0][:-1]] = int(parts[1])
 
     # Physical memory (kB to bytes)
     total = memory_info.get("MemTotal", 0) * 1024
@@ -48,3 +54,195 @@ def get_memory_info(mem_lib: str | os.PathLike) -> Dict[str, int | str]:
         "swap_used": swap_used,
         "swap_free": swap_free,
     }
+
+
+def get_memory_info(mem_lib: str | os.PathLike) -> Dict[str, int | str]:
+    """Get memory information on Linux systems.
+
+    Args:
+        mem_lib: Memory library path.
+
+    Returns:
+        Dict[str, int]:
+        Returns the memory information as key-value pairs.
+    """
+    with open(mem_lib) as mem_file:
+        return parse_memory_info(mem_file)
+
+
+class Layout:
+    """Field order of a meminfo file, shared by all the records parsed with the same set of fields.
+
+    >>> Layout
+
+    """
+
+    __slots__ = ("fields", "offsets", "scales")
+
+    def __init__(self, fields: Tuple[str, ...], scales: Tuple[int, ...]):
+        self.fields = fields
+        self.offsets = {field: offset for offset, field in enumerate(fields)}
+        # Fields reported in kB are stored in bytes, while the rest (like HugePages_Total) are counts
+        self.scales = scales
+
+
+@functools.lru_cache(maxsize=16)
+def _layout(fields: Tuple[str, ...], scales: Tuple[int, ...]) -> Layout:
+    """Get the layout for a set of fields, computed once and reused for subsequent records."""
+    return Layout(fields, scales)
+
+
+class MemInfo:
+    """Compact, fixed-layout record of every field in meminfo, backed by an unsigned 64-bit array.
+
+    >>> MemInfo
+
+    """
+
+    __slots__ = ("layout", "values")
+
+    def __init__(self, layout: Layout, values: array):
+        self.layout = layout
+        self.values = values
+
+    def __getitem__(self, field: str) -> int:
+        """Get the value of a field, in bytes for the fields reported in kB."""
+        return self.values[self.layout.offsets[field]]
+
+    def __contains__(self, field: str) -> bool:
+        """Checks if a field is present in the record."""
+        return field in self.layout.offsets
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the field names in the order they are reported."""
+        return iter(self.layout.fields)
+
+    def __len__(self) -> int:
+        """Number of fields in the record."""
+        return len(self.values)
+
+    def __eq__(self, other: "MemInfo") -> bool:
+        """Compares the fields and values of two records."""
+        if not isinstance(other, MemInfo):
+            return NotImplemented
+        return self.layout.fields == other.layout.fields and self.values == other.values
+
+    def __repr__(self) -> str:
+        """String representation of the record."""
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+    def get(self, field: str, default: int = None) -> int | None:
+        """Get the value of a field, or the default value when the field is not present."""
+        offset = self.layout.offsets.get(field)
+        return default if offset is None else self.values[offset]
+
+    def to_dict(self, humanize: bool = False) -> Dict[str, int | str]:
+        """Converts the record into a dictionary.
+
+        Args:
+            humanize: Flag to humanize the fields that are reported in bytes.
+
+        Returns:
+            Dict[str, int | str]:
+            Returns all the memory fields as key-value pairs.
+        """
+        if humanize:
+            return {
+                field: squire.size_converter(value) if scale != 1 else value
+                for field, value, scale in zip(
+                    self.layout.fields, self.values, self.layout.scales
+                )
+            }
+        return dict(zip(self.layout.fields, self.values))
+
+
+def parse_full_memory_info(lines: Iterable[str]) -> MemInfo:
+    """Parses every field in the meminfo lines into a compact record.
+
+    Args:
+        lines: Lines from the memory library.
+
+    Returns:
+        MemInfo:
+        Returns the memory information as an array backed record.
+    """
+    fields, scales, values = [], [], []
+    for line in lines:
+        field, _, value = line.partition(":")
+        if not (parts := value.split()):
+            continue
+        # Values are reported in kB, except for counters like HugePages_Total that have no unit
+        scale = 1024 if len(parts) > 1 else 1
+        fields.append(field)
+        scales.append(scale)
+        values.append(int(parts[0]) * scale)
+    return MemInfo(_layout(tuple(fields), tuple(scales)), array("Q", values))
+
+
+def get_full_memory_info(mem_lib: str | os.PathLike) -> MemInfo:
+    """Get every field of memory information on Linux systems.
+
+    Args:
+        mem_lib: Memory library path.
+
+    Returns:
+        MemInfo:
+        Returns the memory information as an array backed record.
+    """
+    with open(mem_lib) as mem_file:
+        return parse_full_memory_info(mem_file)
+
+
+class Reader:
+    """Keeps the memory library open and re-reads it in place, for repeated sampling.
+
+    >>> Reader
+
+    """
+
+    def __init__(self, mem_lib: str | os.PathLike):
+        self._fd = os.open(mem_lib, os.O_RDONLY)
+        self._size = READ_SIZE
+
+    def read_bytes(self) -> bytes:
+        """Reads the entire memory library from the start, without re-opening it.
+
+        Returns:
+            bytes:
+            Returns the raw content of the memory library.
+        """
+        while len(data := os.pread(self._fd, self._size, 0)) == self._size:
+            self._size *= 2
+        return data
+
+    def read(self) -> Dict[str, int]:
+        """Reads the memory information from the open memory library.
+
+        Returns:
+            Dict[str, int]:
+            Returns the memory information as key-value pairs.
+        """
+        return parse_memory_info(self.read_bytes().decode().splitlines())
+
+    def read_full(self) -> MemInfo:
+        """Reads every field of memory information from the open memory library.
+
+        Returns:
+            MemInfo:
+            Returns the memory information as an array backed record.
+        """
+        return parse_full_memory_info(self.read_bytes().decode().splitlines())
+
+    def close(self) -> None:
+        """Closes the memory library."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "Reader":
+        """Opens the reader as a context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Closes the reader when exiting the context manager."""
+        self.close()
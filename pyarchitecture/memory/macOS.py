@@ -1,8 +1,15 @@
 import os
-import subprocess
-from typing import Dict
+from typing import Dict, List
 
-from pyarchitecture import squire
+from pyarchitecture import runner, squire
+
+SYSCTL_KEYS = (
+    "hw.memsize",
+    "hw.pagesize",
+    "vm.page_free_count",
+    "vm.page_inactive_count",
+    "vm.swapusage",
+)
 
 
 def byte_value(text: str, key: str) -> int:
@@ -19,19 +26,23 @@ def byte_value(text: str, key: str) -> int:
     return squire.convert_to_bytes(text.split(f"{key} = ")[1].split()[0])
 
 
-def get_sysctl_value(mem_lib: str | os.PathLike, key: str):
-    """Get the value of the key from sysctl.
+def sysctl_command(mem_lib: str | os.PathLike, key: str) -> List[str]:
+    """Command to get the value of the key from sysctl."""
+    return [mem_lib, key]
+
+
+def parse_sysctl_value(stdout: str, key: str):
+    """Parses the value of the key from sysctl output.
 
     Args:
-        mem_lib: Memory library path.
+        stdout: Standard output from sysctl command.
         key: Key to extract the value.
 
     Returns:
         int:
         Returns the value of the key as an integer.
     """
-    result = subprocess.run([mem_lib, key], capture_output=True, text=True)
-    if text := result.stdout.strip():
+    if text := stdout.strip():
         if key == "vm.swapusage":
             swap_usage = {}
             if "total" in text:
@@ -45,28 +56,42 @@ def get_sysctl_value(mem_lib: str | os.PathLike, key: str):
     return 0
 
 
-def get_memory_info(mem_lib: str | os.PathLike) -> Dict[str, int | str]:
-    """Get memory information on macOS systems.
+def get_sysctl_value(mem_lib: str | os.PathLike, key: str):
+    """Get the value of the key from sysctl.
 
     Args:
         mem_lib: Memory library path.
+        key: Key to extract the value.
+
+    Returns:
+        int:
+        Returns the value of the key as an integer.
+    """
+    return parse_sysctl_value(runner.run(sysctl_command(mem_lib, key)).stdout, key)
+
+
+def parse_memory_info(values: Dict[str, int | Dict[str, int]]) -> Dict[str, int]:
+    """Computes the memory information from sysctl values.
+
+    Args:
+        values: Dictionary of sysctl keys and their parsed values.
 
     Returns:
         Dict[str, int]:
         Returns the memory information as key-value pairs.
     """
     # Physical memory information
-    total = get_sysctl_value(mem_lib, "hw.memsize")
-    page_size = get_sysctl_value(mem_lib, "hw.pagesize")
-    free_pages = get_sysctl_value(mem_lib, "vm.page_free_count")
-    inactive_pages = get_sysctl_value(mem_lib, "vm.page_inactive_count")
+    total = values["hw.memsize"]
+    page_size = values["hw.pagesize"]
+    free_pages = values["vm.page_free_count"]
+    inactive_pages = values["vm.page_inactive_count"]
 
     available = (free_pages + inactive_pages) * page_size
     free = free_pages * page_size
     used = total - available
 
     # Virtual memory information
-    swap_info = get_sysctl_value(mem_lib, "vm.swapusage")
+    swap_info = values["vm.swapusage"] or {}
 
     return {
         **{
@@ -77,3 +102,18 @@ def get_memory_info(mem_lib: str | os.PathLike) -> Dict[str, int | str]:
         },
         **swap_info,
     }
+
+
+def get_memory_info(mem_lib: str | os.PathLike) -> Dict[str, int | str]:
+    """Get memory information on macOS systems.
+
+    Args:
+        mem_lib: Memory library path.
+
+    Returns:
+        Dict[str, int]:
+        Returns the memory information as key-value pairs.
+    """
+    return parse_memory_info(
+        {key: get_sysctl_value(mem_lib, key) for key in SYSCTL_KEYS}
+    )
@@ -0,0 +1,65 @@
+import logging
+import time
+from collections.abc import Generator
+from typing import Callable, Dict, List
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _breaches(
+    sample: Dict[str, int], available_below: int | None, swap_used_above: int | None
+) -> Dict[str, bool]:
+    """Checks each configured threshold against a memory sample.
+
+    Args:
+        sample: Raw memory information.
+        available_below: Threshold in bytes, below which the available memory is under pressure.
+        swap_used_above: Threshold in bytes, above which the used swap memory is under pressure.
+
+    Returns:
+        Dict[str, bool]:
+        Returns a dictionary of the threshold's key and a flag indicating whether it is breached.
+    """
+    breaches = {}
+    if available_below is not None and "available" in sample:
+        breaches["available"] = sample["available"] < available_below
+    if swap_used_above is not None and "swap_used" in sample:
+        breaches["swap_used"] = sample["swap_used"] > swap_used_above
+    return breaches
+
+
+def watch(
+    sampler: Callable[[], Dict[str, int]],
+    interval: float,
+    fast_interval: float,
+    available_below: int | None,
+    swap_used_above: int | None,
+    callbacks: List[Callable[[str, bool, Dict[str, int]], None]],
+) -> Generator[Dict[str, int]]:
+    """Samples the memory information in a loop, switching to a fast interval while under pressure.
+
+    Args:
+        sampler: Function to get the raw memory information.
+        interval: Interval in seconds between samples, when none of the thresholds are breached.
+        fast_interval: Interval in seconds between samples, while any of the thresholds are breached.
+        available_below: Threshold in bytes, below which the available memory is under pressure.
+        swap_used_above: Threshold in bytes, above which the used swap memory is under pressure.
+        callbacks: Functions to call with the threshold's key, breach flag and the sample, when a threshold is crossed.
+
+    Yields:
+        Dict[str, int]:
+        Yields the raw memory information for each sample.
+    """
+    breached = {}
+    while True:
+        sample = sampler()
+        for key, breach in _breaches(sample, available_below, swap_used_above).items():
+            if breach != breached.get(key, False):
+                LOGGER.debug(
+                    f"Memory threshold for {key!r} was {'breached' if breach else 'recovered'}"
+                )
+                for callback in callbacks:
+                    callback(key, breach, sample)
+            breached[key] = breach
+        yield sample
+        time.sleep(fast_interval if any(breached.values()) else interval)
@@ -0,0 +1,144 @@
+import logging
+import os
+from typing import Any, Dict, List
+
+from pyarchitecture import config, disks, squire
+
+LOGGER = logging.getLogger(__name__)
+
+NODES = "/sys/devices/system/node"
+SYSFS = "/sys"
+# Fields of each node's meminfo, and the keys they are reported as
+MEMINFO_FIELDS = dict(MemTotal="total", MemFree="free", MemUsed="used")
+
+
+def parse_node_meminfo(text: str) -> Dict[str, int]:
+    """Parses a node's meminfo into its memory information in bytes.
+
+    Args:
+        text: Content of the node's meminfo file, eg: ``Node 0 MemTotal: 4816632 kB``
+
+    Returns:
+        Dict[str, int]:
+        Returns the total, free and used memory of the node.
+    """
+    memory = {}
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) >= 4 and (key := MEMINFO_FIELDS.get(fields[2][:-1])):
+            memory[key] = int(fields[3]) * 1024
+    return memory
+
+
+def numa_node(device_path: str | os.PathLike) -> int | None:
+    """Get the NUMA node a device is attached to, from the closest ``numa_node`` attribute up its sysfs path.
+
+    Args:
+        device_path: Path of the device in sysfs.
+
+    Returns:
+        int:
+        Returns the node's number, ``None`` when the device has no NUMA affinity.
+    """
+    path = os.path.realpath(device_path)
+    while path != os.path.dirname(path):
+        if (node := squire.read_attribute(os.path.join(path, "numa_node"))) is not None:
+            # Reported as -1 on hosts without NUMA, or when the firmware doesn't say
+            return int(node) if int(node) >= 0 else None
+        path = os.path.dirname(path)
+
+
+def _read_node(path: str) -> Dict[str, Any]:
+    """Reads a node's CPUs, memory and distances to the other nodes."""
+    with open(os.path.join(path, "meminfo")) as file:
+        memory = parse_node_meminfo(file.read())
+    distances = (squire.read_attribute(os.path.join(path, "distance")) or "").split()
+    return dict(
+        cpus=squire.parse_cpu_list(
+            squire.read_attribute(os.path.join(path, "cpulist")) or ""
+        ),
+        memory=memory,
+        distance=[int(distance) for distance in distances],
+        gpus=[],
+        disks=[],
+    )
+
+
+def _gpus(sysfs: str | os.PathLike) -> List[Dict[str, Any]]:
+    """Enumerates the GPUs along with their PCI slot and NUMA node."""
+    from pyarchitecture.gpu import pci
+
+    pci_devices = os.path.join(sysfs, "bus", "pci", "devices")
+    try:
+        devices = pci.display_devices(pci_devices)
+    except OSError as error:
+        LOGGER.debug(error)
+        return []
+    database = pci.pci_ids()
+    return [
+        dict(
+            slot=device["slot"],
+            **pci.describe(
+                device["vendor_id"] or 0, device["device_id"] or 0, database
+            ),
+            node=numa_node(os.path.join(pci_devices, device["slot"])),
+        )
+        for device in devices
+    ]
+
+
+def _disks(sysfs: str | os.PathLike) -> List[Dict[str, Any]]:
+    """Enumerates the physical disks along with their NUMA node."""
+    return [
+        dict(
+            device_id=disk["device_id"],
+            name=disk["name"],
+            node=numa_node(os.path.join(sysfs, "block", disk["device_id"], "device")),
+        )
+        for disk in disks.get_all_disks() or []
+    ]
+
+
+def get_numa_info(
+    nodes: str | os.PathLike = NODES, sysfs: str | os.PathLike = SYSFS
+) -> Dict[str, Any] | None:
+    """Get the NUMA nodes with their CPUs, free memory and distances, and the GPUs and disks local to each.
+
+    Args:
+        nodes: Path to the NUMA nodes' directory in sysfs.
+        sysfs: Path to sysfs, to resolve the node of each GPU and disk.
+
+    See Also:
+        - Use ``os.sched_setaffinity(0, node["cpus"])`` to pin a process to the CPUs of a node.
+        - Devices without a NUMA affinity are local to the node on single node hosts, and listed under ``unassigned``
+          otherwise.
+
+    Returns:
+        Dict[str, Any]:
+        Returns the CPUs, memory, distances to every node, GPUs and disks of each node keyed by its number,
+        along with the unassigned devices.
+    """
+    if config.OPERATING_SYSTEM != config.OperatingSystem.linux:
+        LOGGER.error("NUMA information is only available on Linux")
+        return
+    if not os.path.isdir(nodes):
+        LOGGER.error(f"NUMA library {nodes!r} doesn't exist")
+        return
+    info = {}
+    for name in os.listdir(nodes):
+        if name.startswith("node") and name[4:].isdigit():
+            try:
+                info[int(name[4:])] = _read_node(os.path.join(nodes, name))
+            except OSError as error:
+                # Nodes can go offline while being read
+                LOGGER.debug(error)
+    info = dict(sorted(info.items()))
+    unassigned = dict(gpus=[], disks=[])
+    devices = dict(gpus=_gpus(sysfs), disks=_disks(sysfs))
+    for kind, entries in devices.items():
+        for entry in entries:
+            node = entry.pop("node")
+            if node is None and len(info) == 1:
+                node = next(iter(info))
+            (info[node] if node in info else unassigned)[kind].append(entry)
+    return dict(nodes=info, unassigned=unassigned)
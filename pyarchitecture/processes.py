@@ -0,0 +1,217 @@
+import heapq
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from pyarchitecture import config
+
+LOGGER = logging.getLogger(__name__)
+
+PROC = "/proc"
+# Large enough for any stat, io or smaps_rollup file in a single read
+READ_SIZE = 4096
+# Offsets of the fields used from stat, counted after the command name
+STATE, UTIME, STIME, THREADS, STARTTIME, VSIZE, RSS = 0, 11, 12, 17, 19, 20, 21
+# Offsets of the read_bytes and write_bytes values in io, whose lines are always in the same order
+READ_BYTES, WRITE_BYTES = 9, 11
+SORT_KEYS: Dict[str, Callable[[Dict[str, Any]], float]] = dict(
+    memory=lambda process: process["rss"],
+    cpu=lambda process: process["cpu_percent"] or 0.0,
+    io=lambda process: (process["read_rate"] or 0.0) + (process["write_rate"] or 0.0),
+)
+
+
+def _read(path: str) -> bytes | None:
+    """Reads a file from procfs in a single call, ``None`` when the process is gone or the file isn't readable."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        return os.read(fd, READ_SIZE)
+    except OSError:
+        return
+    finally:
+        os.close(fd)
+
+
+def _io_counters(data: bytes | None) -> Tuple[int, int] | None:
+    """Parses the bytes read from and written to storage, from the io file."""
+    if not data:
+        return
+    fields = data.split()
+    return int(fields[READ_BYTES]), int(fields[WRITE_BYTES])
+
+
+def _smaps_rollup(data: bytes | None) -> Dict[str, int | None]:
+    """Parses the proportional set size and swap in bytes, from the smaps_rollup file."""
+    rollup = dict(pss=None, swap=None)
+    for line in (data or b"").splitlines():
+        if line.startswith((b"Pss:", b"Swap:")):
+            key, number, _ = line.split()
+            rollup[key[:-1].decode().lower()] = int(number) * 1024
+    return rollup
+
+
+class Table:
+    """Snapshots of the process table from procfs, with CPU and I/O rates computed from the previous snapshot.
+
+    >>> Table
+
+    Only the ``stat`` and ``io`` files are read for each process, and ``smaps_rollup`` when requested.
+    """
+
+    def __init__(
+        self, proc: str | os.PathLike = PROC, smaps: bool = False, workers: int = 0
+    ):
+        self.proc = os.fspath(proc)
+        self.smaps = smaps
+        self.workers = workers
+        self._executor = None
+        self._clock_ticks = os.sysconf("SC_CLK_TCK")
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+        # pid -> (start time, CPU ticks, bytes read, bytes written), start time tells reused pids apart
+        self._previous: Dict[int, Tuple[int, int, int | None, int | None]] = {}
+        self._timestamp = None
+
+    def _process(
+        self, pid: int, elapsed: float | None
+    ) -> Tuple[Dict[str, Any], Tuple[int, int, int | None, int | None]] | None:
+        """Reads a process, ``None`` when it exited while being read.
+
+        Args:
+            pid: Process ID.
+            elapsed: Seconds since the previous snapshot, ``None`` for the first snapshot.
+
+        Returns:
+            Tuple[Dict[str, Any], Tuple[int, int, int | None, int | None]]:
+            Returns the process' information, and the counters to compute the rates from in the next snapshot.
+        """
+        directory = f"{self.proc}/{pid}"
+        if not (stat := _read(f"{directory}/stat")):
+            return
+        # Command names can have spaces and parentheses, so the fields are split after the last parenthesis
+        head, _, tail = stat.rpartition(b")")
+        fields = tail.split()
+        ticks = int(fields[UTIME]) + int(fields[STIME])
+        start = int(fields[STARTTIME])
+        io = _io_counters(_read(f"{directory}/io"))
+        read_bytes, write_bytes = io or (None, None)
+        process = dict(
+            pid=pid,
+            name=head.partition(b"(")[2].decode(errors="replace"),
+            state=fields[STATE].decode(),
+            threads=int(fields[THREADS]),
+            rss=int(fields[RSS]) * self._page_size,
+            vms=int(fields[VSIZE]),
+            cpu_percent=None,
+            read_rate=None,
+            write_rate=None,
+        )
+        previous = self._previous.get(pid)
+        if elapsed and previous and previous[0] == start:
+            process["cpu_percent"] = round(
+                (ticks - previous[1]) / self._clock_ticks / elapsed * 100, 2
+            )
+            if io and previous[2] is not None:
+                process["read_rate"] = (read_bytes - previous[2]) / elapsed
+                process["write_rate"] = (write_bytes - previous[3]) / elapsed
+        if self.smaps:
+            process.update(_smaps_rollup(_read(f"{directory}/smaps_rollup")))
+        return process, (start, ticks, read_bytes, write_bytes)
+
+    def _shard(
+        self, pids: List[int], elapsed: float | None
+    ) -> List[Tuple[Dict[str, Any], Tuple[int, int, int | None, int | None]]]:
+        """Reads a shard of the pid space."""
+        return [
+            result
+            for pid in pids
+            if (result := self._process(pid, elapsed)) is not None
+        ]
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Takes a snapshot of all the processes.
+
+        Returns:
+            List[Dict[str, Any]]:
+            Returns the information of each process, with the CPU and I/O rates set from the second snapshot onwards.
+        """
+        timestamp = time.monotonic()
+        elapsed = timestamp - self._timestamp if self._timestamp else None
+        with os.scandir(self.proc) as entries:
+            pids = [int(entry.name) for entry in entries if entry.name.isdigit()]
+        if (workers := self.workers) > 1:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._executor = ThreadPoolExecutor(workers)
+            # Interleaved, so the shards get a similar mix of short and long-lived processes
+            shards = [pids[index::workers] for index in range(workers)]
+            results = [
+                result
+                for shard in self._executor.map(
+                    self._shard, shards, [elapsed] * workers
+                )
+                for result in shard
+            ]
+        else:
+            results = self._shard(pids, elapsed)
+        # Replaced as a whole, which also drops the processes that exited since
+        self._previous = {process["pid"]: counters for process, counters in results}
+        self._timestamp = timestamp
+        return [process for process, _ in results]
+
+    def top(
+        self, n: int = 10, by: str = "memory", snapshot: List[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get the processes using the most memory, CPU or I/O.
+
+        Args:
+            n: Number of processes.
+            by: Resource to rank by - ``memory``, ``cpu`` or ``io``.
+            snapshot: Snapshot to rank, a new snapshot is taken when not set.
+
+        Returns:
+            List[Dict[str, Any]]:
+            Returns the top processes, in descending order.
+        """
+        if by not in SORT_KEYS:
+            raise ValueError(f"by must be one of {list(SORT_KEYS)}, received {by!r}")
+        # Selecting with a heap of size n is cheaper than sorting every process
+        return heapq.nlargest(
+            n, snapshot if snapshot is not None else self.snapshot(), SORT_KEYS[by]
+        )
+
+    def close(self) -> None:
+        """Shuts down the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def get_table(
+    proc: str | os.PathLike = PROC, smaps: bool = False, workers: int = 0
+) -> Table | None:
+    """Get a process table, only on Linux.
+
+    Args:
+        proc: Custom path for procfs.
+        smaps: Flag to include the proportional set size and swap of each process, which is slower to read.
+        workers: Number of threads to shard the pid space across, reads in the calling thread when not set.
+
+    See Also:
+        - Each call to ``snapshot()`` or ``top()`` computes the CPU and I/O rates since the previous call.
+
+    Returns:
+        Table:
+        Returns a process table object.
+    """
+    if config.OPERATING_SYSTEM != config.OperatingSystem.linux:
+        LOGGER.error("Process table is only available on Linux")
+        return
+    if not os.path.isdir(proc):
+        LOGGER.error(f"Process library {proc!r} doesn't exist")
+        return
+    return Table(proc, smaps, workers)
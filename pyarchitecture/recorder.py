@@ -0,0 +1,317 @@
+import json
+import logging
+import mmap
+import os
+import time
+from collections.abc import Generator
+from typing import Any, Dict, List, Tuple
+
+from pyarchitecture import config, cpu, disks, gpu, memory
+
+LOGGER = logging.getLogger(__name__)
+
+VERSION = 2
+PREFIX = "segment-"
+SUFFIX = ".ndjson"
+# Fields that only change on a reconfiguration (eg: swapon), stored once in the segment's header instead of each sample
+CONSTANTS = ("memory.total", "memory.swap_total", "memory.virtual_total")
+# Segments are rotated on whichever limit is reached first
+MAX_BYTES = 16 * 1024 * 1024
+MAX_AGE = 3_600.0
+
+
+def _dumps(record: Any) -> str:
+    """Serializes a record as a single compact JSON line."""
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+class Recorder:
+    """Appends samples of the changing numeric fields to a segmented NDJSON log.
+
+    >>> Recorder
+
+    Each segment starts with a header holding the static components, the constant fields and the order of the
+    changing fields, followed by one ``[timestamp, value, ...]`` array per sample.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_bytes: int = MAX_BYTES,
+        max_age: float = MAX_AGE,
+        disk_stats: bool = True,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._file = None
+        self._started = 0.0
+        self._static = None
+        self._constants = None
+        self._fields: List[str] = []
+        self._stats_sampler = None
+        if disk_stats and config.OPERATING_SYSTEM == config.OperatingSystem.linux:
+            self._stats_sampler = disks.get_stats_sampler()
+        os.makedirs(directory, exist_ok=True)
+
+    def _sample(self) -> Dict[str, int | float]:
+        """Collects the memory information and the disk stats, flattened into field names and values."""
+        values = {
+            f"memory.{key}": value
+            for key, value in (memory.get_memory_info(humanize=False) or {}).items()
+        }
+        if self._stats_sampler:
+            for device_id, stats in self._stats_sampler.sample().items():
+                for key, value in stats.items():
+                    values[f"disks.{device_id}.{key}"] = value
+        return values
+
+    def _rotate(
+        self,
+        timestamp: float,
+        static: Dict[str, Any],
+        constants: Dict[str, int | float],
+        fields: List[str],
+    ) -> None:
+        """Closes the current segment, and starts a new one with its header.
+
+        Args:
+            timestamp: Timestamp of the first sample in the segment.
+            static: Static components to store in the header.
+            constants: Constant fields to store in the header.
+            fields: Order of the changing fields in each sample.
+        """
+        self.close()
+        milliseconds, counter = round(timestamp * 1_000), 0
+        while True:
+            # Rotations within the same millisecond get a counter, so a segment is never written twice
+            name = (
+                f"{PREFIX}{milliseconds}-{counter}"
+                if counter
+                else f"{PREFIX}{milliseconds}"
+            )
+            path = os.path.join(self.directory, f"{name}{SUFFIX}")
+            try:
+                # Line buffered, so each sample reaches the file as soon as it is recorded
+                self._file = open(path, "x", buffering=1)
+                break
+            except FileExistsError:
+                counter += 1
+        self._file.write(
+            _dumps(
+                dict(
+                    version=VERSION,
+                    started=timestamp,
+                    fields=fields,
+                    constants=constants,
+                    static=static,
+                )
+            )
+        )
+        self._started, self._static = timestamp, static
+        self._constants, self._fields = constants, fields
+        LOGGER.debug(f"Started recording segment {path!r}")
+
+    def record(self) -> Dict[str, int | float]:
+        """Records a sample, rotating the segment when it is full, too old, or the static components changed.
+
+        Returns:
+            Dict[str, int | float]:
+            Returns the recorded sample.
+        """
+        timestamp = time.time()
+        static = dict(
+            CPU=cpu.get_cpu_info(), GPU=gpu.get_gpu_info(), Disks=disks.get_all_disks()
+        )
+        values = self._sample()
+        constants = {key: value for key, value in values.items() if key in CONSTANTS}
+        changing = {key: value for key, value in values.items() if key not in CONSTANTS}
+        if (
+            self._file is None
+            or static != self._static
+            or constants != self._constants
+            or list(changing) != self._fields
+            or self._file.tell() >= self.max_bytes
+            or timestamp - self._started >= self.max_age
+        ):
+            self._rotate(timestamp, static, constants, list(changing))
+        self._file.write(_dumps([round(timestamp, 3), *changing.values()]))
+        return values
+
+    def run(self, interval: float = 5.0, count: int = None) -> None:
+        """Records samples at an interval, until the count is reached or interrupted.
+
+        Args:
+            interval: Interval in seconds between samples.
+            count: Number of samples to record, records indefinitely when not set.
+        """
+        recorded = 0
+        try:
+            while count is None or recorded < count:
+                self.record()
+                recorded += 1
+                if count is None or recorded < count:
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            LOGGER.info(f"Stopped recording after {recorded} samples")
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Closes the current segment."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "Recorder":
+        """Opens the recorder as a context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Closes the current segment when exiting the context manager."""
+        self.close()
+        if self._stats_sampler:
+            self._stats_sampler.close()
+
+
+class Segment:
+    """Reader for a single segment, memory-mapped so range scans can bisect on the samples' timestamps.
+
+    >>> Segment
+
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = (
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                if os.fstat(file.fileno()).st_size
+                else b""
+            )
+        self._body = self._map.find(b"\n") + 1
+        self.header: Dict[str, Any] = json.loads(self._map[: self._body] or b"{}")
+        self.fields: List[str] = self.header.get("fields", [])
+        # Segments of the first version store every field in the samples
+        self.constants: Dict[str, int | float] = self.header.get("constants", {})
+        self.static: Dict[str, Any] = self.header.get("static", {})
+
+    def _timestamp_at(self, position: int) -> float:
+        """Get the timestamp of the sample that starts at a position, without parsing the rest of the line."""
+        if (newline := self._map.find(b"\n", position)) == -1:
+            # Partially written samples compare greater than any timestamp
+            return float("inf")
+        if (separator := self._map.find(b",", position, newline)) == -1:
+            separator = newline - 1
+        return float(self._map[position + 1 : separator])  # noqa: E203
+
+    def _line_start(self, position: int) -> int:
+        """Get the start of the first line at or after a position."""
+        if position <= self._body:
+            return self._body
+        return self._map.find(b"\n", position - 1) + 1 or len(self._map)
+
+    def _seek(self, start: float) -> int:
+        """Bisects for the first sample with a timestamp at or after the start."""
+        low, high = self._body, len(self._map)
+        while low < high:
+            middle = (low + high) // 2
+            line = self._line_start(middle)
+            if line >= len(self._map) or self._timestamp_at(line) >= start:
+                high = middle
+            else:
+                low = middle + 1
+        return self._line_start(low)
+
+    def scan(self, start: float = None, end: float = None) -> Generator[Dict[str, Any]]:
+        """Iterates the samples within a time range lazily.
+
+        Args:
+            start: Epoch time to start from, inclusive.
+            end: Epoch time to stop at, exclusive.
+
+        Yields:
+            Dict[str, Any]:
+            Yields the timestamp and the values of each sample, including the constant fields.
+        """
+        size = len(self._map)
+        position = self._seek(start) if start is not None else self._body
+        keys = ["timestamp", *self.fields]
+        while position < size:
+            newline = self._map.find(b"\n", position)
+            if newline == -1:
+                # Partially written sample at the end of a segment that is still being recorded
+                return
+            row = json.loads(self._map[position:newline])
+            if end is not None and row[0] >= end:
+                return
+            yield {**dict(zip(keys, row)), **self.constants}
+            position = newline + 1
+
+    def __iter__(self) -> Generator[Dict[str, Any]]:
+        """Iterates all the samples in the segment."""
+        return self.scan()
+
+    def close(self) -> None:
+        """Closes the memory map."""
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+
+def segments(directory: str | os.PathLike) -> List[str]:
+    """Lists the segments in a directory in the order they were recorded.
+
+    Args:
+        directory: Directory of the recording.
+
+    Returns:
+        List[str]:
+        Returns the paths of the segments.
+    """
+    names = [
+        name
+        for name in os.listdir(directory)
+        if name.startswith(PREFIX) and name.endswith(SUFFIX)
+    ]
+    return [os.path.join(directory, name) for name in sorted(names, key=_order)]
+
+
+def _order(path: str | os.PathLike) -> Tuple[int, int]:
+    """Get the millisecond a segment was started at and its counter, from its filename."""
+    name = os.path.basename(path).removeprefix(PREFIX).removesuffix(SUFFIX)
+    milliseconds, _, counter = name.partition("-")
+    return int(milliseconds), int(counter or 0)
+
+
+def started(path: str | os.PathLike) -> float:
+    """Get the epoch time a segment was started at, from its filename."""
+    return _order(path)[0] / 1_000
+
+
+def read(
+    directory: str | os.PathLike, start: float = None, end: float = None
+) -> Generator[Dict[str, Any]]:
+    """Iterates the recorded samples within a time range lazily, skipping the segments outside it.
+
+    Args:
+        directory: Directory of the recording.
+        start: Epoch time to start from, inclusive.
+        end: Epoch time to stop at, exclusive.
+
+    Yields:
+        Dict[str, Any]:
+        Yields the timestamp and the values of each sample.
+    """
+    paths = segments(directory)
+    starts = [started(path) for path in paths]
+    for index, path in enumerate(paths):
+        # Segments that end before the start (i.e. the next one starts before it), or start after the end
+        if start is not None and index + 1 < len(paths) and starts[index + 1] < start:
+            continue
+        if end is not None and starts[index] >= end:
+            break
+        segment = Segment(path)
+        try:
+            yield from segment.scan(start, end)
+        finally:
+            segment.close()
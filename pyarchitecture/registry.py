@@ -0,0 +1,215 @@
+import atexit
+import contextlib
+import json
+import logging
+import os
+import shutil
+import threading
+from typing import Dict, List, Tuple
+
+from pyarchitecture import config
+
+LOGGER = logging.getLogger(__name__)
+
+REGISTRY_FILE = os.path.join(config.CACHE_DIR, "registry.json")
+# Bumped whenever the layout of the registry file changes
+VERSION = 1
+
+
+def _path_mtimes() -> Dict[str, int]:
+    """Get the modification time of each directory in PATH, which changes when a tool is installed or removed.
+
+    Returns:
+        Dict[str, int]:
+        Returns the modification time in nanoseconds for each directory, ``0`` for the missing ones.
+    """
+    mtimes = {}
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            mtimes[directory] = os.stat(directory).st_mtime_ns
+        except OSError:
+            mtimes[directory] = 0
+    return mtimes
+
+
+def discover(candidates: List[Tuple[str, str]]) -> Dict[str, str]:
+    """Probes the candidates of a component, to find the backends that are available on the host.
+
+    Args:
+        candidates: List of backends and an executable's name or path, in order of preference.
+
+    Returns:
+        Dict[str, str]:
+        Returns the resolved library path for each available backend, in order of preference.
+    """
+    available = {}
+    for backend, library in candidates:
+        if backend in available:
+            continue
+        path = library if os.path.isabs(library) else shutil.which(library)
+        if path and os.path.exists(path):
+            available[backend] = path
+    return available
+
+
+def _default(candidates: List[Tuple[str, str]]) -> str:
+    """Get the library path to fall back on when none of the candidates are available.
+
+    Args:
+        candidates: List of backends and an executable's name or path, in order of preference.
+
+    Returns:
+        str:
+        Returns the first absolute path, so the error that follows names the expected location.
+    """
+    return next((library for _, library in candidates if os.path.isabs(library)), "")
+
+
+class Registry:
+    """Registry of the available backends for each component, resolved once per process.
+
+    >>> Registry
+
+    The discovery is persisted to a file when the interpreter exits, and reused as long as PATH and its directories
+    are unchanged.
+    """
+
+    def __init__(self, registry_file: str | os.PathLike = REGISTRY_FILE):
+        self.registry_file = registry_file
+        self._backends: Dict[str, Dict[str, str]] | None = None
+        self._lock = threading.Lock()
+        self._persisting = False
+
+    def _load(self) -> Dict[str, Dict[str, str]] | None:
+        """Loads the persisted discovery, when it is still valid for the host.
+
+        Returns:
+            Dict[str, Dict[str, str]]:
+            Returns the available backends for each component, or ``None`` when missing or stale.
+        """
+        try:
+            with open(self.registry_file) as file:
+                record = json.load(file)
+        except (OSError, ValueError):
+            return
+        if (
+            record.get("version") != VERSION
+            or record.get("os") != config.OPERATING_SYSTEM
+            or record.get("path_mtimes") != _path_mtimes()
+        ):
+            LOGGER.debug(f"Registry file {self.registry_file!r} is stale")
+            return
+        backends = record.get("backends", {})
+        # Libraries that were removed since the discovery, invalidate it as well
+        if not all(
+            os.path.exists(path)
+            for available in backends.values()
+            for path in available.values()
+        ):
+            return
+        return backends
+
+    def _dump(self, backends: Dict[str, Dict[str, str]]) -> None:
+        """Persists the discovery atomically, ignoring failures like a read-only home directory.
+
+        Args:
+            backends: Available backends for each component.
+        """
+        record = dict(
+            version=VERSION,
+            os=config.OPERATING_SYSTEM,
+            path_mtimes=_path_mtimes(),
+            backends=backends,
+        )
+        temporary = f"{self.registry_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.registry_file), exist_ok=True)
+            with open(temporary, "w") as file:
+                json.dump(record, file, indent=2)
+            os.replace(temporary, self.registry_file)
+        except OSError as error:
+            LOGGER.debug(f"Failed to persist the registry: {error}")
+            with contextlib.suppress(OSError):
+                os.remove(temporary)
+
+    def _persist(self) -> None:
+        """Persists the discovery made in this process, if any."""
+        if (backends := self._backends) is not None:
+            self._dump(backends)
+
+    def backends(self) -> Dict[str, Dict[str, str]]:
+        """Get the available backends for each component, discovering them on first use.
+
+        Returns:
+            Dict[str, Dict[str, str]]:
+            Returns the resolved library path for each available backend, in order of preference.
+        """
+        if self._backends is not None:
+            return self._backends
+        with self._lock:
+            if self._backends is None:
+                if (backends := self._load()) is None:
+                    backends = {
+                        component: discover(candidates)
+                        for component, candidates in config.LIBRARIES[
+                            config.OPERATING_SYSTEM
+                        ].items()
+                    }
+                    # Deferred to exit, so importing or using the package never writes on the hot path
+                    if not self._persisting:
+                        self._persisting = True
+                        atexit.register(self._persist)
+                self._backends = backends
+        return self._backends
+
+    def library(self, component: str) -> str:
+        """Get the library path of the preferred backend that is available for a component.
+
+        Args:
+            component: Name of the component - ``cpu``, ``gpu``, ``disks`` or ``memory``.
+
+        Returns:
+            str:
+            Returns the resolved library path.
+        """
+        if available := self.backends().get(component):
+            return next(iter(available.values()))
+        return _default(config.LIBRARIES[config.OPERATING_SYSTEM][component])
+
+    def refresh(self) -> None:
+        """Drops the discovery in memory and on disk, so the backends are probed again on next use."""
+        with self._lock:
+            self._backends = None
+            with contextlib.suppress(OSError):
+                os.remove(self.registry_file)
+
+
+REGISTRY = Registry()
+
+
+def backends() -> Dict[str, Dict[str, str]]:
+    """Get the available backends for each component on the host.
+
+    Returns:
+        Dict[str, Dict[str, str]]:
+        Returns the resolved library path for each available backend, in order of preference.
+    """
+    return REGISTRY.backends()
+
+
+def library(component: str) -> str:
+    """Get the library path of the preferred backend that is available for a component.
+
+    Args:
+        component: Name of the component - ``cpu``, ``gpu``, ``disks`` or ``memory``.
+
+    Returns:
+        str:
+        Returns the resolved library path.
+    """
+    return REGISTRY.library(component)
+
+
+def refresh() -> None:
+    """Drops the discovered backends, so they are probed again on next use."""
+    REGISTRY.refresh()
@@ -0,0 +1,544 @@
+import asyncio
+import contextlib
+import json
+import logging
+import math
+import os
+import subprocess
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from collections.abc import Generator
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Tuple
+
+from pyarchitecture import config
+
+LOGGER = logging.getLogger(__name__)
+
+# Timeout (in seconds) for each external tool, by the basename of its executable
+# PowerShell and system_profiler are slow to start, so they get a longer allowance
+TIMEOUTS = dict(
+    diskutil=10.0,
+    lsblk=5.0,
+    lspci=5.0,
+    powershell=30.0,
+    pwsh=30.0,
+    sysctl=2.0,
+    system_profiler=20.0,
+    wmic=10.0,
+)
+DEFAULT_TIMEOUT = 10.0
+# Maximum number of child processes running at once, across all threads
+MAX_PROCESSES = int(os.environ.get("PYARCHITECTURE_MAX_PROCESSES", 4))
+# Number of recent latencies kept per tool, to compute the percentiles from
+SAMPLES = 1_024
+BUNDLE_VERSION = 1
+# Seconds to wait for a killed child to exit, before leaving it to be reaped in the background
+REAP_TIMEOUT = 1.0
+# Seconds between the attempts of a coroutine to take a process slot, when all of them are in use
+SLOT_POLL_INTERVAL = 0.01
+
+
+def tool_name(executable: str | os.PathLike) -> str:
+    """Get the name of a tool from its executable, eg: ``lsblk`` for ``/usr/bin/lsblk``."""
+    name = os.path.basename(os.fspath(executable)).lower()
+    return name.removesuffix(".exe")
+
+
+def bundle_key(command: List[str]) -> str:
+    """Get the key of a command in a bundle, with the tool's name instead of its path, so bundles are portable."""
+    return json.dumps([tool_name(command[0]), *command[1:]])
+
+
+def load_bundle(path: str | os.PathLike) -> Dict[str, Any]:
+    """Loads a bundle of recorded tool outputs.
+
+    Args:
+        path: Path of the bundle.
+
+    Returns:
+        Dict[str, Any]:
+        Returns the version, the operating system it was recorded on, and the output of each command.
+    """
+    with open(path) as file:
+        bundle = json.load(file)
+    if bundle.get("version") != BUNDLE_VERSION:
+        raise ValueError(
+            f"Bundle {os.fspath(path)!r} has version {bundle.get('version')}, expected {BUNDLE_VERSION}"
+        )
+    return bundle
+
+
+def _reap(process: subprocess.Popen) -> None:
+    """Waits for a killed child to exit, and closes its pipes."""
+    process.wait()
+    process.stdout.close()
+    process.stderr.close()
+
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    """Get the percentile from sorted samples, using the nearest-rank method."""
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+class Runner:
+    """Runs the external tools with a timeout, a limit on concurrent child processes and single-flight calls.
+
+    >>> Runner
+
+    Concurrent calls with the same command share a single child process, and its result.
+    Outputs can be recorded into a bundle, and replayed from it later without spawning any process.
+    """
+
+    def __init__(
+        self, timeouts: Dict[str, float] = None, max_processes: int = MAX_PROCESSES
+    ):
+        self.timeouts = {**TIMEOUTS, **(timeouts or {})}
+        self._slots = threading.BoundedSemaphore(max_processes)
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, ...], Future] = {}
+        self._counts: Dict[str, Counter] = defaultdict(Counter)
+        self._latencies: Dict[str, deque] = defaultdict(lambda: deque(maxlen=SAMPLES))
+        self._recording: Dict[str, Dict[str, Any]] | None = None
+        self._replaying: Dict[str, Dict[str, Any]] | None = None
+        self._hooks: List[Callable[[str, float], None]] = []
+
+    def _count(self, tool: str, outcome: str) -> None:
+        """Increments the count of an outcome for a tool."""
+        with self._lock:
+            self._counts[tool][outcome] += 1
+
+    def _observe(self, tool: str, duration: float) -> None:
+        """Records the duration of a child process, and passes it on to the hooks."""
+        self._latencies[tool].append(duration)
+        for hook in tuple(self._hooks):
+            hook(tool, duration)
+
+    def _claim(self, key: Tuple[str, ...], tool: str) -> Tuple[Future, bool]:
+        """Counts a call, and gets the future of the identical command that is already running.
+
+        Args:
+            key: Command as a tuple of arguments.
+            tool: Name of the tool, for the stats.
+
+        Returns:
+            Tuple[Future, bool]:
+            Returns the future for the command's result, and whether the caller leads it by spawning the process.
+        """
+        with self._lock:
+            self._counts[tool]["calls"] += 1
+            if leader := (future := self._inflight.get(key)) is None:
+                future = self._inflight[key] = Future()
+            else:
+                self._counts[tool]["coalesced"] += 1
+        return future, leader
+
+    def _release(self, key: Tuple[str, ...]) -> None:
+        """Removes a command from the ones running, once its future is set."""
+        with self._lock:
+            del self._inflight[key]
+
+    def _timed_out(self, tool: str, timeout: float) -> None:
+        """Reports a child process that timed out."""
+        LOGGER.error(f"{tool!r} timed out after {timeout} seconds")
+        self._count(tool, "timeouts")
+
+    def _complete(
+        self, command: List[str], tool: str, returncode: int, stdout: str, stderr: str
+    ) -> subprocess.CompletedProcess:
+        """Counts a failed exit and records the output of a child process that completed.
+
+        Args:
+            command: Command that was run.
+            tool: Name of the tool, for the stats.
+            returncode: Exit code of the child process.
+            stdout: Text output of the child process.
+            stderr: Text error output of the child process.
+
+        Returns:
+            subprocess.CompletedProcess:
+            Returns the completed process with the text output.
+        """
+        if returncode:
+            self._count(tool, "errors")
+        if self._recording is not None:
+            with self._lock:
+                self._recording[bundle_key(command)] = dict(
+                    stdout=stdout, stderr=stderr, returncode=returncode
+                )
+        return subprocess.CompletedProcess(command, returncode, stdout, stderr)
+
+    def _spawn(self, command: List[str], tool: str) -> subprocess.CompletedProcess:
+        """Runs a child process once a slot is available, recording its latency.
+
+        Args:
+            command: Command to run.
+            tool: Name of the tool, for the timeout and the stats.
+
+        Returns:
+            subprocess.CompletedProcess:
+            Returns the completed process with the text output.
+        """
+        timeout = self.timeouts.get(tool, DEFAULT_TIMEOUT)
+        with self._slots:
+            start = time.perf_counter()
+            try:
+                process = subprocess.Popen(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+            except OSError:
+                self._count(tool, "errors")
+                self._observe(tool, time.perf_counter() - start)
+                raise
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self._timed_out(tool, timeout)
+                process.kill()
+                # A child in uninterruptible sleep (eg: lsblk on a dead device) ignores SIGKILL until its I/O returns,
+                # so it is only waited on briefly, and reaped by a daemon thread if still around
+                try:
+                    process.wait(REAP_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    LOGGER.warning(
+                        f"{tool!r} (pid {process.pid}) didn't exit when killed, reaping it in the background"
+                    )
+                    threading.Thread(target=_reap, args=(process,), daemon=True).start()
+                else:
+                    _reap(process)
+                raise
+            finally:
+                self._observe(tool, time.perf_counter() - start)
+        return self._complete(command, tool, process.returncode, stdout, stderr)
+
+    async def _aspawn(
+        self, command: List[str], tool: str
+    ) -> subprocess.CompletedProcess:
+        """Runs an asyncio child process once a slot is available, recording its latency.
+
+        Args:
+            command: Command to run.
+            tool: Name of the tool, for the timeout and the stats.
+
+        Returns:
+            subprocess.CompletedProcess:
+            Returns the completed process with the text output.
+        """
+        timeout = self.timeouts.get(tool, DEFAULT_TIMEOUT)
+        # Slots are shared with the threads, so the event loop polls for one instead of blocking on the semaphore
+        while not self._slots.acquire(blocking=False):
+            await asyncio.sleep(SLOT_POLL_INTERVAL)
+        try:
+            start = time.perf_counter()
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except OSError:
+                self._count(tool, "errors")
+                self._observe(tool, time.perf_counter() - start)
+                raise
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                self._timed_out(tool, timeout)
+                process.kill()
+                try:
+                    await asyncio.wait_for(process.wait(), REAP_TIMEOUT)
+                except asyncio.TimeoutError:
+                    # Left to the event loop's child watcher, which reaps it whenever it exits
+                    LOGGER.warning(
+                        f"{tool!r} (pid {process.pid}) didn't exit when killed, leaving it to the event loop"
+                    )
+                raise subprocess.TimeoutExpired(command, timeout)
+            except asyncio.CancelledError:
+                # Avoid leaving orphan processes behind, when the caller's deadline is reached
+                process.kill()
+                raise
+            finally:
+                self._observe(tool, time.perf_counter() - start)
+        finally:
+            self._slots.release()
+        return self._complete(
+            command, tool, process.returncode, stdout.decode(), stderr.decode()
+        )
+
+    def _replay(self, command: List[str], tool: str) -> subprocess.CompletedProcess:
+        """Get the recorded output of a command, in place of running it.
+
+        Args:
+            command: Command to replay.
+            tool: Name of the tool, for the stats.
+
+        Raises:
+            FileNotFoundError:
+            When the command was not recorded, like a tool that is not installed.
+
+        Returns:
+            subprocess.CompletedProcess:
+            Returns the completed process with the recorded output.
+        """
+        self._count(tool, "calls")
+        if (output := self._replaying.get(bundle_key(command))) is None:
+            raise FileNotFoundError(f"No recorded output for {command}")
+        self._count(tool, "replayed")
+        return subprocess.CompletedProcess(
+            command, output["returncode"], output["stdout"], output["stderr"]
+        )
+
+    def run(
+        self, command: List[str | os.PathLike], check: bool = False
+    ) -> subprocess.CompletedProcess:
+        """Runs a command, or waits for the identical command that is already running.
+
+        Args:
+            command: Command to run, as a list of arguments.
+            check: Flag to raise ``CalledProcessError`` when the command exits with a non-zero code.
+
+        Raises:
+            subprocess.TimeoutExpired:
+            When the command doesn't finish within the tool's timeout.
+
+        Returns:
+            subprocess.CompletedProcess:
+            Returns the completed process with the text output.
+        """
+        command = [os.fspath(argument) for argument in command]
+        key, tool = tuple(command), tool_name(command[0])
+        if self._replaying is not None:
+            result = self._replay(command, tool)
+            if check:
+                result.check_returncode()
+            return result
+        future, leader = self._claim(key, tool)
+        if leader:
+            try:
+                future.set_result(self._spawn(command, tool))
+            except BaseException as error:
+                future.set_exception(error)
+            finally:
+                self._release(key)
+        result = future.result()
+        if check:
+            result.check_returncode()
+        return result
+
+    async def arun(
+        self, command: List[str | os.PathLike], check: bool = False
+    ) -> subprocess.CompletedProcess:
+        """Asynchronous counterpart of :meth:`run`, spawning an asyncio child process without blocking a thread.
+
+        Args:
+            command: Command to run, as a list of arguments.
+            check: Flag to raise ``CalledProcessError`` when the command exits with a non-zero code.
+
+        See Also:
+            - Shares the timeouts, the limit on concurrent child processes, the single-flight calls, the stats,
+              and the record and replay of outputs with :meth:`run`.
+
+        Raises:
+            subprocess.TimeoutExpired:
+            When the command doesn't finish within the tool's timeout.
+
+        Returns:
+            subprocess.CompletedProcess:
+            Returns the completed process with the text output.
+        """
+        command = [os.fspath(argument) for argument in command]
+        key, tool = tuple(command), tool_name(command[0])
+        if self._replaying is not None:
+            result = self._replay(command, tool)
+        else:
+            future, leader = self._claim(key, tool)
+            if leader:
+                try:
+                    future.set_result(await self._aspawn(command, tool))
+                except BaseException as error:
+                    future.set_exception(error)
+                finally:
+                    self._release(key)
+            # Awaited without blocking, whether the identical command was started by a thread or a coroutine
+            result = await asyncio.wrap_future(future)
+        if check:
+            result.check_returncode()
+        return result
+
+    @contextlib.contextmanager
+    def timed(self, hook: Callable[[str, float], None]) -> Generator[None]:
+        """Calls a hook with the tool's name and the duration in seconds, for each child process run within the context.
+
+        Args:
+            hook: Function to call from the thread that ran the child process, once it exits or is killed.
+        """
+        with self._lock:
+            self._hooks.append(hook)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._hooks.remove(hook)
+
+    @contextlib.contextmanager
+    def record(self, path: str | os.PathLike) -> Generator[None]:
+        """Records the output of every command run within the context into a bundle.
+
+        Args:
+            path: Path of the bundle, written atomically when exiting the context.
+        """
+        self._recording = {}
+        try:
+            yield
+        finally:
+            recording, self._recording = self._recording, None
+            bundle = dict(
+                version=BUNDLE_VERSION,
+                os=config.OPERATING_SYSTEM,
+                commands=recording,
+            )
+            temporary = f"{os.fspath(path)}.{os.getpid()}.tmp"
+            with open(temporary, "w") as file:
+                json.dump(bundle, file, indent=2)
+            os.replace(temporary, path)
+            LOGGER.info(f"Recorded {len(recording)} commands into {os.fspath(path)!r}")
+
+    @contextlib.contextmanager
+    def replay(self, path: str | os.PathLike) -> Generator[None]:
+        """Serves the output of the commands run within the context from a bundle, without spawning any process.
+
+        Args:
+            path: Path of the bundle.
+        """
+        self._replaying = load_bundle(path)["commands"]
+        try:
+            yield
+        finally:
+            self._replaying = None
+
+    def stats(self) -> Dict[str, Dict[str, int | float]]:
+        """Get the call counts and latency percentiles for each tool.
+
+        Returns:
+            Dict[str, Dict[str, int | float]]:
+            Returns the calls, coalesced, replayed, timeouts, errors and the p50, p90, p99 and max latencies in seconds.
+        """
+        with self._lock:
+            stats = {}
+            for tool, counts in self._counts.items():
+                ordered = sorted(self._latencies[tool])
+                stats[tool] = dict(
+                    calls=counts["calls"],
+                    coalesced=counts["coalesced"],
+                    replayed=counts["replayed"],
+                    timeouts=counts["timeouts"],
+                    errors=counts["errors"],
+                )
+                if ordered:
+                    stats[tool].update(
+                        p50=_percentile(ordered, 50),
+                        p90=_percentile(ordered, 90),
+                        p99=_percentile(ordered, 99),
+                        max=ordered[-1],
+                    )
+            return stats
+
+
+RUNNER = Runner()
+
+
+def run(
+    command: List[str | os.PathLike], check: bool = False
+) -> subprocess.CompletedProcess:
+    """Runs a command through the shared runner.
+
+    Args:
+        command: Command to run, as a list of arguments.
+        check: Flag to raise ``CalledProcessError`` when the command exits with a non-zero code.
+
+    Raises:
+        subprocess.TimeoutExpired:
+        When the command doesn't finish within the tool's timeout.
+
+    Returns:
+        subprocess.CompletedProcess:
+        Returns the completed process with the text output.
+    """
+    return RUNNER.run(command, check)
+
+
+async def arun(
+    command: List[str | os.PathLike], check: bool = False
+) -> subprocess.CompletedProcess:
+    """Runs a command as an asyncio child process through the shared runner.
+
+    Args:
+        command: Command to run, as a list of arguments.
+        check: Flag to raise ``CalledProcessError`` when the command exits with a non-zero code.
+
+    Raises:
+        subprocess.TimeoutExpired:
+        When the command doesn't finish within the tool's timeout.
+
+    Returns:
+        subprocess.CompletedProcess:
+        Returns the completed process with the text output.
+    """
+    return await RUNNER.arun(command, check)
+
+
+def stats() -> Dict[str, Dict[str, int | float]]:
+    """Get the call counts and latency percentiles for each tool.
+
+    Returns:
+        Dict[str, Dict[str, int | float]]:
+        Returns the calls, coalesced, replayed, timeouts, errors and the p50, p90, p99 and max latencies in seconds.
+    """
+    return RUNNER.stats()
+
+
+def timed(hook: Callable[[str, float], None]) -> contextlib.AbstractContextManager:
+    """Calls a hook with the tool's name and the duration in seconds, for each child process run by the shared runner.
+
+    Args:
+        hook: Function to call once each child process exits or is killed.
+
+    Returns:
+        contextlib.AbstractContextManager:
+        Returns a context manager that removes the hook when exiting.
+    """
+    return RUNNER.timed(hook)
+
+
+def record(path: str | os.PathLike) -> contextlib.AbstractContextManager:
+    """Records the output of every command run through the shared runner within the context into a bundle.
+
+    Args:
+        path: Path of the bundle.
+
+    Returns:
+        contextlib.AbstractContextManager:
+        Returns a context manager that writes the bundle when exiting.
+    """
+    return RUNNER.record(path)
+
+
+def replay(path: str | os.PathLike) -> contextlib.AbstractContextManager:
+    """Serves the output of the commands run through the shared runner within the context from a bundle.
+
+    Args:
+        path: Path of the bundle.
+
+    See Also:
+        - Bundles recorded on one OS can be replayed on any other, by calling that OS' backend directly,
+          eg: ``pyarchitecture.disks.macOS.drive_info("diskutil")`` with a bundle recorded on macOS.
+
+    Returns:
+        contextlib.AbstractContextManager:
+        Returns a context manager that stops replaying when exiting.
+    """
+    return RUNNER.replay(path)
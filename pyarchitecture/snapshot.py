@@ -0,0 +1,170 @@
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List
+
+from pyarchitecture import config, cpu, disks, gpu, squire
+
+LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = os.path.join(config.CACHE_DIR, "snapshot.json")
+BOOT_ID = "/proc/sys/kernel/random/boot_id"
+# Directories whose listing changes when a disk or a PCI device is hot-plugged
+HARDWARE_DIRS = ("/sys/block", "/sys/bus/pci/devices")
+# Components that can only change across a reboot or a hot-plug, memory is always collected live
+STATIC = ("Disks", "CPU", "GPU")
+
+
+def _listing(directory: str) -> List[str]:
+    """Get the sorted listing of a directory, or an empty list when it can't be read."""
+    try:
+        return sorted(os.listdir(directory))
+    except OSError:
+        return []
+
+
+def _mounts_digest() -> str:
+    """Get a digest of the device and mountpoint pairs, which changes on every mount and umount."""
+    from pyarchitecture.disks import linux
+
+    pairs = sorted(linux.mount_devices().items())
+    return hashlib.sha1(json.dumps(pairs).encode()).hexdigest()
+
+
+def signature() -> Dict[str, Any] | None:
+    """Get the signature that scopes the snapshot to the current boot and hardware, only on Linux.
+
+    Returns:
+        Dict[str, Any]:
+        Returns the boot ID, the listing of the hardware directories, a digest of the mounts and the resolved library
+        paths.
+    """
+    if config.OPERATING_SYSTEM != config.OperatingSystem.linux:
+        return
+    if not (boot_id := squire.read_attribute(BOOT_ID)):
+        return
+    return dict(
+        boot_id=boot_id,
+        hardware={directory: _listing(directory) for directory in HARDWARE_DIRS},
+        # Disks are stored with their mountpoints, so a mount or umount makes the snapshot stale as well
+        mounts=_mounts_digest(),
+        # Libraries are part of the signature, so overriding them through the env vars skips the snapshot
+        libraries=dict(
+            Disks=disks._get_disk_lib(None),
+            CPU=cpu._get_cpu_lib(None),
+            GPU=gpu._get_gpu_lib(None),
+        ),
+    )
+
+
+class Snapshot:
+    """On-disk snapshot of the static components, scoped to the current boot and hardware.
+
+    >>> Snapshot
+
+    Writes go through a temporary file and an atomic rename, so concurrent readers never see a partial file.
+    """
+
+    def __init__(self, snapshot_file: str | os.PathLike = SNAPSHOT_FILE):
+        self.snapshot_file = snapshot_file
+        self.signature = signature()
+        self._lock = threading.Lock()
+        self.components = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        """Loads the components from the snapshot file, when its signature matches the host's.
+
+        Returns:
+            Dict[str, Any]:
+            Returns the stored components, or an empty dictionary when missing or stale.
+        """
+        if self.signature is None:
+            return {}
+        try:
+            with open(self.snapshot_file) as file:
+                record = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if record.get("signature") != self.signature:
+            LOGGER.debug(f"Snapshot {self.snapshot_file!r} is stale")
+            return {}
+        return record.get("components", {})
+
+    def _dump(self) -> None:
+        """Stores the components atomically, merged with the ones stored by concurrent writers."""
+        components = {**self._load(), **self.components}
+        temporary = f"{self.snapshot_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_file), exist_ok=True)
+            with open(temporary, "w") as file:
+                json.dump(dict(signature=self.signature, components=components), file)
+            os.replace(temporary, self.snapshot_file)
+        except OSError as error:
+            LOGGER.debug(f"Failed to store the snapshot: {error}")
+            with contextlib.suppress(OSError):
+                os.remove(temporary)
+
+    def get(self, component: str, collector: Callable[[], Any]) -> Any:
+        """Get a component from the snapshot, collecting and storing it when missing.
+
+        Args:
+            component: Name of the component - ``Disks``, ``CPU`` or ``GPU``.
+            collector: Function to collect the component.
+
+        Returns:
+            Any:
+            Returns the component's information.
+        """
+        if self.signature is None or component not in STATIC:
+            return collector()
+        with self._lock:
+            if component in self.components:
+                return self.components[component]
+        value = collector()
+        # Failed collections are not stored, so they are retried on the next run
+        if value is not None:
+            with self._lock:
+                self.components[component] = value
+                self._dump()
+        return value
+
+
+def collectors(
+    collectors_: Dict[str, Callable[[], Any]],
+    snapshot_file: str | os.PathLike = SNAPSHOT_FILE,
+) -> Dict[str, Callable[[], Any]]:
+    """Wraps the static components' collectors to serve from the snapshot.
+
+    Args:
+        collectors_: Collector function for each component.
+        snapshot_file: Path to the snapshot file.
+
+    Returns:
+        Dict[str, Callable[[], Any]]:
+        Returns the collector function for each component, with memory left as is.
+        Every component is collected live off Linux, where there's no boot ID to scope the snapshot to.
+    """
+    snapshot = Snapshot(snapshot_file)
+    if snapshot.signature is None:
+        if config.OPERATING_SYSTEM != config.OperatingSystem.linux:
+            LOGGER.warning("Snapshots are only available on Linux, collecting live")
+        else:
+            LOGGER.warning(f"Boot ID {BOOT_ID!r} is unavailable, collecting live")
+    return {
+        name: functools.partial(snapshot.get, name, func) if name in STATIC else func
+        for name, func in collectors_.items()
+    }
+
+
+def clear(snapshot_file: str | os.PathLike = SNAPSHOT_FILE) -> None:
+    """Removes the snapshot, so the static components are collected again on the next run.
+
+    Args:
+        snapshot_file: Path to the snapshot file.
+    """
+    with contextlib.suppress(OSError):
+        os.remove(snapshot_file)
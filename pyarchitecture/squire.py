@@ -1,4 +1,10 @@
+import importlib
 import math
+import os
+from types import ModuleType
+from typing import List
+
+from pyarchitecture import config
 
 
 def format_nos(input_: float) -> int | float:
@@ -56,6 +62,11 @@ def convert_to_bytes(size_str: str) -> int:
 
     # Strip extra spaces and make the string uppercase
     size_str = size_str.strip().upper()
+    # Two-letter units (eg: 1.82 TB, 512 MiB) are reduced to their first letter, except for plain bytes
+    if size_str.endswith("IB"):
+        size_str = size_str[:-2]
+    elif size_str.endswith("B") and size_str[-2:-1].isalpha():
+        size_str = size_str[:-1]
 
     # Find the last character, which should indicate the unit (B, K, M, G, T, P, E)
     if size_str[-1] in units:
@@ -76,3 +87,54 @@ def convert_to_bytes(size_str: str) -> int:
 
     else:
         raise ValueError("Invalid size unit. Supported units are B, K, M, G, T, P, E.")
+
+
+def parse_cpu_list(cpu_list: str) -> List[int]:
+    """Parses a CPU list in the kernel's list format (eg: ``0-3,8,10-11``).
+
+    Args:
+        cpu_list: CPU list as a string.
+
+    Returns:
+        List[int]:
+        Returns a sorted list of CPU numbers.
+    """
+    cpus = set()
+    for part in cpu_list.strip().split(","):
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        cpus.update(range(int(start), int(end or start) + 1))
+    return sorted(cpus)
+
+
+def read_attribute(path: str | os.PathLike) -> str | None:
+    """Reads a sysfs or procfs attribute.
+
+    Args:
+        path: Path to the attribute.
+
+    Returns:
+        str:
+        Returns the stripped value of the attribute, or None when it can't be read.
+    """
+    try:
+        with open(path) as file:
+            return file.read().strip()
+    except OSError:
+        return None
+
+
+def import_backend(package: str) -> ModuleType:
+    """Imports a component's backend for the host's operating system, on first use.
+
+    Args:
+        package: Qualified name of the component's package.
+
+    Returns:
+        ModuleType:
+        Returns the backend module, so the other operating systems' backends are never imported.
+    """
+    return importlib.import_module(
+        f"{package}.{config.BACKENDS[config.OPERATING_SYSTEM]}"
+    )
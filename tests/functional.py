@@ -1,8 +1,17 @@
+import json
+import os
 import platform
+import socket
+import subprocess
+import sys
+import tempfile
 from typing import NoReturn, Set
 
 import pyarchitecture
 
+# Budget in microseconds for the cumulative import time of pyarchitecture, as reported by -X importtime
+IMPORT_TIME_BUDGET = 50_000
+
 
 def assert_disks(valid_keys: Set[str]) -> None | NoReturn:
     """Assert disks."""
@@ -25,10 +34,216 @@ def assert_memory(valid_keys: Set[str]) -> None | NoReturn:
     assert all(mem_info.values())
 
 
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter that imports pyarchitecture from the same location as the tests."""
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.path.dirname(os.path.dirname(pyarchitecture.__file__)),
+    )
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def assert_import_time(system: str) -> None | NoReturn:
+    """Assert import time stays within budget, and that only the host's backends are ever imported."""
+    timings = []
+    # Best of three, since the first import may have to compile the bytecode
+    for _ in range(3):
+        stderr = run_python("-X", "importtime", "-c", "import pyarchitecture").stderr
+        timings.append(
+            next(
+                int(line.split("|")[1])
+                for line in stderr.splitlines()
+                if line.split("|")[-1].strip() == "pyarchitecture"
+            )
+        )
+    assert (
+        min(timings) < IMPORT_TIME_BUDGET
+    ), f"import pyarchitecture took {min(timings)}us, budget is {IMPORT_TIME_BUDGET}us"
+    code = (
+        "import sys, pyarchitecture\n"
+        "pyarchitecture.cpu.get_cpu_info()\n"
+        "pyarchitecture.disks.get_all_disks()\n"
+        "pyarchitecture.memory.get_memory_info(humanize=False)\n"
+        "print(*sys.modules)"
+    )
+    modules = set(run_python("-c", code).stdout.split())
+    foreign = {
+        f"pyarchitecture.{component}.{backend}"
+        for component in ("disks", "memory")
+        for os_name, backend in pyarchitecture.config.BACKENDS.items()
+        if os_name != system
+    }
+    assert (
+        not modules & foreign
+    ), f"{sorted(modules & foreign)} were imported on {system}"
+
+
+def assert_hotplug() -> None | NoReturn:
+    """Assert the hot-plug watcher applies synthetic uevents to its inventory."""
+    sender, receiver = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    events = []
+    slot = "0000:ff:00.0"
+    with pyarchitecture.hotplug.Watcher(
+        [lambda *event: events.append(event)], sock=receiver
+    ) as watcher:
+        for action in ("add", "remove"):
+            sender.send(
+                pyarchitecture.hotplug.uevent(
+                    action,
+                    f"/devices/pci0000:ff/{slot}",
+                    SUBSYSTEM="pci",
+                    PCI_CLASS="30000",
+                    PCI_ID="10DE:1EB8",
+                    PCI_SLOT_NAME=slot,
+                )
+            )
+            assert watcher.poll(1)
+        # A device that went away while uevents were dropped, is caught by the rescan
+        watcher.gpus[slot] = dict(vendor="NVIDIA Corporation", model="TU104")
+        watcher.rescan()
+        assert slot not in watcher.gpus
+    sender.close()
+    assert [
+        (component, len(added), len(removed)) for component, added, removed in events
+    ] == [
+        ("gpu", 1, 0),
+        ("gpu", 0, 1),
+        ("gpu", 0, 1),
+    ], events
+
+
+def assert_cgroup() -> None | NoReturn:
+    """Assert the cgroup limits and the effective memory, from a fake cgroup filesystem."""
+    gib = 1024**3
+    files = {
+        "cgroup.controllers": "cpu memory",
+        "kubepods/memory.max": str(2 * gib),
+        "kubepods/cpu.max": "max 100000",
+        "kubepods/pod/memory.max": str(4 * gib),
+        "kubepods/pod/memory.current": str(gib),
+        "kubepods/pod/memory.stat": f"anon {gib // 2}\ninactive_file {gib // 4}",
+        "kubepods/pod/cpu.max": "150000 100000",
+        "kubepods/pod/cpu.stat": "usage_usec 10\nnr_periods 4\nnr_throttled 2\nthrottled_usec 5",
+    }
+    with tempfile.TemporaryDirectory() as root:
+        for name, content in files.items():
+            os.makedirs(os.path.dirname(os.path.join(root, name)), exist_ok=True)
+            with open(os.path.join(root, name), "w") as file:
+                file.write(content)
+        with open(os.path.join(root, "self-cgroup"), "w") as file:
+            file.write("0::/kubepods/pod\n")
+        cgroup = pyarchitecture.cgroup.get_cgroup(
+            root, os.path.join(root, "self-cgroup")
+        )
+    # Limit of the parent is lower than the pod's own
+    assert cgroup["memory"]["max"] == 2 * gib, cgroup
+    assert cgroup["cpu"]["limit"] == 1.5, cgroup
+    assert cgroup["cpu"]["nr_throttled"] == 2, cgroup
+    effective = pyarchitecture.cgroup.effective_memory(
+        dict(total=64 * gib, free=0, available=0, used=0), cgroup
+    )
+    assert effective == dict(
+        total=2 * gib, free=gib, available=gib + gib // 4, used=gib - gib // 4
+    ), effective
+
+
+def assert_replay() -> None | NoReturn:
+    """Assert macOS' memory pipeline parses a replayed bundle on any host, without spawning sysctl."""
+    outputs = {
+        "hw.memsize": "17179869184",
+        "hw.pagesize": "16384",
+        "vm.page_free_count": "10000",
+        "vm.page_inactive_count": "20000",
+        "vm.swapusage": "total = 2048.00M  used = 1024.00M  free = 1024.00M  (encrypted)",
+    }
+    commands = {
+        pyarchitecture.runner.bundle_key(["/usr/sbin/sysctl", key]): dict(
+            stdout=f"{key}: {value}\n", stderr="", returncode=0
+        )
+        for key, value in outputs.items()
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        bundle = os.path.join(directory, "sysctl.json")
+        with open(bundle, "w") as file:
+            json.dump(dict(version=1, os="darwin", commands=commands), file)
+        with pyarchitecture.runner.replay(bundle):
+            from pyarchitecture.memory import macOS
+
+            mem_info = macOS.get_memory_info("sysctl")
+    assert mem_info == dict(
+        total=17179869184,
+        free=10000 * 16384,
+        available=30000 * 16384,
+        used=17179869184 - 30000 * 16384,
+        swap_total=2048 * 1024**2,
+        swap_used=1024 * 1024**2,
+        swap_free=1024 * 1024**2,
+    ), mem_info
+
+
+def assert_fleet_buckets() -> None | NoReturn:
+    """Assert disk sizes are bucketed by their marketed size, whether humanized in binary or decimal units."""
+    fleet = pyarchitecture.fleet
+    for terabytes in (1, 2, 3, 4, 6, 8, 10, 12, 14, 16, 18, 20):
+        marketed = terabytes * 10**12
+        for humanized in (
+            pyarchitecture.squire.size_converter(marketed),
+            # lsblk switches to the next unit at 1024, with a single decimal
+            (
+                f"{marketed / 1024**4:.1f}T"
+                if marketed >= 1024**4
+                else f"{marketed / 1024**3:.1f}G"
+            ),
+        ):
+            bucket = fleet.size_bucket(fleet.to_bytes(humanized))
+            assert (
+                bucket == marketed
+            ), f"{humanized} bucketed as {bucket}, not {marketed}"
+        assert fleet.decimal_size(marketed) == f"{terabytes} TB"
+    snapshot = dict(
+        CPU="Intel(R) Xeon(R) Processor",
+        GPU=[dict(model="TU104")],
+        Disks=[dict(size="2.7T")],
+        Memory=dict(total=16 * 1024**3),
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        # Malformed files are counted as errors only, never as hosts
+        for index, payload in enumerate(
+            [snapshot] * 3 + [[snapshot], dict(snapshot, GPU=["TU104"])]
+        ):
+            with open(os.path.join(directory, f"{index}.json"), "w") as file:
+                json.dump(payload, file)
+        result = fleet.aggregate(directory, processes=1)
+    assert (result["hosts"], result["errors"]) == (3, 2), result
+    assert result["gpu_models"] == {"TU104": 3}, result
+    assert result["disk_sizes"] == {3 * 10**12: 3}, result
+
+
+def assert_bench_spawn() -> None | NoReturn:
+    """Assert the benchmark attributes the time spent on child processes to spawn, for command-backed collectors."""
+    bench = pyarchitecture.bench
+    collectors = dict(
+        python=lambda: pyarchitecture.runner.run([sys.executable, "-c", "pass"])
+    )
+    for component, collector in bench._collectors().items():
+        library = pyarchitecture.registry.library(component)
+        # Libraries that are executables are spawned, the rest are read from procfs or sysfs
+        if os.path.isfile(library) and os.access(library, os.X_OK):
+            collectors[component] = collector
+    for name, collector in collectors.items():
+        result = bench.measure(collector, iterations=3, warmup=1)
+        assert result["spawn"]["min"] > 0, f"{name} spawned no child process: {result}"
+        assert (
+            result["spawn"]["max"] <= result["wall"]["max"]
+        ), f"{name} spent longer spawning than in total: {result}"
+
+
 def main() -> None | NoReturn:
     """Main entrypoint."""
     system = platform.system().lower()
-    disk_keys = {"name", "size", "device_id", "mountpoints"}
+    disk_keys = {"name", "size", "size_bytes", "device_id", "mountpoints"}
     memory_keys = {"total", "free", "used", "available"}
     if system == "darwin":
         disk_keys.add("node")
@@ -39,9 +254,16 @@ def main() -> None | NoReturn:
         # Windows doesn't have a distinction between free and available memory
         memory_keys.remove("free")
         memory_keys.update(("virtual_total", "virtual_available"))
+    assert_import_time(system)
     assert_disks(disk_keys)
     assert_cpu()
     assert_memory(memory_keys)
+    assert_replay()
+    assert_fleet_buckets()
+    assert_bench_spawn()
+    if system == "linux":
+        assert_hotplug()
+        assert_cgroup()
 
 
 if __name__ == "__main__":